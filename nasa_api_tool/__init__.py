@@ -6,6 +6,13 @@ A comprehensive Python library for accessing NASA's APIs through a unified inter
 
 from .exceptions import NASAAPIError
 from .client import NASAClient
+from .async_client import AsyncNASAClient
+from .cache import ResponseCache, ResponseStore
+from .range_cache import RangeCache
+from .rate_limiter import RateLimit, RateLimiter
+from .retry import RetryPolicy
+from .spatial_cache import SpatialCache
 
 __version__ = "0.1.0"
-__all__ = ["NASAClient", "NASAAPIError"]
+__all__ = ["NASAClient", "AsyncNASAClient", "NASAAPIError", "ResponseCache", "ResponseStore",
+           "RangeCache", "RateLimit", "RateLimiter", "RetryPolicy", "SpatialCache"]
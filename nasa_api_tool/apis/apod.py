@@ -4,8 +4,137 @@ APOD (Astronomy Picture of the Day) API Module
 This module provides access to NASA's APOD API.
 """
 
+import threading
+from datetime import datetime, timedelta
+
+from ..concurrency import prefetch_ordered
+from ..state import load_state, save_state
 from .base import APIModule
 
+# Date of the first Astronomy Picture of the Day.
+FIRST_APOD_DATE = "1995-06-16"
+
+class APODMirror:
+    """
+    Local copy of the APOD archive, indexed by date.
+    
+    The mirror is a JSON file that holds every entry keyed by its date,
+    together with the last date that has been synced. The file is loaded
+    into a dict, so lookups by date never touch the API.
+    
+    sync() fetches the days after the last synced date in bounded ranges,
+    several at a time, and saves the file. The first sync downloads the
+    whole archive. Later syncs only fetch the days published since.
+    
+    Attributes:
+        path (str): Path to the mirror file.
+        synced_through (str): Last date (YYYY-MM-DD) that has been synced, or None.
+    """
+    
+    def __init__(self, module, path):
+        """
+        Open a mirror, loading the entries stored so far.
+        
+        Args:
+            module (APODModule): The module used to fetch entries.
+            path (str): Path to the mirror file. Created by the first sync.
+        """
+        self.path = path
+        self._module = module
+        state = load_state(path, {"synced_through": None, "entries": {}})
+        self.synced_through = state.get("synced_through")
+        self._entries = state.get("entries", {})
+        self._lock = threading.Lock()
+    
+    def get(self, date):
+        """
+        Get the entry for a date from the mirror.
+        
+        Args:
+            date (str): The date (YYYY-MM-DD).
+            
+        Returns:
+            dict: The APOD entry, or None if there is none for that date.
+        """
+        return self._entries.get(date)
+    
+    def __getitem__(self, date):
+        return self._entries[date]
+    
+    def __contains__(self, date):
+        return date in self._entries
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def dates(self):
+        """
+        Get the dates that have an entry.
+        
+        Returns:
+            list: The dates (YYYY-MM-DD), oldest first.
+        """
+        return sorted(self._entries)
+    
+    def sync(self, chunk_days=31, max_workers=4, end_date=None):
+        """
+        Fetch the entries published since the last sync.
+        
+        The missing days are split into ranges of chunk_days, which are
+        fetched max_workers at a time and applied in date order. If a range
+        fails, the ranges before it are still saved, and the next sync
+        resumes from there.
+        
+        Args:
+            chunk_days (int, optional): Days requested per API call. Default is 31.
+            max_workers (int, optional): Number of ranges fetched at once. Default is 4.
+            end_date (str, optional): Last date to sync (YYYY-MM-DD). Default is
+                the current date in US Eastern time, when new entries appear.
+                
+        Returns:
+            int: Number of entries added or updated.
+            
+        Raises:
+            NASAAPIError: If a request fails or returns an error.
+        """
+        with self._lock:
+            if self.synced_through is not None:
+                start = datetime.strptime(self.synced_through, "%Y-%m-%d").date() + timedelta(days=1)
+            else:
+                start = datetime.strptime(FIRST_APOD_DATE, "%Y-%m-%d").date()
+            if end_date is not None:
+                end = datetime.strptime(end_date, "%Y-%m-%d").date()
+            else:
+                # APOD publishes at midnight US Eastern time (UTC-5 in winter)
+                end = (datetime.utcnow() - timedelta(hours=5)).date()
+            
+            chunks = []
+            chunk_start = start
+            while chunk_start <= end:
+                chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
+                chunks.append((chunk_start.isoformat(), chunk_end.isoformat()))
+                chunk_start = chunk_end + timedelta(days=1)
+            
+            updated = 0
+            synced = 0
+            try:
+                for (_, chunk_end), entries in prefetch_ordered(
+                    lambda chunk: self._module._fetch_range(*chunk), chunks, max_workers
+                ):
+                    for entry in entries:
+                        self._entries[entry["date"]] = entry
+                    updated += len(entries)
+                    synced += 1
+                    if chunk_end == chunks[-1][1]:
+                        # The last days may not be published yet, so only count
+                        # the range as synced through the latest entry returned
+                        chunk_end = max((entry["date"] for entry in entries), default=self.synced_through)
+                    self.synced_through = chunk_end
+            finally:
+                if synced:
+                    save_state(self.path, {"synced_through": self.synced_through, "entries": self._entries})
+            return updated
+
 class APODModule(APIModule):
     """
     Module for accessing NASA's Astronomy Picture of the Day API.
@@ -57,4 +186,38 @@ class APODModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
+        if start_date is not None and date is None and count is None:
+            return self._get_date_range(
+                self._build_url("apod"), params, "start_date", "end_date",
+                lambda items: ([(item.get("date", ""), item) for item in items], None),
+                lambda items, meta: items
+            )
         return self.request_handler.get(self._build_url("apod"), params)
+    
+    def mirror(self, path):
+        """
+        Open a local mirror of the APOD archive.
+        
+        Call sync() on the mirror to fetch the entries it is missing.
+        
+        Args:
+            path (str): Path to the mirror's JSON file.
+            
+        Returns:
+            APODMirror: The mirror.
+            
+        Raises:
+            TypeError: If the request handler is asynchronous.
+        """
+        self._require_blocking_handler()
+        return APODMirror(self, path)
+    
+    def _fetch_range(self, start_date, end_date):
+        """
+        Fetch a date range directly, bypassing the range cache.
+        
+        Returns:
+            list: The APOD entries of the range.
+        """
+        params = {"start_date": start_date, "end_date": end_date}
+        return self.request_handler.get(self._build_url("apod"), params) or []
@@ -4,8 +4,73 @@ Asteroids NeoWs (Near Earth Object Web Service) API Module
 This module provides access to NASA's Asteroids NeoWs API.
 """
 
+from datetime import datetime, timedelta
+
+from ..concurrency import prefetch_ordered
 from .base import APIModule
 
+# Longest date range the feed endpoint accepts, in days.
+FEED_MAX_DAYS = 7
+
+class NEOBrowseIterator:
+    """
+    Iterator over every near-Earth object in the NeoWs browse endpoint.
+    
+    The first page is fetched when iteration starts and its
+    page.total_pages value decides how many pages follow. Later pages are
+    fetched in the background, a few pages ahead of the consumer.
+    
+    The page attribute is a resume cursor. It is the first page that has
+    not been completely yielded. After a crash, pass it as start_page to
+    AsteroidsModule.iter_browse() to continue. Objects from a partly
+    consumed page are yielded again.
+    
+    Attributes:
+        page (int): The resume cursor (zero-based page number).
+        total_pages (int): Total number of pages, known once iteration has started.
+    """
+    
+    def __init__(self, module, start_page=0, size=None, prefetch=2):
+        """
+        Initialize the iterator.
+        
+        Args:
+            module (AsteroidsModule): The module used to fetch pages.
+            start_page (int, optional): Zero-based page to start from. Default is 0.
+            size (int, optional): Number of objects per page.
+            prefetch (int, optional): Number of pages fetched ahead. Default is 2.
+        """
+        self.page = start_page
+        self.total_pages = None
+        self._module = module
+        self._size = size
+        self._prefetch = prefetch
+        self._objects = self._iterate()
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        return next(self._objects)
+    
+    def close(self):
+        """Stop iterating and cancel any pages that are still queued."""
+        self._objects.close()
+    
+    def _fetch(self, page):
+        return self._module.get_browse(page=page, size=self._size)
+    
+    def _iterate(self):
+        first = self._fetch(self.page)
+        self.total_pages = first.get("page", {}).get("total_pages", 0)
+        yield from first.get("near_earth_objects", [])
+        self.page += 1
+        
+        pages = range(self.page, self.total_pages)
+        for page, data in prefetch_ordered(self._fetch, pages, self._prefetch):
+            yield from data.get("near_earth_objects", [])
+            self.page = page + 1
+
 class AsteroidsModule(APIModule):
     """
     Module for accessing NASA's Asteroids NeoWs API.
@@ -46,7 +111,105 @@ class AsteroidsModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("feed"), params)
+        return self._get_date_range(
+            self._build_url("feed"), params, "start_date", "end_date",
+            lambda feed: ([
+                (date, (date, neo))
+                for date, objects in feed.get("near_earth_objects", {}).items()
+                for neo in objects
+            ], None),
+            self._build_feed,
+            max_days=FEED_MAX_DAYS
+        )
+    
+    @staticmethod
+    def _build_feed(objects, meta):
+        """
+        Build a feed response from range-cached (date, object) records.
+        
+        Returns:
+            dict: A feed with "element_count" and "near_earth_objects" keyed by date.
+        """
+        near_earth_objects = {}
+        for date, neo in objects:
+            near_earth_objects.setdefault(date, []).append(neo)
+        return {"element_count": len(objects), "near_earth_objects": near_earth_objects}
+    
+    def iter_browse(self, start_page=0, size=None, prefetch=2):
+        """
+        Iterate over the whole near-Earth object catalogue.
+        
+        Args:
+            start_page (int, optional): Zero-based page to start from, e.g. the
+                page cursor of an interrupted iterator. Default is 0.
+            size (int, optional): Number of objects per page.
+            prefetch (int, optional): Number of pages fetched ahead in the
+                background. Default is 2.
+                
+        Returns:
+            NEOBrowseIterator: An iterator that yields individual NEO objects and
+                exposes a resumable page cursor.
+                
+        Raises:
+            NASAAPIError: If a request fails or returns an error.
+        """
+        self._require_blocking_handler()
+        return NEOBrowseIterator(self, start_page=start_page, size=size, prefetch=prefetch)
+    
+    def get_feed_range(self, start_date, end_date, max_workers=None):
+        """
+        Get close-approach data for a date range of any length.
+        
+        The range is split into 7-day windows that are fetched concurrently
+        and merged into a single feed.
+        
+        Args:
+            start_date (str): Starting date for asteroid search (YYYY-MM-DD).
+            end_date (str): Ending date for asteroid search (YYYY-MM-DD), inclusive.
+            max_workers (int, optional): Maximum number of windows fetched at once.
+                Default is the request handler's pool_maxsize.
+                
+        Returns:
+            dict: A feed with "element_count" and "near_earth_objects" keyed by
+                date, in date order. Objects are deduplicated by date and ID.
+                
+        Raises:
+            ValueError: If the dates are malformed or end_date is before start_date.
+            NASAAPIError: If any request fails or returns an error.
+        """
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        if end < start:
+            raise ValueError("end_date must not be before start_date")
+        
+        windows = []
+        window_start = start
+        while window_start <= end:
+            window_end = min(window_start + timedelta(days=FEED_MAX_DAYS - 1), end)
+            windows.append((window_start.isoformat(), window_end.isoformat()))
+            window_start = window_end + timedelta(days=1)
+        
+        feeds = self._map_concurrently(lambda window: self.get_feed(*window), windows, max_workers)
+        
+        # Compare against normalized dates; the arguments need not be zero-padded
+        first, last = start.isoformat(), end.isoformat()
+        near_earth_objects = {}
+        seen = set()
+        for feed in feeds:
+            for date, objects in feed.get("near_earth_objects", {}).items():
+                if not first <= date <= last:
+                    continue
+                merged = near_earth_objects.setdefault(date, [])
+                for neo in objects:
+                    key = (date, neo.get("id"))
+                    if key not in seen:
+                        seen.add(key)
+                        merged.append(neo)
+        
+        return {
+            "element_count": len(seen),
+            "near_earth_objects": {date: near_earth_objects[date] for date in sorted(near_earth_objects)},
+        }
     
     def get_lookup(self, asteroid_id):
         """
@@ -4,6 +4,12 @@ Base API module for NASA APIs.
 This module provides a base class for all NASA API modules.
 """
 
+import inspect
+from datetime import timedelta
+
+from ..concurrency import default_max_workers, map_concurrently
+from ..range_cache import parse_day
+
 class APIModule:
     """
     Base class for all NASA API modules.
@@ -21,6 +27,8 @@ class APIModule:
         """
         self.request_handler = request_handler
         self.base_url = "https://api.nasa.gov/"
+        # Optional RangeCache for date-ranged endpoints, set by NASAClient
+        self.range_cache = None
     
     def _build_url(self, endpoint):
         """
@@ -33,3 +41,96 @@ class APIModule:
             str: The full URL.
         """
         return f"{self.base_url}{endpoint}"
+    
+    def _map_concurrently(self, func, items, max_workers=None):
+        """
+        Apply a function to every item on a bounded thread pool.
+        
+        Used by the bulk helpers that fan out many requests. These helpers
+        need a blocking request handler; with AsyncNASAClient, gather the
+        individual awaitable calls instead.
+        
+        Args:
+            func (callable): Function taking one item.
+            items (iterable): Items to process.
+            max_workers (int, optional): Maximum number of calls in flight.
+                Default is the request handler's pool_maxsize.
+                
+        Returns:
+            list: One result per item, in the order of items.
+            
+        Raises:
+            TypeError: If the request handler is asynchronous.
+        """
+        self._require_blocking_handler()
+        if max_workers is None:
+            max_workers = default_max_workers(self.request_handler)
+        return map_concurrently(func, items, max_workers)
+    
+    def _get_date_range(self, url, params, start_key, end_key, split, build,
+                        max_days=None, exclusive_end=False):
+        """
+        Make a date-ranged GET request through the range cache.
+        
+        The request is sent unchanged if there is no range cache, the
+        request handler is asynchronous, or either date is missing or not a
+        YYYY-MM-DD date.
+        
+        Args:
+            url (str): The URL to request.
+            params (dict): Query parameters, including the two dates.
+            start_key (str): Name of the start date parameter.
+            end_key (str): Name of the end date parameter.
+            split (callable): Splits a response into a list of (day, record)
+                pairs and metadata (or None).
+            build (callable): Builds a response from a list of records and
+                the metadata.
+            max_days (int, optional): Longest range the endpoint accepts.
+                Longer gaps are fetched in several requests.
+            exclusive_end (bool, optional): Whether the endpoint excludes the
+                end date (it means midnight at the start of that day).
+                
+        Returns:
+            The response, built from cached and fetched records.
+        """
+        start, end = parse_day(params.get(start_key)), parse_day(params.get(end_key))
+        if (self.range_cache is None or start is None or end is None
+                or inspect.iscoroutinefunction(self.request_handler.get)):
+            return self.request_handler.get(url, params)
+        if exclusive_end:
+            end -= timedelta(days=1)
+        if end < start:
+            return self.request_handler.get(url, params)
+        
+        def fetch(gap_start, gap_end):
+            pairs = []
+            meta = None
+            window_start = gap_start
+            while window_start <= gap_end:
+                window_end = gap_end
+                if max_days is not None:
+                    window_end = min(window_start + timedelta(days=max_days - 1), gap_end)
+                window = dict(params)
+                window[start_key] = window_start.isoformat()
+                window[end_key] = (window_end + timedelta(days=1) if exclusive_end else window_end).isoformat()
+                window_pairs, meta = split(self.request_handler.get(url, window))
+                pairs.extend(window_pairs)
+                window_start = window_end + timedelta(days=1)
+            return pairs, meta
+        
+        key = (url, tuple(sorted((k, str(v)) for k, v in params.items() if k not in (start_key, end_key))))
+        records, meta = self.range_cache.get_range(key, start, end, fetch)
+        return build(records, meta)
+    
+    def _require_blocking_handler(self):
+        """
+        Make sure the request handler returns results rather than awaitables.
+        
+        Raises:
+            TypeError: If the request handler is asynchronous.
+        """
+        if inspect.iscoroutinefunction(self.request_handler.get):
+            raise TypeError(
+                f"{type(self).__name__} bulk helpers require NASAClient; "
+                "with AsyncNASAClient, gather the individual calls instead"
+            )
@@ -4,8 +4,146 @@ DONKI (Space Weather Database Of Notifications, Knowledge, Information) API Modu
 This module provides access to NASA's DONKI API.
 """
 
+import hashlib
+import json
+from collections import deque
+from datetime import datetime, timedelta
+
+from ..state import load_state, save_state
 from .base import APIModule
 
+# Event types fetched by DONKIModule.get_all() and sync():
+# (type, getter, ID field, event time field).
+EVENT_TYPES = (
+    ("CME", "get_coronal_mass_ejection", "activityID", "startTime"),
+    ("GST", "get_geomagnetic_storm", "gstID", "startTime"),
+    ("IPS", "get_interplanetary_shock", "activityID", "eventTime"),
+    ("FLR", "get_solar_flare", "flrID", "beginTime"),
+    ("SEP", "get_solar_energetic_particle", "sepID", "eventTime"),
+    ("MPC", "get_magnetopause_crossing", "mpcID", "eventTime"),
+    ("RBE", "get_radiation_belt_enhancement", "rbeID", "eventTime"),
+    ("HSS", "get_hss", "hssID", "eventTime"),
+    ("WSAEnlilSimulations", "get_wsa_enlil_simulation", "simulationID", "modelCompletionTime"),
+    ("notifications", "get_notifications", "messageID", "messageIssueTime"),
+)
+
+# Event time field of each endpoint, used to file events by day in a range cache.
+_EVENT_TIME_FIELDS = dict((event_type, time_field) for event_type, _, _, time_field in EVENT_TYPES)
+_EVENT_TIME_FIELDS["CMEAnalysis"] = "time21_5"
+
+class DONKISnapshot:
+    """
+    All DONKI events of a date window, indexed by activity ID.
+    
+    Events are grouped by type and indexed by their ID field. Links from
+    each event's linkedEvents list are indexed in both directions, so a
+    CME can be followed to the storms and shocks it caused, and a storm
+    back to its CME, without scanning the event lists.
+    
+    Attributes:
+        start_date (str): Start of the window, if given.
+        end_date (str): End of the window, if given.
+        events (dict): Mapping of event types (see EVENT_TYPES) to event lists.
+    """
+    
+    def __init__(self, events, start_date=None, end_date=None):
+        """
+        Build the indexes for a set of events.
+        
+        Args:
+            events (dict): Mapping of event types to event lists.
+            start_date (str, optional): Start of the window.
+            end_date (str, optional): End of the window.
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self.events = events
+        self._by_id = {}
+        self._types = {}
+        self._links = {}
+        
+        id_fields = {event_type: id_field for event_type, _, id_field, _ in EVENT_TYPES}
+        for event_type, items in events.items():
+            id_field = id_fields.get(event_type, "activityID")
+            for event in items:
+                activity_id = event.get(id_field)
+                if activity_id is None:
+                    continue
+                self._by_id[activity_id] = event
+                self._types[activity_id] = event_type
+                for link in event.get("linkedEvents") or ():
+                    linked_id = link.get("activityID")
+                    if linked_id is not None and linked_id != activity_id:
+                        self._links.setdefault(activity_id, []).append(linked_id)
+                        self._links.setdefault(linked_id, []).append(activity_id)
+    
+    def __getitem__(self, event_type):
+        return self.events[event_type]
+    
+    def __contains__(self, activity_id):
+        return activity_id in self._by_id
+    
+    def get(self, activity_id):
+        """
+        Get an event by its activity ID.
+        
+        Args:
+            activity_id (str): The event's ID, e.g. "2023-01-01T12:00:00-CME-001".
+            
+        Returns:
+            dict: The event, or None if it is not in the snapshot.
+        """
+        return self._by_id.get(activity_id)
+    
+    def event_type(self, activity_id):
+        """
+        Get the type of an event.
+        
+        Args:
+            activity_id (str): The event's ID.
+            
+        Returns:
+            str: The event type (see EVENT_TYPES), or None if it is not in the snapshot.
+        """
+        return self._types.get(activity_id)
+    
+    def linked(self, activity_id):
+        """
+        Get the IDs of the events directly linked to or from an event.
+        
+        Linked events outside the snapshot's window are included, although
+        get() cannot return them.
+        
+        Args:
+            activity_id (str): The event's ID.
+            
+        Returns:
+            list: Linked activity IDs, without duplicates.
+        """
+        return list(dict.fromkeys(self._links.get(activity_id, ())))
+    
+    def chain(self, activity_id):
+        """
+        Walk every event connected to an event through linkedEvents.
+        
+        Args:
+            activity_id (str): The event's ID.
+            
+        Returns:
+            list: Activity IDs in breadth-first order, starting with activity_id.
+        """
+        seen = {activity_id}
+        order = []
+        queue = deque([activity_id])
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for linked_id in self.linked(current):
+                if linked_id not in seen:
+                    seen.add(linked_id)
+                    queue.append(linked_id)
+        return order
+
 class DONKIModule(APIModule):
     """
     Module for accessing NASA's DONKI API.
@@ -23,6 +161,25 @@ class DONKIModule(APIModule):
         super().__init__(request_handler)
         self.base_url = "https://api.nasa.gov/DONKI/"
     
+    def _get_events(self, endpoint, params):
+        """
+        Get the events of an endpoint, through the range cache if one is set.
+        
+        Args:
+            endpoint (str): The DONKI endpoint, e.g. "CME".
+            params (dict): Query parameters.
+            
+        Returns:
+            list: The events.
+        """
+        time_field = _EVENT_TIME_FIELDS[endpoint]
+        return self._get_date_range(
+            self._build_url(endpoint), params, "startDate", "endDate",
+            lambda events: ([(event.get(time_field) or "", event) for event in events or []], None),
+            lambda events, meta: events,
+            max_days=30 if endpoint == "notifications" else None
+        )
+    
     def get_coronal_mass_ejection(self, start_date=None, end_date=None):
         """
         Get coronal mass ejection (CME) data.
@@ -46,7 +203,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("CME"), params)
+        return self._get_events("CME", params)
     
     def get_coronal_mass_ejection_analysis(self, start_date=None, end_date=None, most_accurate_only=None, speed=None, half_angle=None, catalog=None):
         """
@@ -79,7 +236,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("CMEAnalysis"), params)
+        return self._get_events("CMEAnalysis", params)
     
     def get_geomagnetic_storm(self, start_date=None, end_date=None):
         """
@@ -104,7 +261,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("GST"), params)
+        return self._get_events("GST", params)
     
     def get_interplanetary_shock(self, start_date=None, end_date=None, location=None, catalog=None):
         """
@@ -133,7 +290,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("IPS"), params)
+        return self._get_events("IPS", params)
     
     def get_solar_flare(self, start_date=None, end_date=None):
         """
@@ -158,7 +315,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("FLR"), params)
+        return self._get_events("FLR", params)
     
     def get_solar_energetic_particle(self, start_date=None, end_date=None):
         """
@@ -183,7 +340,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("SEP"), params)
+        return self._get_events("SEP", params)
     
     def get_magnetopause_crossing(self, start_date=None, end_date=None):
         """
@@ -208,7 +365,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("MPC"), params)
+        return self._get_events("MPC", params)
     
     def get_radiation_belt_enhancement(self, start_date=None, end_date=None):
         """
@@ -233,7 +390,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("RBE"), params)
+        return self._get_events("RBE", params)
     
     def get_hss(self, start_date=None, end_date=None):
         """
@@ -258,7 +415,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("HSS"), params)
+        return self._get_events("HSS", params)
     
     def get_wsa_enlil_simulation(self, start_date=None, end_date=None):
         """
@@ -283,7 +440,7 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("WSAEnlilSimulations"), params)
+        return self._get_events("WSAEnlilSimulations", params)
     
     def get_notifications(self, start_date=None, end_date=None, type=None):
         """
@@ -310,4 +467,128 @@ class DONKIModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("notifications"), params)
+        return self._get_events("notifications", params)
+    
+    def get_all(self, start_date=None, end_date=None, max_workers=None):
+        """
+        Get every DONKI event type for a date window in one call.
+        
+        The ten event types in EVENT_TYPES are fetched concurrently.
+        
+        Args:
+            start_date (str, optional): Start date for search (YYYY-MM-DD).
+                Default is 30 days prior to current UTC date.
+            end_date (str, optional): End date for search (YYYY-MM-DD).
+                Default is current UTC date.
+            max_workers (int, optional): Maximum number of requests at once.
+                Default is the request handler's pool_maxsize.
+                
+        Returns:
+            DONKISnapshot: The events keyed by type, with an index over their
+                activity IDs and linkedEvents.
+                
+        Raises:
+            NASAAPIError: If any request fails or returns an error.
+        """
+        results = self._map_concurrently(
+            lambda getter: getattr(self, getter)(start_date, end_date),
+            [getter for _, getter, _, _ in EVENT_TYPES],
+            max_workers
+        )
+        events = {event_type: result or [] for (event_type, _, _, _), result in zip(EVENT_TYPES, results)}
+        return DONKISnapshot(events, start_date, end_date)
+    
+    def sync(self, state_path, event_types=None, lookback_days=30, overlap_days=3, max_workers=None):
+        """
+        Fetch only the DONKI events that are new or changed since the last sync.
+        
+        The state file keeps a high-water mark for each event type, which
+        is the latest event time seen so far. Each sync asks only for the
+        window from that mark, minus overlap_days, to today. The overlap
+        catches events that are submitted late or revised, for example
+        when linkedEvents are added. A hash of every event in the window is
+        kept so that unchanged events are not yielded again. Hashes older
+        than the window are dropped. The window is always requested from
+        the API, even if a range cache is set.
+        
+        The state of an event type is saved once the consumer has taken all
+        of its events. If processing is interrupted, that type's events are
+        yielded again on the next sync.
+        
+        Args:
+            state_path (str): Path to the JSON state file. Created on first sync.
+            event_types (list, optional): Event types to sync (see EVENT_TYPES).
+                Default is all ten.
+            lookback_days (int, optional): Days fetched for a type that has not
+                been synced before. Default is 30.
+            overlap_days (int, optional): Days before the high-water mark that
+                are fetched again. Default is 3.
+            max_workers (int, optional): Maximum number of requests at once.
+                Default is the request handler's pool_maxsize.
+                
+        Returns:
+            generator: (event_type, event, change) tuples, where change is
+                "new" or "changed".
+                
+        Raises:
+            ValueError: If an event type is unknown.
+            NASAAPIError: If a request fails or returns an error.
+        """
+        types = {entry[0]: entry for entry in EVENT_TYPES}
+        if event_types is None:
+            event_types = list(types)
+        for event_type in event_types:
+            if event_type not in types:
+                raise ValueError(f"Unknown DONKI event type: {event_type}")
+        
+        state = load_state(state_path, {"types": {}})
+        today = datetime.utcnow().date()
+        windows = []
+        for event_type in event_types:
+            mark = state["types"].get(event_type, {}).get("mark")
+            if mark:
+                start = datetime.strptime(mark[:10], "%Y-%m-%d").date() - timedelta(days=overlap_days)
+            else:
+                start = today - timedelta(days=lookback_days)
+            windows.append((event_type, min(start, today).isoformat()))
+        
+        def fetch(window):
+            # Bypass the range cache, which would serve the overlap from
+            # memory and hide the revisions the overlap is meant to catch
+            event_type, start_date = window
+            params = {"startDate": start_date, "endDate": today.isoformat()}
+            return self.request_handler.get(self._build_url(event_type), params)
+        
+        results = self._map_concurrently(fetch, windows, max_workers)
+        
+        def changes():
+            for (event_type, start_date), events in zip(windows, results):
+                _, _, id_field, time_field = types[event_type]
+                type_state = state["types"].setdefault(event_type, {"mark": None, "hashes": {}})
+                hashes = type_state["hashes"]
+                mark = type_state["mark"]
+                seen = {}
+                for event in events or []:
+                    activity_id = event.get(id_field)
+                    event_time = event.get(time_field) or ""
+                    if activity_id is None:
+                        continue
+                    digest = hashlib.sha1(json.dumps(event, sort_keys=True).encode("utf-8")).hexdigest()
+                    seen[activity_id] = [event_time, digest]
+                    if mark is None or event_time > mark:
+                        mark = event_time
+                    previous = hashes.get(activity_id)
+                    if previous is None:
+                        yield event_type, event, "new"
+                    elif previous[1] != digest:
+                        yield event_type, event, "changed"
+                
+                # Keep hashes only for events that later windows can return again
+                for activity_id, (event_time, digest) in hashes.items():
+                    if activity_id not in seen and event_time[:10] >= start_date:
+                        seen[activity_id] = [event_time, digest]
+                type_state["hashes"] = seen
+                type_state["mark"] = mark
+                save_state(state_path, state)
+        
+        return changes()
@@ -4,8 +4,131 @@ Earth API Module
 This module provides access to NASA's Earth API.
 """
 
+import inspect
+import math
+import os
+
+from ..exceptions import NASAAPIError
+from ..spatial_cache import geohash_center
 from .base import APIModule
 
+class TileGrid:
+    """
+    A rectangular grid of Earth imagery tiles.
+    
+    Tiles lie on a global lattice of tile_size degree cells, so grids with
+    the same tile size always share tile boundaries. Row 0 is the northern
+    edge and column 0 the western edge, which is the order in which tiles
+    are pasted into a mosaic.
+    
+    Each tile is a dict with "row", "col", "lat" and "lon" (the tile
+    center), "assets" (the get_assets() result), "imagery" (the image as
+    bytes, or the path of the image file if the grid was downloaded to a
+    directory), and "assets_error" and "imagery_error" (the error message
+    if that request failed). Values that were not requested or failed
+    are None.
+    
+    Attributes:
+        tile_size (float): Width and height of each tile in degrees.
+        date (str): The requested imagery date, if any.
+        cloud_score (bool): Whether cloud scores were requested.
+        rows (int): Number of tile rows.
+        cols (int): Number of tile columns.
+        north (float): Latitude of the grid's northern edge.
+        west (float): Longitude of the grid's western edge.
+    """
+    
+    def __init__(self, tile_size, first_row, first_col, rows, cols, date=None, cloud_score=False):
+        """
+        Initialize an empty grid.
+        
+        Args:
+            tile_size (float): Width and height of each tile in degrees.
+            first_row (int): Lattice index of the northernmost row.
+            first_col (int): Lattice index of the westernmost column.
+            rows (int): Number of tile rows.
+            cols (int): Number of tile columns.
+            date (str, optional): The requested imagery date.
+            cloud_score (bool, optional): Whether cloud scores were requested.
+        """
+        self.tile_size = tile_size
+        self.date = date
+        self.cloud_score = cloud_score
+        self.rows = rows
+        self.cols = cols
+        self.north = round((first_row + 1) * tile_size, 6)
+        self.west = round(first_col * tile_size, 6)
+        self._first_row = first_row
+        self._first_col = first_col
+        self._tiles = {}
+    
+    def __getitem__(self, position):
+        row, col = position
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"Tile ({row}, {col}) is outside the {self.rows}x{self.cols} grid")
+        return self._tiles[(row, col)]
+    
+    def __iter__(self):
+        """Iterate over the tiles row by row, from the north-west corner."""
+        for row in range(self.rows):
+            for col in range(self.cols):
+                yield self._tiles[(row, col)]
+    
+    def __len__(self):
+        return self.rows * self.cols
+    
+    def tile_at(self, lat, lon):
+        """
+        Get the tile that contains a location.
+        
+        Args:
+            lat (float): Latitude of the location.
+            lon (float): Longitude of the location.
+            
+        Returns:
+            dict: The tile, or None if the location is outside the grid.
+        """
+        row = self._first_row - math.floor(lat / self.tile_size)
+        col = math.floor(lon / self.tile_size) - self._first_col
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self._tiles[(row, col)]
+        return None
+    
+    def to_rows(self):
+        """
+        Get the tiles as a list of rows for mosaicking.
+        
+        Returns:
+            list: One list of tiles per row, north to south, each west to east.
+        """
+        return [[self._tiles[(row, col)] for col in range(self.cols)] for row in range(self.rows)]
+    
+    def failed(self):
+        """
+        Get the tiles whose requests failed.
+        
+        Returns:
+            list: Tiles with an assets or imagery error, in grid order.
+        """
+        return [tile for tile in self if tile["assets_error"] is not None or tile["imagery_error"] is not None]
+    
+    def _lattice(self, row, col):
+        return (self._first_row - row, self._first_col + col)
+    
+    def _reusable_tile(self, lattice, date, cloud_score):
+        """
+        Get the tile at a lattice position if it was fetched with the same parameters.
+        
+        Only its successfully fetched values should be reused; failed ones are None.
+        
+        Returns:
+            dict: The tile, or None if this grid has no matching tile.
+        """
+        if (self.date, self.cloud_score) != (date, cloud_score):
+            return None
+        row, col = self._first_row - lattice[0], lattice[1] - self._first_col
+        return self._tiles.get((row, col))
+
 class EarthModule(APIModule):
     """
     Module for accessing NASA's Earth API.
@@ -22,6 +145,8 @@ class EarthModule(APIModule):
         """
         super().__init__(request_handler)
         self.base_url = "https://api.nasa.gov/planetary/"
+        # Optional SpatialCache for get_assets(), set by the user
+        self.spatial_cache = None
     
     def get_imagery(self, lat, lon, date=None, dim=0.025, cloud_score=False):
         """
@@ -59,6 +184,10 @@ class EarthModule(APIModule):
         """
         Get a list of available imagery for the specified location and date.
         
+        If spatial_cache is set, the location is snapped to the center of its
+        cache cell, and nearby locations with the same date and dim are
+        answered from one cached response.
+        
         Args:
             lat (float): Latitude of the location.
             lon (float): Longitude of the location.
@@ -73,6 +202,16 @@ class EarthModule(APIModule):
         Raises:
             NASAAPIError: If the request fails or returns an error.
         """
+        cache = self.spatial_cache
+        if cache is not None:
+            cell = cache.cell(lat, lon)
+            hit, value = cache.get(cell, date, dim)
+            if hit:
+                if inspect.iscoroutinefunction(self.request_handler.get):
+                    return self._resolved(value)
+                return value
+            lat, lon = geohash_center(cell)
+        
         params = {
             "lat": lat,
             "lon": lon,
@@ -82,4 +221,141 @@ class EarthModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.request_handler.get(self._build_url("earth/assets"), params)
+        result = self.request_handler.get(self._build_url("earth/assets"), params)
+        if cache is None:
+            return result
+        if inspect.isawaitable(result):
+            return self._cache_when_done(result, cache, cell, date, dim)
+        cache.set(cell, result, date, dim)
+        return result
+    
+    @staticmethod
+    async def _resolved(value):
+        """
+        Wrap a cached value in an awaitable for asynchronous handlers.
+        
+        Returns:
+            dict: The value.
+        """
+        return value
+    
+    @staticmethod
+    async def _cache_when_done(result, cache, cell, date, dim):
+        """
+        Await an asynchronous response and store it in the spatial cache.
+        
+        Returns:
+            dict: The response.
+        """
+        value = await result
+        cache.set(cell, value, date, dim)
+        return value
+    
+    def get_tile_grid(self, min_lat, min_lon, max_lat, max_lon, tile_size=0.025, date=None,
+                      cloud_score=False, assets=True, imagery=True, previous=None, max_workers=None,
+                      directory=None):
+        """
+        Get imagery and asset data for every tile covering a bounding box.
+        
+        The box is snapped outwards to a global lattice of tile_size degree
+        tiles, and the tiles are fetched concurrently. A failed request does
+        not stop the others; its error is recorded on the tile, separately
+        for assets and imagery.
+        
+        Args:
+            min_lat (float): Southern edge of the box.
+            min_lon (float): Western edge of the box.
+            max_lat (float): Northern edge of the box.
+            max_lon (float): Eastern edge of the box.
+            tile_size (float, optional): Width and height of each tile in degrees,
+                passed to the API as dim. Default is 0.025.
+            date (str, optional): Date of the imagery (YYYY-MM-DD).
+                Default is most recent date.
+            cloud_score (bool, optional): Calculate the percentage of each image
+                covered by clouds. Default is False.
+            assets (bool, optional): Fetch get_assets() for each tile. Default is True.
+            imagery (bool, optional): Fetch the image of each tile. Default is True.
+            previous (TileGrid, optional): A grid fetched earlier with the same tile
+                size. The assets and images it fetched successfully for tiles
+                inside the new grid are reused instead of being fetched again.
+            max_workers (int, optional): Maximum number of requests at once.
+                Default is the request handler's pool_maxsize.
+            directory (str, optional): Stream the images to files in this
+                directory instead of keeping them in memory. Files are named
+                by lattice position, date and tile size, so images already on
+                disk are not downloaded again.
+                
+        Returns:
+            TileGrid: The tiles, addressable by (row, col) from the north-west corner.
+                
+        Raises:
+            ValueError: If the box or tile size is invalid.
+            TypeError: If the request handler is asynchronous.
+        """
+        if tile_size <= 0:
+            raise ValueError("tile_size must be positive")
+        if max_lat <= min_lat or max_lon <= min_lon:
+            raise ValueError("The bounding box must have max_lat > min_lat and max_lon > min_lon")
+        
+        # Snap outwards to the lattice; the epsilon keeps edges that fall
+        # on a tile boundary (up to rounding) from adding an extra row or column
+        epsilon = 1e-9
+        north = math.floor(max_lat / tile_size - epsilon)
+        south = math.floor(min_lat / tile_size + epsilon)
+        west = math.floor(min_lon / tile_size + epsilon)
+        east = math.floor(max_lon / tile_size - epsilon)
+        grid = TileGrid(tile_size, north, west, north - south + 1, east - west + 1,
+                        date=date, cloud_score=cloud_score)
+        if previous is not None and previous.tile_size != tile_size:
+            previous = None
+        
+        pending = []
+        for row in range(grid.rows):
+            for col in range(grid.cols):
+                lattice = grid._lattice(row, col)
+                reused = previous._reusable_tile(lattice, date, cloud_score) if previous is not None else None
+                tile = {
+                    "row": row,
+                    "col": col,
+                    "lat": round((lattice[0] + 0.5) * tile_size, 6),
+                    "lon": round((lattice[1] + 0.5) * tile_size, 6),
+                    "assets": reused["assets"] if reused is not None else None,
+                    "imagery": reused["imagery"] if reused is not None else None,
+                    "assets_error": None,
+                    "imagery_error": None
+                }
+                grid._tiles[(row, col)] = tile
+                if assets and tile["assets"] is None:
+                    pending.append((tile, "assets", lattice))
+                if imagery and tile["imagery"] is None:
+                    pending.append((tile, "imagery", lattice))
+        
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        
+        def fetch(job):
+            tile, kind, lattice = job
+            try:
+                if kind == "assets":
+                    return self.get_assets(tile["lat"], tile["lon"], date=date, dim=tile_size)
+                # The imagery endpoint returns an image, not JSON
+                url = self._build_url("earth/imagery")
+                params = {"lat": tile["lat"], "lon": tile["lon"], "date": date, "dim": tile_size,
+                          "cloud_score": cloud_score}
+                # Remove None values
+                params = {k: v for k, v in params.items() if v is not None}
+                if directory is not None:
+                    name = f"{lattice[0]}_{lattice[1]}_{date or 'latest'}_{tile_size:g}.png"
+                    return self.request_handler.download(url, os.path.join(directory, name), params)["path"]
+                params["api_key"] = self.request_handler.api_key
+                return self.request_handler.send("GET", url, params=params).content
+            except NASAAPIError as e:
+                return e
+        
+        for (tile, kind, _), result in zip(pending, self._map_concurrently(fetch, pending, max_workers)):
+            if isinstance(result, NASAAPIError):
+                tile[f"{kind}_error"] = str(result)
+            else:
+                tile[kind] = result
+        
+        return grid
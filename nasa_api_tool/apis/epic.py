@@ -4,8 +4,192 @@ EPIC (Earth Polychromatic Imaging Camera) API Module
 This module provides access to NASA's EPIC API.
 """
 
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+from ..exceptions import NASAAPIError
 from .base import APIModule
 
+def _parse_timestamp(value):
+    """
+    Parse a date or timestamp the way EPIC formats them.
+    
+    Args:
+        value (str, date or datetime): "YYYY-MM-DD", "YYYY-MM-DD HH:MM:SS",
+            or a date or datetime object.
+            
+    Returns:
+        datetime: The parsed timestamp. Dates become midnight.
+        
+    Raises:
+        ValueError: If the value is malformed.
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    value = value.strip().replace("T", " ")
+    if len(value) == 10:
+        return datetime.strptime(value, "%Y-%m-%d")
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+class EPICDateIndex:
+    """
+    Sorted index of the dates with EPIC imagery in one collection.
+    
+    The full date list is fetched once. After that, refresh() first asks for
+    the most recent images. The date list is only fetched again when that
+    probe shows a date newer than the last one in the index, and only the
+    new dates are appended. Lookups use binary search.
+    
+    Use EPICModule.date_index() rather than creating this class directly,
+    so that the index is shared.
+    
+    Attributes:
+        collection (str): The image collection type.
+        max_age (float): Seconds after which lookups refresh the index first.
+    """
+    
+    def __init__(self, module, collection="natural", max_age=3600):
+        """
+        Initialize an empty index.
+        
+        Args:
+            module (EPICModule): The module used to fetch dates.
+            collection (str, optional): Image collection type ('natural', 'enhanced').
+                Default is 'natural'.
+            max_age (float, optional): Seconds after which lookups refresh the
+                index first. Default is 3600.
+        """
+        self.collection = collection
+        self.max_age = max_age
+        self._module = module
+        self._dates = []
+        self._checked_at = None
+        self._lock = threading.Lock()
+    
+    @property
+    def dates(self):
+        """list: All indexed dates (YYYY-MM-DD), oldest first."""
+        self._ensure_fresh()
+        return list(self._dates)
+    
+    def __len__(self):
+        self._ensure_fresh()
+        return len(self._dates)
+    
+    def __contains__(self, day):
+        self._ensure_fresh()
+        day = _parse_timestamp(day).date().isoformat()
+        i = bisect_left(self._dates, day)
+        return i < len(self._dates) and self._dates[i] == day
+    
+    def refresh(self, force=False):
+        """
+        Bring the index up to date.
+        
+        Args:
+            force (bool, optional): Fetch the complete date list even if the
+                index looks current. Default is False.
+                
+        Returns:
+            list: The dates added to the index, oldest first.
+            
+        Raises:
+            NASAAPIError: If a request fails or returns an error.
+        """
+        with self._lock:
+            if self._dates and not force:
+                latest = self._module.get_images(self.collection)
+                newest = max((image["date"][:10] for image in latest), default=None)
+                if newest is None or newest <= self._dates[-1]:
+                    self._checked_at = time.monotonic()
+                    return []
+            
+            available = sorted(set(self._module.get_available_dates(self.collection)))
+            if force or not self._dates:
+                added = available
+                self._dates = available
+            else:
+                # Only dates past the current tail are new
+                added = available[bisect_right(available, self._dates[-1]):]
+                self._dates.extend(added)
+            self._checked_at = time.monotonic()
+            return list(added)
+    
+    def floor(self, timestamp):
+        """
+        Get the latest date with imagery on or before a date.
+        
+        Args:
+            timestamp (str, date or datetime): The date or timestamp to look up.
+            
+        Returns:
+            str: The date (YYYY-MM-DD), or None if there is none.
+        """
+        self._ensure_fresh()
+        day = _parse_timestamp(timestamp).date().isoformat()
+        i = bisect_right(self._dates, day)
+        return self._dates[i - 1] if i else None
+    
+    def ceiling(self, timestamp):
+        """
+        Get the earliest date with imagery on or after a date.
+        
+        Args:
+            timestamp (str, date or datetime): The date or timestamp to look up.
+            
+        Returns:
+            str: The date (YYYY-MM-DD), or None if there is none.
+        """
+        self._ensure_fresh()
+        day = _parse_timestamp(timestamp).date().isoformat()
+        i = bisect_left(self._dates, day)
+        return self._dates[i] if i < len(self._dates) else None
+    
+    def nearest(self, timestamp):
+        """
+        Get the date with imagery closest to a date.
+        
+        Args:
+            timestamp (str, date or datetime): The date or timestamp to look up.
+            
+        Returns:
+            str: The date (YYYY-MM-DD), or None if the index is empty. Ties
+                go to the earlier date.
+        """
+        day = _parse_timestamp(timestamp).date()
+        before, after = self.floor(day), self.ceiling(day)
+        if before is None or after is None:
+            return before or after
+        if (day - _parse_timestamp(before).date()) <= (_parse_timestamp(after).date() - day):
+            return before
+        return after
+    
+    def between(self, start, end):
+        """
+        Get the dates with imagery in a range.
+        
+        Args:
+            start (str, date or datetime): First date of the range.
+            end (str, date or datetime): Last date of the range, inclusive.
+            
+        Returns:
+            list: The dates (YYYY-MM-DD) in the range, oldest first.
+        """
+        self._ensure_fresh()
+        start = _parse_timestamp(start).date().isoformat()
+        end = _parse_timestamp(end).date().isoformat()
+        return self._dates[bisect_left(self._dates, start):bisect_right(self._dates, end)]
+    
+    def _ensure_fresh(self):
+        checked_at = self._checked_at
+        if checked_at is None or (self.max_age is not None and time.monotonic() - checked_at > self.max_age):
+            self.refresh()
+
 class EPICModule(APIModule):
     """
     Module for accessing NASA's EPIC API.
@@ -22,6 +206,8 @@ class EPICModule(APIModule):
         """
         super().__init__(request_handler)
         self.base_url = "https://api.nasa.gov/EPIC/api/"
+        self._date_indexes = {}
+        self._date_indexes_lock = threading.Lock()
     
     def get_images(self, collection="natural", date=None):
         """
@@ -80,3 +266,125 @@ class EPICModule(APIModule):
         image_name = image["image"]
         
         return f"https://api.nasa.gov/EPIC/archive/{collection}/{year}/{month}/{day}/png/{image_name}.png"
+    
+    def download_images(self, images, directory, collection="natural", max_workers=4):
+        """
+        Download EPIC images to a directory.
+        
+        Files are streamed to disk in chunks on a worker pool. Files that
+        already exist are skipped. Partial files left by an interrupted run
+        are resumed with HTTP Range requests. Every file's size is checked
+        against the size the server announced before it is moved into place.
+        
+        Args:
+            images (list): EPIC image metadata from get_images().
+            directory (str): Directory to save the PNG files in. Created if needed.
+            collection (str, optional): Image collection type ('natural', 'enhanced').
+                Default is 'natural'.
+            max_workers (int, optional): Number of files downloaded at once. Default is 4.
+                
+        Returns:
+            list: One dict per image, in input order, with "image", "path",
+                "status" ("skipped", "downloaded", "resumed" or "failed"),
+                "bytes" and, for failures, "error".
+        """
+        self._require_blocking_handler()
+        os.makedirs(directory, exist_ok=True)
+        
+        def download(image):
+            path = os.path.join(directory, f"{image['image']}.png")
+            try:
+                result = self.request_handler.download(self.get_image_url(image, collection), path)
+            except (NASAAPIError, OSError) as e:
+                result = {"path": path, "status": "failed", "bytes": 0, "error": str(e)}
+            result["image"] = image["image"]
+            return result
+        
+        return self._map_concurrently(download, images, max_workers)
+    
+    def date_index(self, collection="natural"):
+        """
+        Get the shared date index for a collection.
+        
+        The index is created on first use and kept for the life of the module.
+        
+        Args:
+            collection (str, optional): Image collection type ('natural', 'enhanced').
+                Default is 'natural'.
+                
+        Returns:
+            EPICDateIndex: The date index.
+            
+        Raises:
+            TypeError: If the request handler is asynchronous.
+        """
+        self._require_blocking_handler()
+        with self._date_indexes_lock:
+            index = self._date_indexes.get(collection)
+            if index is None:
+                index = EPICDateIndex(self, collection)
+                self._date_indexes[collection] = index
+            return index
+    
+    def get_nearest_images(self, timestamp, collection="natural"):
+        """
+        Get the EPIC images taken closest to a timestamp.
+        
+        The imagery of the available dates on either side of the timestamp
+        is fetched, and the images are sorted by their distance from it. If
+        the timestamp's own date has imagery, the previous and next dates
+        with imagery are fetched as well, since an image taken just before
+        or after midnight may be closer.
+        
+        Args:
+            timestamp (str, date or datetime): "YYYY-MM-DD", "YYYY-MM-DD HH:MM:SS",
+                or a date or datetime object (UTC).
+            collection (str, optional): Image collection type ('natural', 'enhanced').
+                Default is 'natural'.
+                
+        Returns:
+            list: EPIC image metadata, closest image first.
+                
+        Raises:
+            ValueError: If the timestamp is malformed.
+            NASAAPIError: If a request fails or returns an error.
+        """
+        when = _parse_timestamp(timestamp)
+        index = self.date_index(collection)
+        candidates = [index.floor(when), index.ceiling(when)]
+        if candidates[0] == when.date().isoformat():
+            candidates += [index.floor(when - timedelta(days=1)), index.ceiling(when + timedelta(days=1))]
+        days = sorted(set(day for day in candidates if day is not None))
+        images = []
+        for day in days:
+            images.extend(self.get_images(collection, day))
+        return sorted(images, key=lambda image: abs((_parse_timestamp(image["date"]) - when).total_seconds()))
+    
+    def get_images_range(self, start, end, collection="natural", max_workers=None):
+        """
+        Get EPIC imagery metadata for every available date in a range.
+        
+        The dates are taken from the date index, so no requests are wasted on
+        days without imagery, and fetched concurrently.
+        
+        Args:
+            start (str, date or datetime): First date of the range (YYYY-MM-DD).
+            end (str, date or datetime): Last date of the range (YYYY-MM-DD), inclusive.
+            collection (str, optional): Image collection type ('natural', 'enhanced').
+                Default is 'natural'.
+            max_workers (int, optional): Maximum number of dates fetched at once.
+                Default is the request handler's pool_maxsize.
+                
+        Returns:
+            dict: Mapping of dates (YYYY-MM-DD) to lists of imagery metadata,
+                in date order.
+                
+        Raises:
+            ValueError: If the dates are malformed or end is before start.
+            NASAAPIError: If any request fails or returns an error.
+        """
+        if _parse_timestamp(end).date() < _parse_timestamp(start).date():
+            raise ValueError("end must not be before start")
+        days = self.date_index(collection).between(start, end)
+        images = self._map_concurrently(lambda day: self.get_images(collection, day), days, max_workers)
+        return dict(zip(days, images))
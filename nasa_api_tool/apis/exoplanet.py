@@ -4,13 +4,496 @@ Exoplanet API Module
 This module provides access to NASA's Exoplanet Archive API.
 """
 
+import csv
+import io
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import quote_plus, urlencode, urljoin
+
+from ..columnar import decode_table
+from ..exceptions import NASAAPIError
+from ..request_handler import DEFAULT_CHUNK_SIZE
 from .base import APIModule
 
+# Endpoint of the Exoplanet Archive's asynchronous TAP service.
+TAP_ASYNC_URL = "https://exoplanetarchive.ipac.caltech.edu/TAP/async"
+
+# SQLite column types of the columnar kinds, for ExoplanetMirror.
+_SQL_TYPES = {"int": "INTEGER", "float": "REAL", "bool": "INTEGER", "str": "TEXT"}
+
+# ADQL "select top N" prefix, which SQLite spells as a LIMIT clause.
+_TOP = re.compile(r"select\s+top\s+(\d+)\s+", re.IGNORECASE)
+
+# Longest request URL sent by bulk lookups. Web servers commonly reject
+# request lines of 8 KiB or more; this leaves room for proxies.
+MAX_URL_LENGTH = 4000
+
+# UWS job phases after which a job no longer changes.
+FINAL_PHASES = frozenset(["COMPLETED", "ERROR", "ABORTED"])
+
+def adql_string(value):
+    """
+    Quote a value as an ADQL string literal.
+    
+    Args:
+        value (str): The value.
+        
+    Returns:
+        str: The literal, with single quotes doubled, e.g. 'Kapteyn''s b'.
+    """
+    return "'" + str(value).replace("'", "''") + "'"
+
+class TAPJob:
+    """
+    An asynchronous TAP query job on the Exoplanet Archive.
+    
+    The query runs on the server while the client polls the job's phase.
+    When the job has completed, the result can be streamed or downloaded
+    in chunks, so the whole table never has to arrive in one response.
+    
+    Attributes:
+        url (str): URL of the job resource.
+        format (str): Result format of the query.
+        phase (str): Last phase seen, e.g. "QUEUED", "EXECUTING" or "COMPLETED".
+    """
+    
+    def __init__(self, request_handler, url, format="json"):
+        """
+        Initialize a job handle.
+        
+        Args:
+            request_handler (RequestHandler): The request handler to use.
+            url (str): URL of the job resource.
+            format (str, optional): Result format of the query. Default is "json".
+        """
+        self.url = url
+        self.format = format
+        self.phase = None
+        self._request_handler = request_handler
+    
+    def get_phase(self):
+        """
+        Ask the server for the job's current phase.
+        
+        Returns:
+            str: The phase, e.g. "QUEUED", "EXECUTING", "COMPLETED" or "ERROR".
+                
+        Raises:
+            NASAAPIError: If the request fails or returns an error.
+        """
+        response = self._request_handler.send("GET", f"{self.url}/phase")
+        self.phase = response.text.strip().upper()
+        return self.phase
+    
+    def wait(self, timeout=None, poll_interval=1.0, max_poll_interval=30.0):
+        """
+        Wait for the job to finish, polling its phase with backoff.
+        
+        The delay between polls starts at poll_interval and grows by half
+        after every poll, up to max_poll_interval.
+        
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait.
+                Default is no limit.
+            poll_interval (float, optional): Initial delay between polls in seconds.
+                Default is 1.
+            max_poll_interval (float, optional): Maximum delay between polls in seconds.
+                Default is 30.
+                
+        Returns:
+            TAPJob: The job, for chaining.
+                
+        Raises:
+            NASAAPIError: If the job fails, is aborted or does not finish in time.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        delay = poll_interval
+        while self.get_phase() not in FINAL_PHASES:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise NASAAPIError(f"TAP job did not finish within {timeout}s (phase {self.phase})")
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            delay = min(delay * 1.5, max_poll_interval)
+        
+        if self.phase == "ERROR":
+            raise NASAAPIError(f"TAP job failed: {self._error_summary()}")
+        if self.phase == "ABORTED":
+            raise NASAAPIError("TAP job was aborted")
+        return self
+    
+    def iter_content(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stream the raw result of a completed job.
+        
+        Args:
+            chunk_size (int, optional): Bytes per chunk. Default is 256 KiB.
+            
+        Yields:
+            bytes: Chunks of the result.
+            
+        Raises:
+            NASAAPIError: If the request fails or returns an error.
+        """
+        response = self._request_handler.send("GET", f"{self.url}/results/result", stream=True)
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                yield chunk
+        finally:
+            response.close()
+    
+    def iter_lines(self):
+        """
+        Stream the result of a completed job line by line.
+        
+        Useful for the csv and tsv formats, which have one row per line.
+        
+        Yields:
+            str: Lines of the result, without line endings.
+            
+        Raises:
+            NASAAPIError: If the request fails or returns an error.
+        """
+        response = self._request_handler.send("GET", f"{self.url}/results/result", stream=True)
+        try:
+            for line in response.iter_lines():
+                yield line.decode("utf-8")
+        finally:
+            response.close()
+    
+    def result(self):
+        """
+        Get the whole result of a completed job.
+        
+        Returns:
+            list or str: The decoded rows for the json format, otherwise the text.
+                
+        Raises:
+            NASAAPIError: If the request fails or the result cannot be decoded.
+        """
+        body = b"".join(self.iter_content())
+        if self.format != "json":
+            return body.decode("utf-8")
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise NASAAPIError("Invalid response format")
+    
+    def table(self, kinds=None):
+        """
+        Stream the result of a completed csv, tsv or votable job into typed columns.
+        
+        Args:
+            kinds (dict, optional): Mapping of column names to "int", "float",
+                "bool" or "str", overriding the detected types.
+                
+        Returns:
+            ColumnarTable: The result.
+                
+        Raises:
+            ValueError: If the job's format is not csv, tsv or votable.
+            NASAAPIError: If the request fails or the result is malformed.
+        """
+        return decode_table(self.iter_content(), self.format, kinds)
+    
+    def download(self, path, overwrite=False):
+        """
+        Save the result of a completed job to a file.
+        
+        The result is streamed to disk and resumed if the transfer is interrupted.
+        
+        Args:
+            path (str): Destination file path.
+            overwrite (bool, optional): Download again even if path exists.
+                Default is False.
+                
+        Returns:
+            dict: "path", "status" and "bytes", as returned by RequestHandler.download().
+                
+        Raises:
+            NASAAPIError: If the request fails or returns an error.
+        """
+        return self._request_handler.download(f"{self.url}/results/result", path, overwrite=overwrite)
+    
+    def delete(self):
+        """
+        Delete the job and its result from the server.
+        
+        Raises:
+            NASAAPIError: If the request fails or returns an error.
+        """
+        self._request_handler.send("DELETE", self.url).close()
+    
+    def _error_summary(self):
+        try:
+            text = self._request_handler.send("GET", f"{self.url}/error").text
+        except NASAAPIError as e:
+            return str(e)
+        # The error document is usually a VOTable; keep the human-readable part
+        match = re.search(r"<INFO[^>]*>([^<]+)</INFO>", text)
+        return (match.group(1) if match else text).strip()[:500]
+    
+    def __repr__(self):
+        return f"TAPJob(url={self.url!r}, phase={self.phase!r})"
+
+class ExoplanetMirror:
+    """
+    Local SQLite copy of an Exoplanet Archive table.
+    
+    The first sync downloads the whole table through an asynchronous TAP
+    job. Later syncs only request rows whose rowupdate date is on or after
+    the newest one already stored, upsert them by their key column, and
+    delete rows that have disappeared from the archive. The table keeps
+    its archive name and is indexed on the key and on commonly filtered
+    columns. query() therefore runs the usual select/where/order clauses
+    locally.
+    
+    The database runs in WAL mode, so readers in other processes are not
+    blocked by a sync.
+    
+    Attributes:
+        path (str): Path to the SQLite database file.
+        table (str): Name of the mirrored table.
+        key (str): Column that identifies a row.
+    """
+    
+    def __init__(self, module, path, table="pscomppars", key="pl_name",
+                 indexes=("hostname", "disc_year", "discoverymethod", "rowupdate")):
+        """
+        Open (or create) a mirror database.
+        
+        Args:
+            module (ExoplanetModule): The module used to fetch rows.
+            path (str): Path to the SQLite database file.
+            table (str, optional): Table to mirror. Default is "pscomppars".
+            key (str, optional): Column that identifies a row. Default is "pl_name".
+            indexes (tuple, optional): Columns to index in addition to the key.
+        """
+        self.path = path
+        self.table = table
+        self.key = key
+        self.indexes = tuple(indexes)
+        self._module = module
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS _mirror_meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+    
+    @property
+    def synced_at(self):
+        """float: Unix time of the last successful sync, or None."""
+        value = self._get_meta("synced_at")
+        return float(value) if value is not None else None
+    
+    @property
+    def rowupdate(self):
+        """str: Newest rowupdate date stored (YYYY-MM-DD), or None before the first sync."""
+        return self._get_meta("rowupdate")
+    
+    def sync(self, full=False, prune=True, timeout=None):
+        """
+        Bring the local table up to date with the archive.
+        
+        Args:
+            full (bool, optional): Download the whole table again instead of
+                only the updated rows. Default is False.
+            prune (bool, optional): Delete local rows whose key is no longer
+                in the archive. Default is True.
+            timeout (float, optional): Maximum number of seconds to wait for
+                the full download job. Default is no limit.
+                
+        Returns:
+            dict: "mode" ("full" or "incremental"), "rows" (rows written) and
+                "deleted" (rows pruned).
+                
+        Raises:
+            NASAAPIError: If a request fails or returns an error.
+        """
+        mark = None if full else self.rowupdate
+        if mark is None:
+            job = self._module.submit_query(table=self.table, format="csv")
+            try:
+                data = job.wait(timeout).table()
+            finally:
+                try:
+                    job.delete()
+                except NASAAPIError:
+                    pass
+            self._replace(data)
+            result = {"mode": "full", "rows": len(data), "deleted": 0}
+        else:
+            data = self._module.query_table(table=self.table, where=f"rowupdate >= {adql_string(mark)}")
+            self._upsert(data)
+            deleted = 0
+            if prune:
+                keys = self._module.query_table(table=self.table, select=self.key, kinds={self.key: "str"})
+                deleted = self._prune(set(keys[self.key]))
+            result = {"mode": "incremental", "rows": len(data), "deleted": deleted}
+        
+        with self._lock:
+            rowupdate = self._conn.execute(
+                f"SELECT MAX(rowupdate) FROM {_sql_name(self.table)}"
+            ).fetchone()[0] if "rowupdate" in self._columns() else None
+            self._set_meta("rowupdate", rowupdate)
+            self._set_meta("synced_at", str(time.time()))
+            self._conn.commit()
+        return result
+    
+    def query(self, table=None, select="*", where=None, order=None, format="json"):
+        """
+        Query the local table with the same arguments as ExoplanetModule.query().
+        
+        The clauses run on SQLite, which accepts the comparisons, boolean
+        operators, LIKE, IN and ORDER BY of typical ADQL queries. ADQL's
+        "top N" is translated to LIMIT; ADQL functions are not.
+        
+        Args:
+            table (str, optional): Table to query. Must be the mirrored table.
+                Default is the mirrored table.
+            select (str, optional): Columns to select. Default is "*" (all columns).
+            where (str, optional): WHERE clause for filtering results.
+            order (str, optional): ORDER BY clause for sorting results.
+            format (str, optional): Response format: "json" (a list of dicts),
+                "csv" or "tsv" (text). Default is "json".
+                
+        Returns:
+            list or str: Query results in the specified format.
+                
+        Raises:
+            ValueError: If the table is not mirrored or the format is not supported.
+            NASAAPIError: If the mirror has not been synced or the query is invalid.
+        """
+        table = table or self.table
+        if table != self.table:
+            raise ValueError(f"This mirror holds {self.table}, not {table}")
+        if format not in ("json", "csv", "tsv"):
+            raise ValueError(f"Unsupported local query format: {format}")
+        
+        sql = ExoplanetModule._build_query(table, select, where, order)
+        top = _TOP.match(sql)
+        if top:
+            sql = f"select {sql[top.end():]} limit {top.group(1)}"
+        with self._lock:
+            try:
+                cursor = self._conn.execute(sql)
+            except sqlite3.Error as e:
+                message = "Local mirror has not been synced" if "no such table" in str(e) else f"Invalid query: {e}"
+                raise NASAAPIError(message)
+            names = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        
+        if format == "json":
+            return [dict(zip(names, row)) for row in rows]
+        output = io.StringIO()
+        writer = csv.writer(output, delimiter="," if format == "csv" else "\t", lineterminator="\n")
+        writer.writerow(names)
+        writer.writerows(["" if value is None else value for value in row] for row in rows)
+        return output.getvalue()
+    
+    def __len__(self):
+        with self._lock:
+            try:
+                return self._conn.execute(f"SELECT COUNT(*) FROM {_sql_name(self.table)}").fetchone()[0]
+            except sqlite3.OperationalError:
+                return 0
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def _replace(self, data):
+        """
+        Load a complete table into a new SQLite table and swap it in.
+        
+        Readers keep seeing the old table until the swap is committed.
+        """
+        staging = f"{self.table}__staging"
+        definitions = [f"{_sql_name(name)} {_SQL_TYPES[data.kinds[name]]}" for name in data.names]
+        if self.key in data.names:
+            definitions.append(f"PRIMARY KEY ({_sql_name(self.key)})")
+        with self._lock:
+            self._conn.execute(f"DROP TABLE IF EXISTS {_sql_name(staging)}")
+            self._conn.execute(f"CREATE TABLE {_sql_name(staging)} ({', '.join(definitions)})")
+            self._insert(staging, data)
+            self._conn.execute(f"DROP TABLE IF EXISTS {_sql_name(self.table)}")
+            self._conn.execute(f"ALTER TABLE {_sql_name(staging)} RENAME TO {_sql_name(self.table)}")
+            for column in self.indexes:
+                if column in data.names:
+                    self._conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {_sql_name(f'{self.table}_{column}')} "
+                        f"ON {_sql_name(self.table)} ({_sql_name(column)})"
+                    )
+            self._conn.commit()
+    
+    def _upsert(self, data):
+        """Insert or replace rows by key, adding any columns the archive has gained."""
+        if not data.names:
+            return
+        with self._lock:
+            existing = self._columns()
+            for name in data.names:
+                if name not in existing:
+                    self._conn.execute(
+                        f"ALTER TABLE {_sql_name(self.table)} ADD COLUMN {_sql_name(name)} {_SQL_TYPES[data.kinds[name]]}"
+                    )
+            self._insert(self.table, data)
+            self._conn.commit()
+    
+    def _prune(self, keys):
+        """Delete rows whose key is not in keys. Returns the number deleted."""
+        with self._lock:
+            local = [row[0] for row in self._conn.execute(
+                f"SELECT {_sql_name(self.key)} FROM {_sql_name(self.table)}"
+            )]
+            stale = [(key,) for key in local if key not in keys]
+            self._conn.executemany(
+                f"DELETE FROM {_sql_name(self.table)} WHERE {_sql_name(self.key)} = ?", stale
+            )
+            self._conn.commit()
+            return len(stale)
+    
+    def _insert(self, table, data):
+        columns = ", ".join(_sql_name(name) for name in data.names)
+        placeholders = ", ".join("?" for _ in data.names)
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO {_sql_name(table)} ({columns}) VALUES ({placeholders})",
+            ([None if value == "" or isinstance(value, float) and math.isnan(value) else value for value in row]
+             for row in data)
+        )
+    
+    def _columns(self):
+        return [row[1] for row in self._conn.execute(f"PRAGMA table_info({_sql_name(self.table)})")]
+    
+    def _get_meta(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM _mirror_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def _set_meta(self, key, value):
+        self._conn.execute("INSERT OR REPLACE INTO _mirror_meta (key, value) VALUES (?, ?)", (key, value))
+
+def _sql_name(name):
+    """Quote an SQLite identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
 class ExoplanetModule(APIModule):
     """
     Module for accessing NASA's Exoplanet Archive API.
     
     This module provides methods to retrieve exoplanet data.
+    
+    Attributes:
+        local_mirror (ExoplanetMirror): If set, query() answers queries on the
+            mirrored table from the local database once it has been synced.
+            Default is None.
     """
     
     def __init__(self, request_handler):
@@ -22,6 +505,7 @@ class ExoplanetModule(APIModule):
         """
         super().__init__(request_handler)
         self.base_url = "https://exoplanetarchive.ipac.caltech.edu/TAP/sync?"
+        self.local_mirror = None
     
     def query(self, table="ps", select="*", where=None, order=None, format="json"):
         """
@@ -34,30 +518,187 @@ class ExoplanetModule(APIModule):
             where (str, optional): WHERE clause for filtering results.
             order (str, optional): ORDER BY clause for sorting results.
             format (str, optional): Response format. Default is "json".
-                Other options include "csv", "tsv", "votable".
+                Other options include "csv", "tsv", "votable", which require
+                a blocking request handler.
                 
         Returns:
             list or str: Query results in the specified format.
                 
         Raises:
+            TypeError: If a text format is requested with an asynchronous request handler.
             NASAAPIError: If the request fails or returns an error.
         """
-        query_parts = [f"select {select}", f"from {table}"]
+        mirror = self.local_mirror
+        if (mirror is not None and table == mirror.table and format in ("json", "csv", "tsv")
+                and mirror.synced_at is not None):
+            return mirror.query(table, select, where, order, format)
         
-        if where:
-            query_parts.append(f"where {where}")
+        params = {
+            "query": self._build_query(table, select, where, order),
+            "format": format
+        }
         
-        if order:
-            query_parts.append(f"order by {order}")
+        if format != "json":
+            # Text formats are returned as they are instead of being parsed as JSON
+            self._require_blocking_handler()
+            return self.request_handler.send("GET", self.base_url, params=params).text
+        return self.request_handler.get(self.base_url, params)
+    
+    def query_table(self, table="ps", select="*", where=None, order=None, format="csv", kinds=None):
+        """
+        Query the Exoplanet Archive and decode the result into typed columns.
         
-        query = " ".join(query_parts)
+        The result is streamed and parsed as it arrives. Numeric columns
+        are stored in compact arrays instead of one dict per row, which
+        takes a fraction of the memory of a JSON result.
         
+        Args:
+            table (str, optional): Table to query. Default is "ps" (Planetary Systems).
+            select (str, optional): Columns to select. Default is "*" (all columns).
+            where (str, optional): WHERE clause for filtering results.
+            order (str, optional): ORDER BY clause for sorting results.
+            format (str, optional): Transfer format: "csv", "tsv" or "votable".
+                Column types are inferred for csv and tsv, and taken from the
+                field declarations for votable. Default is "csv".
+            kinds (dict, optional): Mapping of column names to "int", "float",
+                "bool" or "str", overriding the detected types.
+                
+        Returns:
+            ColumnarTable: The result, with to_numpy() and to_dicts() conversions.
+                
+        Raises:
+            ValueError: If the format is not supported.
+            TypeError: If the request handler is asynchronous.
+            NASAAPIError: If the request fails or the result is malformed.
+        """
+        if format not in ("csv", "tsv", "votable"):
+            raise ValueError(f"Unsupported table format: {format}")
+        self._require_blocking_handler()
         params = {
-            "query": query,
+            "query": self._build_query(table, select, where, order),
             "format": format
         }
+        response = self.request_handler.send("GET", self.base_url, params=params, stream=True)
+        try:
+            return decode_table(response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE), format, kinds)
+        finally:
+            response.close()
+    
+    def submit_query(self, table="ps", select="*", where=None, order=None, format="json"):
+        """
+        Submit a query as an asynchronous TAP job.
         
-        return self.request_handler.get(self.base_url, params)
+        Unlike query(), the job keeps running on the server without an open
+        connection, so large table scans do not time out. Poll it with
+        TAPJob.wait() and then read the result.
+        
+        Args:
+            table (str, optional): Table to query. Default is "ps" (Planetary Systems).
+            select (str, optional): Columns to select. Default is "*" (all columns).
+            where (str, optional): WHERE clause for filtering results.
+            order (str, optional): ORDER BY clause for sorting results.
+            format (str, optional): Result format. Default is "json".
+                Other options include "csv", "tsv", "votable".
+                
+        Returns:
+            TAPJob: The running job.
+                
+        Raises:
+            TypeError: If the request handler is asynchronous.
+            NASAAPIError: If the job cannot be created.
+        """
+        self._require_blocking_handler()
+        data = {
+            "REQUEST": "doQuery",
+            "LANG": "ADQL",
+            "QUERY": self._build_query(table, select, where, order),
+            "FORMAT": format,
+            "PHASE": "RUN"
+        }
+        response = self.request_handler.send("POST", TAP_ASYNC_URL, data=data, allow_redirects=False)
+        response.close()
+        location = response.headers.get("Location")
+        if not location:
+            raise NASAAPIError("TAP service did not return a job URL")
+        return TAPJob(self.request_handler, urljoin(TAP_ASYNC_URL + "/", location).rstrip("/"), format)
+    
+    def query_async(self, table="ps", select="*", where=None, order=None, format="json",
+                    timeout=None, poll_interval=1.0, max_poll_interval=30.0):
+        """
+        Query the Exoplanet Archive through an asynchronous TAP job.
+        
+        Takes the same arguments as query() and returns the same result, but
+        the query runs as a job that is polled with backoff and deleted once
+        its result has been read.
+        
+        Args:
+            table (str, optional): Table to query. Default is "ps" (Planetary Systems).
+            select (str, optional): Columns to select. Default is "*" (all columns).
+            where (str, optional): WHERE clause for filtering results.
+            order (str, optional): ORDER BY clause for sorting results.
+            format (str, optional): Result format. Default is "json".
+            timeout (float, optional): Maximum number of seconds to wait for the job.
+                Default is no limit.
+            poll_interval (float, optional): Initial delay between polls in seconds.
+                Default is 1.
+            max_poll_interval (float, optional): Maximum delay between polls in seconds.
+                Default is 30.
+                
+        Returns:
+            list or str: Query results in the specified format.
+                
+        Raises:
+            TypeError: If the request handler is asynchronous.
+            NASAAPIError: If the job fails or does not finish in time.
+        """
+        job = self.submit_query(table, select, where, order, format)
+        try:
+            return job.wait(timeout, poll_interval, max_poll_interval).result()
+        finally:
+            try:
+                job.delete()
+            except NASAAPIError:
+                pass
+    
+    def mirror(self, path, table="pscomppars", key="pl_name"):
+        """
+        Open a local SQLite mirror of an Exoplanet Archive table.
+        
+        Call sync() on the mirror to download the table or refresh it. Assign
+        the mirror to local_mirror to have query() use it.
+        
+        Args:
+            path (str): Path to the SQLite database file.
+            table (str, optional): Table to mirror. Default is "pscomppars"
+                (Planetary Systems Composite Parameters).
+            key (str, optional): Column that identifies a row. Default is "pl_name".
+            
+        Returns:
+            ExoplanetMirror: The mirror.
+            
+        Raises:
+            TypeError: If the request handler is asynchronous.
+        """
+        self._require_blocking_handler()
+        return ExoplanetMirror(self, path, table, key)
+    
+    @staticmethod
+    def _build_query(table, select="*", where=None, order=None):
+        """
+        Build an ADQL query.
+        
+        Returns:
+            str: The query.
+        """
+        query_parts = [f"select {select}", f"from {table}"]
+        
+        if where:
+            query_parts.append(f"where {where}")
+        
+        if order:
+            query_parts.append(f"order by {order}")
+        
+        return " ".join(query_parts)
     
     def get_confirmed_planets(self, limit=10, format="json"):
         """
@@ -98,10 +739,79 @@ class ExoplanetModule(APIModule):
         return self.query(
             table="ps",
             select="*",
-            where=f"pl_name='{planet_name}' and default_flag=1",
+            where=f"pl_name={adql_string(planet_name)} and default_flag=1",
             format=format
         )
     
+    def get_planets_by_name(self, planet_names, select="*", max_url_length=MAX_URL_LENGTH, max_workers=None):
+        """
+        Get data for many exoplanets by name with as few requests as possible.
+        
+        The names are packed into "pl_name in (...)" queries, each as long as
+        max_url_length allows, and the queries run concurrently.
+        
+        Args:
+            planet_names (list): Names of the exoplanets.
+            select (str, optional): Columns to select. Default is "*" (all columns).
+                pl_name is added if it is missing, to map rows back to names.
+            max_url_length (int, optional): Longest request URL to send, in characters.
+                Default is 4000.
+            max_workers (int, optional): Maximum number of queries at once.
+                Default is the request handler's pool_maxsize.
+                
+        Returns:
+            dict: Mapping of each requested name to its row (default parameter set),
+                or None if the archive has no planet of that name.
+                
+        Raises:
+            ValueError: If a single name does not fit in max_url_length.
+            NASAAPIError: If any request fails or returns an error.
+        """
+        names = list(dict.fromkeys(planet_names))
+        if select.strip() != "*" and "pl_name" not in [column.strip() for column in select.split(",")]:
+            select = f"pl_name,{select}"
+        
+        def build_where(quoted):
+            return f"pl_name in ({','.join(quoted)}) and default_flag=1"
+        
+        def url_length(where):
+            params = {
+                "query": self._build_query("ps", select, where),
+                "format": "json",
+                "api_key": self.request_handler.api_key
+            }
+            return len(self.base_url) + len(urlencode(params))
+        
+        # Each name adds its encoded length plus an encoded comma
+        chunks = []
+        quoted = []
+        length = url_length(build_where([]))
+        for name in names:
+            literal = adql_string(name)
+            added = len(quote_plus(literal)) + (len(quote_plus(",")) if quoted else 0)
+            if quoted and length + added > max_url_length:
+                chunks.append(quoted)
+                quoted = []
+                length = url_length(build_where([]))
+                added = len(quote_plus(literal))
+            if length + added > max_url_length:
+                raise ValueError(f"Planet name does not fit in a {max_url_length} character URL: {name!r}")
+            quoted.append(literal)
+            length += added
+        if quoted:
+            chunks.append(quoted)
+        
+        results = self._map_concurrently(
+            lambda chunk: self.query(table="ps", select=select, where=build_where(chunk)),
+            chunks,
+            max_workers
+        )
+        rows = {}
+        for chunk_rows in results:
+            for row in chunk_rows:
+                rows.setdefault(row.get("pl_name"), row)
+        return {name: rows.get(name) for name in names}
+    
     def get_planets_in_habitable_zone(self, format="json"):
         """
         Get a list of exoplanets in the habitable zone.
@@ -4,8 +4,20 @@ NASA Image and Video Library API Module
 This module provides access to NASA's Image and Video Library API.
 """
 
+import math
+from datetime import date
+
+from ..concurrency import background_iter
 from .base import APIModule
 
+# Results per search page, and the most results the API will page through
+# for a single query.
+SEARCH_PAGE_SIZE = 100
+SEARCH_MAX_HITS = 10000
+
+# Earliest year searched when a partitioned search has no year_start.
+EARLIEST_YEAR = 1900
+
 class ImageLibraryModule(APIModule):
     """
     Module for accessing NASA's Image and Video Library API.
@@ -64,6 +76,158 @@ class ImageLibraryModule(APIModule):
         
         return self.request_handler.get(self._build_url("search"), params)
     
+    def iter_search(self, q=None, center=None, description=None, keywords=None,
+                    location=None, media_type=None, nasa_id=None, page=1, year_start=None,
+                    year_end=None, prefetch=2):
+        """
+        Iterate over every search result, following the "next" page links.
+        
+        Pages are fetched on a background thread into a queue holding at
+        most prefetch pages. Once the queue is full the thread waits for
+        the consumer, so a slow consumer applies backpressure instead of
+        letting pages pile up in memory.
+        
+        Args:
+            q (str, optional): Free text search terms.
+            center (str, optional): NASA center that created the media.
+            description (str, optional): Terms to search for in the description field.
+            keywords (str, optional): Terms to search for in the keywords field.
+            location (str, optional): Terms to search for in the location field.
+            media_type (str, optional): Media type to filter results by (image, video, audio).
+            nasa_id (str, optional): The NASA ID of the media.
+            page (int, optional): Page to start from. Default is 1.
+            year_start (int, optional): Starting year for results.
+            year_end (int, optional): Ending year for results.
+            prefetch (int, optional): Number of pages buffered ahead of the
+                consumer. Default is 2.
+                
+        Returns:
+            generator: Items from collection.items, in result order.
+                
+        Raises:
+            NASAAPIError: If a request fails or returns an error.
+        """
+        self._require_blocking_handler()
+        
+        def pages():
+            data = self.search(q=q, center=center, description=description, keywords=keywords,
+                               location=location, media_type=media_type, nasa_id=nasa_id,
+                               page=page, year_start=year_start, year_end=year_end)
+            while True:
+                collection = data.get("collection", {})
+                yield collection.get("items", [])
+                next_url = self._next_link(collection)
+                if next_url is None:
+                    return
+                data = self.request_handler.get(next_url)
+        
+        def items():
+            for page_items in background_iter(pages(), prefetch):
+                yield from page_items
+        
+        return items()
+    
+    def search_partitioned(self, q=None, center=None, description=None, keywords=None,
+                           location=None, media_type=None, year_start=None, year_end=None,
+                           max_hits=SEARCH_MAX_HITS, max_workers=None):
+        """
+        Retrieve every result of a broad search by partitioning it by year.
+        
+        The API stops paging after 10,000 hits, so a broad query cannot be
+        walked to the end. This method splits the year range in halves until
+        every sub-range reports at most max_hits results, then fetches all
+        pages of all sub-ranges concurrently. Items are deduplicated by
+        nasa_id.
+        
+        A single year with more than max_hits results cannot be split further;
+        only its first max_hits results are returned.
+        
+        Args:
+            q (str, optional): Free text search terms.
+            center (str, optional): NASA center that created the media.
+            description (str, optional): Terms to search for in the description field.
+            keywords (str, optional): Terms to search for in the keywords field.
+            location (str, optional): Terms to search for in the location field.
+            media_type (str, optional): Media type to filter results by (image, video, audio).
+            year_start (int, optional): Starting year for results. Default is 1900.
+            year_end (int, optional): Ending year for results. Default is the current year.
+            max_hits (int, optional): Most results a single sub-range may have.
+                Default is 10,000.
+            max_workers (int, optional): Maximum number of pages fetched at once.
+                Default is the request handler's pool_maxsize.
+                
+        Returns:
+            list: Search result items ordered by year range and page.
+                
+        Raises:
+            NASAAPIError: If a request fails or returns an error.
+        """
+        year_start = int(year_start) if year_start is not None else EARLIEST_YEAR
+        year_end = int(year_end) if year_end is not None else date.today().year
+        
+        def fetch(key):
+            (start, end), page = key
+            return self.search(q=q, center=center, description=description, keywords=keywords,
+                               location=location, media_type=media_type, page=page,
+                               year_start=start, year_end=end).get("collection", {})
+        
+        # Split dense ranges level by level, fetching each level's first pages concurrently
+        partitions = []
+        ranges = [(year_start, year_end)]
+        while ranges:
+            first_pages = self._map_concurrently(fetch, [(r, 1) for r in ranges], max_workers)
+            split = []
+            for (start, end), collection in zip(ranges, first_pages):
+                total_hits = collection.get("metadata", {}).get("total_hits", 0)
+                if total_hits > max_hits and start < end:
+                    middle = (start + end) // 2
+                    split.extend([(start, middle), (middle + 1, end)])
+                elif total_hits > 0:
+                    partitions.append(((start, end), min(total_hits, max_hits), collection))
+            ranges = split
+        partitions.sort(key=lambda partition: partition[0])
+        
+        keys = [
+            (year_range, page)
+            for year_range, hits, _ in partitions
+            for page in range(2, math.ceil(hits / SEARCH_PAGE_SIZE) + 1)
+        ]
+        later_pages = dict(zip(keys, self._map_concurrently(fetch, keys, max_workers)))
+        
+        items = []
+        seen = set()
+        for year_range, hits, first_page in partitions:
+            pages = [first_page] + [
+                later_pages[(year_range, page)]
+                for page in range(2, math.ceil(hits / SEARCH_PAGE_SIZE) + 1)
+            ]
+            for collection in pages:
+                for item in collection.get("items", []):
+                    data = item.get("data") or [{}]
+                    nasa_id = data[0].get("nasa_id")
+                    if nasa_id is not None:
+                        if nasa_id in seen:
+                            continue
+                        seen.add(nasa_id)
+                    items.append(item)
+        return items
+    
+    @staticmethod
+    def _next_link(collection):
+        """
+        Find the URL of the next results page.
+        
+        Args:
+            collection (dict): The collection object of a search response.
+            
+        Returns:
+            str: The next page URL, or None on the last page.
+        """
+        for link in collection.get("links", []):
+            if link.get("rel") == "next":
+                return link.get("href")
+        return None
+    
     def get_asset(self, nasa_id):
         """
         Retrieve the media asset's manifest.
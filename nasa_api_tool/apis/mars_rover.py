@@ -4,8 +4,16 @@ Mars Rover Photos API Module
 This module provides access to NASA's Mars Rover Photos API.
 """
 
+import itertools
+import math
+
+from ..concurrency import prefetch_ordered
+from ..state import load_state, save_state
 from .base import APIModule
 
+# Number of photos the API returns per page.
+PHOTOS_PER_PAGE = 25
+
 class MarsRoverModule(APIModule):
     """
     Module for accessing NASA's Mars Rover Photos API.
@@ -43,7 +51,7 @@ class MarsRoverModule(APIModule):
         Raises:
             NASAAPIError: If the request fails or returns an error.
         """
-        if not sol and not earth_date:
+        if sol is None and not earth_date:
             raise ValueError("Either sol or earth_date must be specified")
         
         params = {
@@ -57,6 +65,68 @@ class MarsRoverModule(APIModule):
         
         return self.request_handler.get(self._build_url(f"rovers/{rover}/photos"), params)
     
+    def iter_photos(self, rover, sol=None, earth_date=None, camera=None, max_workers=4):
+        """
+        Iterate over every photo for a rover on a given sol or date.
+        
+        Pages are requested concurrently, max_workers pages ahead of the
+        consumer, and photos are yielded in page order. Iteration stops at
+        the first page with fewer than 25 photos; requests for later pages
+        that have not started yet are cancelled.
+        
+        Args:
+            rover (str): Rover name (curiosity, opportunity, spirit, perseverance).
+            sol (int, optional): Martian sol (day) of the rover's mission.
+                Either sol or earth_date must be specified.
+            earth_date (str, optional): Earth date in YYYY-MM-DD format.
+                Either sol or earth_date must be specified.
+            camera (str, optional): Filter by camera type.
+            max_workers (int, optional): Number of pages fetched at once. Default is 4.
+                
+        Returns:
+            generator: Photo dictionaries in page order.
+                
+        Raises:
+            ValueError: If neither sol nor earth_date is specified.
+            NASAAPIError: If a request fails or returns an error.
+        """
+        if sol is None and not earth_date:
+            raise ValueError("Either sol or earth_date must be specified")
+        self._require_blocking_handler()
+        
+        def fetch(page):
+            return self.get_photos(rover, sol=sol, earth_date=earth_date, camera=camera, page=page)
+        
+        def photos():
+            for _, data in prefetch_ordered(fetch, itertools.count(1), max_workers):
+                page_photos = data.get("photos", [])
+                yield from page_photos
+                if len(page_photos) < PHOTOS_PER_PAGE:
+                    return
+        
+        return photos()
+    
+    def get_all_photos(self, rover, sol=None, earth_date=None, camera=None, max_workers=4):
+        """
+        Get every photo for a rover on a given sol or date.
+        
+        Args:
+            rover (str): Rover name (curiosity, opportunity, spirit, perseverance).
+            sol (int, optional): Martian sol (day) of the rover's mission.
+            earth_date (str, optional): Earth date in YYYY-MM-DD format.
+            camera (str, optional): Filter by camera type.
+            max_workers (int, optional): Number of pages fetched at once. Default is 4.
+                
+        Returns:
+            list: All photo dictionaries in page order.
+                
+        Raises:
+            ValueError: If neither sol nor earth_date is specified.
+            NASAAPIError: If a request fails or returns an error.
+        """
+        return list(self.iter_photos(rover, sol=sol, earth_date=earth_date, camera=camera,
+                                     max_workers=max_workers))
+    
     def get_rover_manifest(self, rover):
         """
         Get mission manifest for a Mars rover.
@@ -71,3 +141,67 @@ class MarsRoverModule(APIModule):
             NASAAPIError: If the request fails or returns an error.
         """
         return self.request_handler.get(self._build_url(f"manifests/{rover}"))
+    
+    def crawl_mission(self, rover, checkpoint_path=None, max_workers=4):
+        """
+        Crawl every photo a rover has taken, sol by sol.
+        
+        The rover manifest lists how many photos each sol has, so sols
+        without photos are skipped and exactly ceil(total_photos / 25) pages
+        are requested for the rest. Pages are fetched concurrently and each
+        sol's photos are yielded once all of its pages have arrived.
+        
+        With a checkpoint file, every completed sol is recorded along with
+        its photo count. A later crawl skips those sols unless the manifest
+        now reports more photos for them, so an interrupted crawl resumes
+        where it stopped and a repeated crawl only fetches new sols. A sol
+        is recorded only after the consumer asks for the next one, so a sol
+        whose processing was interrupted is crawled again.
+        
+        Args:
+            rover (str): Rover name (curiosity, opportunity, spirit, perseverance).
+            checkpoint_path (str, optional): Path to a JSON checkpoint file.
+                If None, every sol with photos is crawled.
+            max_workers (int, optional): Number of pages fetched at once. Default is 4.
+                
+        Returns:
+            generator: (sol, photos) tuples in sol order.
+                
+        Raises:
+            NASAAPIError: If a request fails or returns an error.
+        """
+        self._require_blocking_handler()
+        manifest = self.get_rover_manifest(rover).get("photo_manifest", {})
+        checkpoint = {"rover": rover, "sols": {}}
+        if checkpoint_path is not None:
+            checkpoint = load_state(checkpoint_path, checkpoint)
+        done = checkpoint.setdefault("sols", {})
+        
+        pending = {}
+        for entry in manifest.get("photos", []):
+            sol, total = entry["sol"], entry.get("total_photos", 0)
+            if total > 0 and done.get(str(sol)) != total:
+                pending[sol] = total
+        
+        def fetch(key):
+            sol, page = key
+            return self.get_photos(rover, sol=sol, page=page).get("photos", [])
+        
+        def crawl():
+            pages = [
+                (sol, page)
+                for sol in sorted(pending)
+                for page in range(1, math.ceil(pending[sol] / PHOTOS_PER_PAGE) + 1)
+            ]
+            photos = []
+            for (sol, page), page_photos in prefetch_ordered(fetch, pages, max_workers):
+                photos.extend(page_photos)
+                if page < math.ceil(pending[sol] / PHOTOS_PER_PAGE):
+                    continue
+                yield sol, photos
+                photos = []
+                done[str(sol)] = pending[sol]
+                if checkpoint_path is not None:
+                    save_state(checkpoint_path, checkpoint)
+        
+        return crawl()
@@ -6,6 +6,50 @@ This module provides access to NASA's SSD/CNEOS API.
 
 from .base import APIModule
 
+# Month abbreviations used in close-approach dates ("2020-Jan-01 12:00").
+_MONTHS = {
+    name: f"{number:02d}"
+    for number, name in enumerate(
+        ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1
+    )
+}
+
+def _split_rows(response, date_field, to_day):
+    """
+    Split an SSD/CNEOS table response into (day, row) pairs for a range cache.
+    
+    Args:
+        response (dict): The response, with "fields" and "data".
+        date_field (str): Name of the date column.
+        to_day (callable): Converts a date value to YYYY-MM-DD.
+        
+    Returns:
+        tuple: (pairs, meta), where meta is the response without its rows.
+    """
+    meta = {k: v for k, v in response.items() if k not in ("count", "data")}
+    fields = response.get("fields") or []
+    if date_field not in fields:
+        return [], meta
+    index = fields.index(date_field)
+    return [(to_day(row[index]), row) for row in response.get("data") or []], meta
+
+def _build_rows(rows, meta):
+    """
+    Build an SSD/CNEOS table response from range-cached rows.
+    
+    Returns:
+        dict: The response, with "count" as a string like the API reports it.
+    """
+    response = dict(meta or {})
+    response["count"] = str(len(rows))
+    if rows:
+        response["data"] = rows
+    return response
+
+def _cad_day(value):
+    year, month, rest = value.split("-", 2)
+    return f"{year}-{_MONTHS.get(month, month)}-{rest[:2]}"
+
 class SSDCNEOSModule(APIModule):
     """
     Module for accessing NASA's SSD/CNEOS API.
@@ -93,6 +137,13 @@ class SSDCNEOSModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
+        # A range cache can only serve complete, date-sorted results
+        if limit is None and sort == "date" and format == "json":
+            return self._get_date_range(
+                self._build_url("cad.api"), params, "date-min", "date-max",
+                lambda response: _split_rows(response, "cd", _cad_day), _build_rows,
+                exclusive_end=True
+            )
         return self.request_handler.get(self._build_url("cad.api"), params)
     
     def get_fireball(self, date_min=None, date_max=None, energy_min=None, energy_max=None,
@@ -143,6 +194,13 @@ class SSDCNEOSModule(APIModule):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
+        # A range cache can only serve complete, date-sorted results
+        if limit is None and sort == "date" and format == "json":
+            return self._get_date_range(
+                self._build_url("fireball.api"), params, "date-min", "date-max",
+                lambda response: _split_rows(response, "date", lambda value: value[:10]), _build_rows,
+                exclusive_end=True
+            )
         return self.request_handler.get(self._build_url("fireball.api"), params)
     
     def get_sentry(self, spk=None, des=None, h_min=None, h_max=None, ps_min=None,
@@ -0,0 +1,92 @@
+"""
+Asynchronous NASA API Client
+
+This module provides an asyncio-based client class for accessing NASA APIs.
+"""
+
+import asyncio
+
+from .async_request_handler import AsyncRequestHandler
+from .client import NASAClient
+from .request_handler import DEFAULT_TIMEOUT
+
+class AsyncNASAClient(NASAClient):
+    """
+    Asynchronous client class for accessing NASA APIs.
+    
+    This class exposes the same API modules as NASAClient, but every module
+    method returns an awaitable. Requests run on the event loop through a
+    shared aiohttp session, so many of them can be in flight at once:
+    
+        async with AsyncNASAClient(api_key) as client:
+            apod, cme = await asyncio.gather(
+                client.apod.get_astronomy_picture(),
+                client.donki.get_coronal_mass_ejection(),
+            )
+    
+    Requires the optional aiohttp dependency (pip install nasa_api_tool[async]).
+    """
+    
+    request_handler_class = AsyncRequestHandler
+    
+    def __init__(self, api_key=None, cache=None, store=None, rate_limiter=None, retry_policy=None,
+                 timeout=DEFAULT_TIMEOUT, max_connections=100):
+        """
+        Initialize the asynchronous NASA API client.
+        
+        Args:
+            api_key (str, optional): NASA API key. If None, uses "DEMO_KEY".
+            cache (ResponseCache, optional): Response cache shared by all API
+                modules. If None, responses are not cached.
+            store (ResponseStore, optional): Persistent response store that
+                survives restarts. If None, responses are not persisted.
+            rate_limiter (RateLimiter, optional): Client-side rate limiter that
+                throttles requests per host and API key. If None, requests
+                are not throttled.
+            retry_policy (RetryPolicy, optional): Policy for retrying transient
+                failures with backoff. If None, failed requests are not retried.
+            timeout (float or tuple, optional): Connect and read timeout in
+                seconds. Default is (10, 120).
+            max_connections (int, optional): Maximum number of simultaneous
+                connections. Default is 100.
+        """
+        super().__init__(
+            api_key, cache=cache, store=store, rate_limiter=rate_limiter,
+            retry_policy=retry_policy, timeout=timeout, max_connections=max_connections
+        )
+    
+    async def batch(self, calls, max_workers=None, return_exceptions=True):
+        """
+        Run several API calls concurrently on the event loop.
+        
+        Each call is a callable taking no arguments that returns an
+        awaitable, usually built with functools.partial.
+        
+        Args:
+            calls (list): Deferred API calls.
+            max_workers (int, optional): Maximum number of calls in flight.
+                Default is max_connections.
+            return_exceptions (bool, optional): If True, a failed call's exception
+                is returned in its slot. If False, the first exception is raised.
+                Default is True.
+                
+        Returns:
+            list: One result (or exception) per call, in the order of calls.
+        """
+        semaphore = asyncio.Semaphore(max_workers or self.request_handler.max_connections)
+        
+        async def run(call):
+            async with semaphore:
+                return await call()
+        
+        return await asyncio.gather(*(run(call) for call in calls), return_exceptions=return_exceptions)
+    
+    async def close(self):
+        """Close the underlying HTTP session."""
+        await self.request_handler.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,216 @@
+"""
+Asynchronous request handler for NASA API requests.
+
+This module handles HTTP requests to NASA APIs on an asyncio event loop
+using aiohttp, so that many requests can be in flight at once.
+"""
+
+import asyncio
+import json
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .cache import ResponseCache
+from .exceptions import NASAAPIError
+from .request_handler import DEFAULT_TIMEOUT, RequestHandler
+
+class AsyncRequestHandler(RequestHandler):
+    """
+    Handles HTTP requests to NASA APIs using asyncio.
+
+    This class has the same interface as RequestHandler, except that get()
+    is a coroutine. API modules return its result directly, so every module
+    method becomes awaitable when backed by this handler. The response
+    cache and persistent store work exactly as they do for RequestHandler.
+    """
+
+    def __init__(self, api_key, cache=None, store=None, rate_limiter=None, retry_policy=None,
+                 timeout=DEFAULT_TIMEOUT, max_connections=100):
+        """
+        Initialize the AsyncRequestHandler with an API key.
+
+        Args:
+            api_key (str): NASA API key. If None, uses "DEMO_KEY".
+            cache (ResponseCache, optional): Cache for successful responses.
+            store (ResponseStore, optional): Persistent store for successful responses.
+            rate_limiter (RateLimiter, optional): Client-side rate limiter. Throttled
+                requests wait on the event loop without blocking other tasks.
+            retry_policy (RetryPolicy, optional): Policy for retrying transient failures.
+            timeout (float or tuple, optional): Connect and read timeout in seconds,
+                either one number or a (connect, read) tuple. Default is (10, 120).
+            max_connections (int, optional): Maximum number of simultaneous
+                connections across all hosts. Default is 100.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncRequestHandler requires aiohttp. "
+                "Install it with: pip install nasa_api_tool[async]"
+            )
+        self.max_connections = max_connections
+        super().__init__(api_key, cache=cache, store=store, rate_limiter=rate_limiter,
+                         retry_policy=retry_policy, timeout=timeout)
+
+    def _create_session(self):
+        """
+        Defer session creation until the first request.
+
+        An aiohttp session must be created inside a running event loop.
+
+        Returns:
+            None
+        """
+        return None
+
+    def _get_session(self):
+        """
+        Get the aiohttp session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: The session.
+        """
+        if self.session is None or self.session.closed:
+            connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read),
+            )
+        return self.session
+
+    @staticmethod
+    def _encode_params(params):
+        """
+        Convert query parameters to strings the way requests does.
+
+        Args:
+            params (dict): Query parameters.
+
+        Returns:
+            dict: Query parameters with string values.
+        """
+        return {k: str(v) for k, v in params.items() if v is not None}
+
+    async def get(self, url, params=None):
+        """
+        Make a GET request to the specified URL.
+
+        Args:
+            url (str): The URL to request.
+            params (dict, optional): Query parameters to include in the request.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            NASAAPIError: If the request fails or returns an error.
+        """
+        params = dict(params or {})
+
+        cache_key = None
+        if self.cache is not None or self.store is not None:
+            cache_key = ResponseCache.make_key(url, params)
+
+        hit, value, stale, stored = self._lookup(cache_key)
+        if hit:
+            return value
+
+        # Add API key to parameters
+        params["api_key"] = self.api_key
+
+        status, headers, body = await self._send(
+            "GET", url, params=self._encode_params(params), headers=self._conditional_headers(stale or stored)
+        )
+
+        try:
+            if status == 304 and (stale is not None or stored is not None):
+                return self._revalidated(cache_key, stale, stored)
+            if status >= 400:
+                raise NASAAPIError(self._error_message(status, body.decode("utf-8", "replace")))
+            data = json.loads(body)
+        except ValueError:
+            # Handle JSON parsing errors
+            raise NASAAPIError("Invalid response format")
+
+        if cache_key is not None:
+            self._save(cache_key, body, headers, data)
+        return data
+
+    def download(self, url, path, params=None, chunk_size=None, overwrite=False):
+        """
+        Not supported; file downloads require the blocking RequestHandler.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("Downloads require NASAClient rather than AsyncNASAClient")
+
+    def send(self, method, url, params=None, data=None, stream=False, allow_redirects=True):
+        """
+        Not supported; raw requests require the blocking RequestHandler.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("Raw requests require NASAClient rather than AsyncNASAClient")
+
+    async def _send(self, method, url, **kwargs):
+        """
+        Send a request, applying rate limiting and the retry policy.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            **kwargs: Keyword arguments passed to aiohttp.ClientSession.request().
+
+        Returns:
+            tuple: (status, headers, body) of the final response. Error statuses
+                are returned as-is once the retry policy gives up.
+
+        Raises:
+            NASAAPIError: If the connection fails and is not retried.
+        """
+        # Count the request once, so retries do not refill the retry budget
+        if self.retry_policy is not None:
+            self.retry_policy.record_request(url)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(url, self.api_key)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    status, headers = response.status, response.headers
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = None
+                if self.retry_policy is not None:
+                    sent = not isinstance(e, aiohttp.ClientConnectorError)
+                    delay = self.retry_policy.next_delay(url, method, attempt, sent=sent)
+                if delay is None:
+                    # Handle connection errors
+                    raise NASAAPIError(f"Request failed: {str(e) or type(e).__name__}")
+            else:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(url, self.api_key, headers, status)
+                if status < 400 or self.retry_policy is None:
+                    return status, headers, body
+                delay = self.retry_policy.next_delay(
+                    url, method, attempt, status_code=status, retry_after=headers.get("Retry-After")
+                )
+                if delay is None:
+                    return status, headers, body
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def close(self):
+        """Close the underlying aiohttp session."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
@@ -0,0 +1,451 @@
+"""
+Response cache for NASA API requests.
+
+This module provides an in-memory LRU cache with per-endpoint TTLs and an
+optional persistent SQLite store that the RequestHandler uses to avoid
+sending identical requests over the wire.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+
+def _ttl_for(ttls, default_ttl, url):
+    """
+    Resolve the TTL for a URL from a mapping of URL prefixes.
+
+    Args:
+        ttls (dict): Mapping of URL prefixes to TTLs in seconds.
+        default_ttl (float): TTL used when no prefix matches.
+        url (str): The request URL.
+
+    Returns:
+        float: The TTL in seconds. The longest matching prefix wins.
+    """
+    best = None
+    for prefix in ttls:
+        if url.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return ttls[best] if best is not None else default_ttl
+
+
+class CacheEntry:
+    """
+    A single cached response.
+
+    Attributes:
+        value: The decoded response payload.
+        size (int): Approximate size of the response body in bytes.
+        expires_at (float): Monotonic time after which the entry is stale.
+        etag (str): ETag validator sent by the server, if any.
+        last_modified (str): Last-Modified validator sent by the server, if any.
+    """
+
+    __slots__ = ("value", "size", "expires_at", "etag", "last_modified")
+
+    def __init__(self, value, size, expires_at, etag=None, last_modified=None):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now=None):
+        """
+        Check whether the entry is still within its TTL.
+
+        Args:
+            now (float, optional): Monotonic time to compare against.
+                Default is the current time.
+
+        Returns:
+            bool: True if the entry has not expired.
+        """
+        if now is None:
+            now = time.monotonic()
+        return now < self.expires_at
+
+    def has_validators(self):
+        """
+        Check whether the entry can be revalidated with a conditional request.
+
+        Returns:
+            bool: True if the entry has an ETag or Last-Modified value.
+        """
+        return bool(self.etag or self.last_modified)
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory LRU cache for API responses.
+
+    The cache is bounded both by the number of entries and by the total
+    size of the cached response bodies. When either bound is exceeded the
+    least recently used entries are evicted.
+
+    Stale entries that carry an ETag or Last-Modified validator are kept
+    until they are evicted so that they can be revalidated cheaply.
+
+    Cached payloads are shared between callers and should be treated as
+    read-only.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, default_ttl=300, ttls=None):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached responses.
+                Default is 1024.
+            max_bytes (int, optional): Maximum total size of cached response
+                bodies in bytes. Default is 64 MiB.
+            default_ttl (float, optional): Time to live in seconds for endpoints
+                without an explicit TTL. Default is 300.
+            ttls (dict, optional): Mapping of URL prefixes to TTLs in seconds,
+                e.g. {"https://api.nasa.gov/EPIC/api/": 3600}. The longest
+                matching prefix wins. A TTL of 0 disables caching for that
+                endpoint.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url, params=None):
+        """
+        Build the canonical cache key for a request.
+
+        Args:
+            url (str): The request URL.
+            params (dict, optional): Query parameters. The api_key parameter
+                is ignored so that entries are shared across keys.
+
+        Returns:
+            tuple: The cache key.
+        """
+        items = tuple(sorted(
+            (str(k), str(v)) for k, v in (params or {}).items() if k != "api_key"
+        ))
+        return (url, items)
+
+    def ttl_for(self, url):
+        """
+        Get the TTL that applies to a URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            float: The TTL in seconds.
+        """
+        return _ttl_for(self.ttls, self.default_ttl, url)
+
+    def set_ttl(self, url_prefix, ttl):
+        """
+        Set the TTL for all URLs starting with the given prefix.
+
+        Args:
+            url_prefix (str): URL prefix, e.g. "https://api.nasa.gov/planetary/apod".
+            ttl (float): Time to live in seconds. 0 disables caching.
+        """
+        with self._lock:
+            self.ttls[url_prefix] = ttl
+
+    def get(self, key):
+        """
+        Look up a fresh cached value.
+
+        Args:
+            key (tuple): Cache key from make_key().
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.is_fresh():
+                if entry is not None and not entry.has_validators():
+                    self._remove(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def get_stale(self, key):
+        """
+        Look up an expired entry that can still be revalidated.
+
+        Args:
+            key (tuple): Cache key from make_key().
+
+        Returns:
+            CacheEntry: The entry, or None if there is no entry with validators.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.has_validators():
+                return None
+            return entry
+
+    def set(self, key, value, size, ttl=None, etag=None, last_modified=None):
+        """
+        Store a value in the cache.
+
+        Args:
+            key (tuple): Cache key from make_key().
+            value: The decoded response payload.
+            size (int): Size of the response body in bytes.
+            ttl (float, optional): Time to live in seconds. Default is the
+                TTL configured for the key's URL.
+            etag (str, optional): ETag validator for revalidation.
+            last_modified (str, optional): Last-Modified validator for revalidation.
+        """
+        if ttl is None:
+            ttl = self.ttl_for(key[0])
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(value, size, time.monotonic() + ttl, etag, last_modified)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Hit, miss and eviction counters along with current usage.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+class StoredResponse:
+    """
+    A response body loaded from a persistent ResponseStore.
+
+    Attributes:
+        body (bytes): The raw response body.
+        expires_at (float): Unix time after which the response is stale.
+        etag (str): ETag validator sent by the server, if any.
+        last_modified (str): Last-Modified validator sent by the server, if any.
+    """
+
+    __slots__ = ("body", "expires_at", "etag", "last_modified")
+
+    def __init__(self, body, expires_at, etag=None, last_modified=None):
+        self.body = body
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now=None):
+        """
+        Check whether the response is still within its TTL.
+
+        Args:
+            now (float, optional): Unix time to compare against.
+                Default is the current time.
+
+        Returns:
+            bool: True if the response has not expired.
+        """
+        if now is None:
+            now = time.time()
+        return now < self.expires_at
+
+    def has_validators(self):
+        """
+        Check whether the response can be revalidated with a conditional request.
+
+        Returns:
+            bool: True if the response has an ETag or Last-Modified value.
+        """
+        return bool(self.etag or self.last_modified)
+
+
+class ResponseStore:
+    """
+    Persistent response store backed by SQLite.
+
+    Response bodies are stored zlib-compressed together with their ETag and
+    Last-Modified validators, so that they survive process restarts and can
+    be revalidated with a conditional request once they go stale. The
+    database runs in WAL mode so several worker processes can share it.
+    """
+
+    def __init__(self, path, default_ttl=3600, ttls=None, compression_level=6):
+        """
+        Open (or create) a response store.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            default_ttl (float, optional): Time to live in seconds for endpoints
+                without an explicit TTL. Default is 3600.
+            ttls (dict, optional): Mapping of URL prefixes to TTLs in seconds.
+                The longest matching prefix wins. A TTL of 0 disables
+                persistence for that endpoint.
+            compression_level (int, optional): zlib compression level. Default is 6.
+        """
+        self.path = path
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT NOT NULL, body BLOB NOT NULL, "
+            "etag TEXT, last_modified TEXT, expires_at REAL NOT NULL, "
+            "stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _encode_key(key):
+        return json.dumps(key, separators=(",", ":"))
+
+    def ttl_for(self, url):
+        """
+        Get the TTL that applies to a URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            float: The TTL in seconds.
+        """
+        return _ttl_for(self.ttls, self.default_ttl, url)
+
+    def load(self, key):
+        """
+        Load a stored response.
+
+        Args:
+            key (tuple): Cache key from ResponseCache.make_key().
+
+        Returns:
+            StoredResponse: The stored response (fresh or stale), or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at, etag, last_modified FROM responses WHERE key = ?",
+                (self._encode_key(key),),
+            ).fetchone()
+        if row is None:
+            return None
+        body, expires_at, etag, last_modified = row
+        return StoredResponse(zlib.decompress(body), expires_at, etag, last_modified)
+
+    def save(self, key, body, etag=None, last_modified=None, ttl=None):
+        """
+        Store a response body.
+
+        Args:
+            key (tuple): Cache key from ResponseCache.make_key().
+            body (bytes): The raw response body.
+            etag (str, optional): ETag validator for revalidation.
+            last_modified (str, optional): Last-Modified validator for revalidation.
+            ttl (float, optional): Time to live in seconds. Default is the
+                TTL configured for the key's URL.
+        """
+        if ttl is None:
+            ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, etag, last_modified, expires_at, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._encode_key(key), key[0], zlib.compress(body, self.compression_level),
+                 etag, last_modified, now + ttl, now),
+            )
+            self._conn.commit()
+
+    def touch(self, key, ttl=None):
+        """
+        Extend the lifetime of a stored response after a successful revalidation.
+
+        Args:
+            key (tuple): Cache key from ResponseCache.make_key().
+            ttl (float, optional): Time to live in seconds. Default is the
+                TTL configured for the key's URL.
+        """
+        if ttl is None:
+            ttl = self.ttl_for(key[0])
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?",
+                (time.time() + ttl, self._encode_key(key)),
+            )
+            self._conn.commit()
+
+    def purge(self, older_than=None):
+        """
+        Delete stored responses.
+
+        Args:
+            older_than (float, optional): Only delete responses stored more than
+                this many seconds ago. Default deletes everything.
+
+        Returns:
+            int: The number of deleted responses.
+        """
+        with self._lock:
+            if older_than is None:
+                cursor = self._conn.execute("DELETE FROM responses")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE stored_at < ?", (time.time() - older_than,)
+                )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
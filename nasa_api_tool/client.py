@@ -4,6 +4,7 @@ NASA API Client
 This module provides the main client class for accessing NASA APIs.
 """
 
+from .concurrency import default_max_workers, run_concurrently
 from .request_handler import RequestHandler
 from .apis.apod import APODModule
 from .apis.asteroids import AsteroidsModule
@@ -26,15 +27,38 @@ class NASAClient:
     This class provides access to all NASA API modules and handles authentication.
     """
     
-    def __init__(self, api_key=None):
+    request_handler_class = RequestHandler
+    
+    def __init__(self, api_key=None, cache=None, store=None, rate_limiter=None, retry_policy=None,
+                 range_cache=None, **handler_options):
         """
         Initialize the NASA API client.
         
         Args:
             api_key (str, optional): NASA API key. If None, uses "DEMO_KEY".
+            cache (ResponseCache, optional): Response cache shared by all API
+                modules. If None, responses are not cached.
+            store (ResponseStore, optional): Persistent response store that
+                survives restarts. If None, responses are not persisted.
+            rate_limiter (RateLimiter, optional): Client-side rate limiter that
+                throttles requests per host and API key. If None, requests
+                are not throttled.
+            retry_policy (RetryPolicy, optional): Policy for retrying transient
+                failures with backoff. If None, failed requests are not retried.
+            range_cache (RangeCache, optional): Cache for date-ranged queries
+                (DONKI, APOD ranges, the asteroid feed, close approaches and
+                fireballs) that fetches only the days not seen before. If
+                None, these queries are sent as they are.
+            **handler_options: Additional keyword arguments passed to the
+                request handler, such as timeout, pool_maxsize and pool_sizes.
+                To share one client between many threads, set pool_maxsize
+                to at least the number of threads.
         """
         self.api_key = api_key or "DEMO_KEY"
-        self.request_handler = RequestHandler(self.api_key)
+        self.request_handler = self.request_handler_class(
+            self.api_key, cache=cache, store=store, rate_limiter=rate_limiter,
+            retry_policy=retry_policy, **handler_options
+        )
         
         # Initialize API modules
         self.apod = APODModule(self.request_handler)
@@ -50,6 +74,10 @@ class NASAClient:
         self.tech_transfer = TechTransferModule(self.request_handler)
         self.ssc = SatelliteSituationCenterModule(self.request_handler)
         self.ssd_cneos = SSDCNEOSModule(self.request_handler)
+        
+        if range_cache is not None:
+            for module in (self.apod, self.asteroids, self.donki, self.ssd_cneos):
+                module.range_cache = range_cache
     
     def set_api_key(self, api_key):
         """
@@ -60,3 +88,36 @@ class NASAClient:
         """
         self.api_key = api_key
         self.request_handler.api_key = api_key
+    
+    def batch(self, calls, max_workers=None, return_exceptions=True):
+        """
+        Run several API calls concurrently.
+        
+        Each call is a callable taking no arguments, usually built with
+        functools.partial:
+        
+            results = client.batch([
+                partial(client.donki.get_coronal_mass_ejection, start_date="2023-01-01"),
+                partial(client.donki.get_geomagnetic_storm, start_date="2023-01-01"),
+                partial(client.ssd_cneos.get_sentry),
+            ])
+        
+        Args:
+            calls (list): Deferred API calls.
+            max_workers (int, optional): Maximum number of calls in flight.
+                Default is the request handler's pool_maxsize.
+            return_exceptions (bool, optional): If True, a failed call's exception
+                is returned in its slot. If False, the first exception is raised.
+                Default is True.
+                
+        Returns:
+            list: One result (or exception) per call, in the order of calls.
+        """
+        if max_workers is None:
+            max_workers = default_max_workers(self.request_handler)
+        return run_concurrently(calls, max_workers, return_exceptions)
+    
+    @property
+    def cache(self):
+        """ResponseCache: The response cache shared by all modules, or None."""
+        return self.request_handler.cache
@@ -0,0 +1,382 @@
+"""
+Columnar decoding of tabular NASA API results.
+
+This module stream-parses CSV, TSV and VOTable results into typed columns
+backed by the standard library's array module. A table of numbers then
+takes 8 bytes per value instead of one Python object per value and one
+dict per row, and converts cheaply to a NumPy structured array.
+"""
+
+import codecs
+import csv
+import math
+import xml.etree.ElementTree as ElementTree
+from array import array
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+from .exceptions import NASAAPIError
+
+
+# Column kinds and the array typecodes that store them. String columns are lists.
+KIND_TYPECODES = {"int": "q", "float": "d", "bool": "b"}
+
+# NumPy dtypes of the column kinds, except strings, which are sized to fit.
+KIND_DTYPES = {"int": "i8", "float": "f8", "bool": "?"}
+
+# VOTable datatypes and the column kinds they map to.
+VOTABLE_KINDS = {
+    "boolean": "bool",
+    "bit": "int",
+    "unsignedByte": "int",
+    "short": "int",
+    "int": "int",
+    "long": "int",
+    "float": "float",
+    "double": "float",
+    "char": "str",
+    "unicodeChar": "str",
+}
+
+_TRUE = frozenset(["t", "true", "1", "y", "yes"])
+_FALSE = frozenset(["f", "false", "0", "n", "no"])
+
+
+class _ColumnBuilder:
+    """
+    Accumulates the text values of one column into a typed container.
+
+    With inference, a column starts as int and is promoted to float, then
+    to str, when a value does not fit. Numeric columns store missing
+    values as NaN, so an int column with missing values becomes float.
+    """
+
+    __slots__ = ("kind", "values", "infer")
+
+    def __init__(self, kind=None):
+        self.infer = kind is None
+        self.kind = kind or "int"
+        self.values = array(KIND_TYPECODES[self.kind]) if self.kind in KIND_TYPECODES else []
+
+    def append(self, text):
+        kind = self.kind
+        if kind == "str":
+            self.values.append(text)
+            return
+        text = text.strip()
+        try:
+            if not text:
+                if kind != "float":
+                    self._promote("float")
+                self.values.append(math.nan)
+            elif kind == "int":
+                self.values.append(int(text))
+            elif kind == "float":
+                self.values.append(float(text))
+            else:
+                lowered = text.lower()
+                if lowered not in _TRUE and lowered not in _FALSE:
+                    raise ValueError(text)
+                self.values.append(lowered in _TRUE)
+        except (ValueError, OverflowError):
+            if kind == "int" and self._can_parse_float(text):
+                self._promote("float")
+            elif self.infer or kind == "bool":
+                self._promote("str")
+            else:
+                raise ValueError(f"Cannot store {text!r} in a {kind} column")
+            self.append(text)
+
+    @staticmethod
+    def _can_parse_float(text):
+        try:
+            float(text)
+        except ValueError:
+            return False
+        return True
+
+    def _promote(self, kind):
+        if kind == "float":
+            self.values = array("d", (float(value) for value in self.values))
+        else:
+            self.values = [_format_value(value) for value in self.values]
+        self.kind = kind
+
+
+class ColumnarTable:
+    """
+    A table stored column by column.
+
+    Numeric columns are array.array objects (int64 "q", float64 "d" or
+    boolean "b"); string columns are lists. Missing numeric values are NaN.
+
+    Attributes:
+        names (list): Column names, in table order.
+        columns (dict): Mapping of column names to their values.
+        kinds (dict): Mapping of column names to "int", "float", "bool" or "str".
+    """
+
+    def __init__(self, names, columns, kinds):
+        """
+        Initialize a table from decoded columns.
+
+        Args:
+            names (list): Column names, in table order.
+            columns (dict): Mapping of column names to arrays or lists of equal length.
+            kinds (dict): Mapping of column names to column kinds.
+        """
+        self.names = list(names)
+        self.columns = columns
+        self.kinds = kinds
+
+    def __len__(self):
+        return len(self.columns[self.names[0]]) if self.names else 0
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __iter__(self):
+        """Iterate over the rows as tuples, in column order."""
+        return zip(*(self.columns[name] for name in self.names))
+
+    def to_dicts(self):
+        """
+        Convert the table to one dict per row, like a JSON result.
+
+        Returns:
+            list: The rows.
+        """
+        return [dict(zip(self.names, row)) for row in self]
+
+    def to_numpy(self):
+        """
+        Convert the table to a NumPy structured array.
+
+        Numeric columns are copied straight from their buffers. String
+        columns become fixed-width unicode fields sized to the longest value.
+
+        Returns:
+            numpy.ndarray: A structured array with one field per column.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError(
+                "ColumnarTable.to_numpy() requires NumPy. "
+                "Install it with: pip install nasa_api_tool[numpy]"
+            )
+        dtype = []
+        for name in self.names:
+            kind = self.kinds[name]
+            if kind == "str":
+                width = max((len(value) for value in self.columns[name]), default=1)
+                dtype.append((name, f"U{max(width, 1)}"))
+            else:
+                dtype.append((name, KIND_DTYPES[kind]))
+        table = numpy.empty(len(self), dtype=dtype)
+        for name in self.names:
+            values = self.columns[name]
+            if self.kinds[name] == "str":
+                table[name] = values
+            elif self.kinds[name] == "bool":
+                table[name] = numpy.frombuffer(values, dtype="i1").astype(bool)
+            else:
+                table[name] = numpy.frombuffer(values, dtype=KIND_DTYPES[self.kinds[name]])
+        return table
+
+    def __repr__(self):
+        return f"ColumnarTable({len(self)} rows, columns={self.names!r})"
+
+
+def iter_text_lines(chunks, encoding="utf-8"):
+    """
+    Split a stream of byte chunks into text lines, keeping line endings.
+
+    Args:
+        chunks (iterable): Byte strings, e.g. from Response.iter_content().
+        encoding (str, optional): Text encoding. Default is "utf-8".
+
+    Yields:
+        str: Lines of text, each with its line ending.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.splitlines(True)
+        # The last piece may be an incomplete line
+        pending = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def parse_delimited(lines, delimiter=",", kinds=None):
+    """
+    Parse CSV or TSV text into a columnar table.
+
+    Column kinds are inferred from the values unless given.
+
+    Args:
+        lines (iterable): Lines of text with their line endings, e.g. from
+            iter_text_lines(). The first line holds the column names.
+        delimiter (str, optional): Field delimiter, "," or "\\t". Default is ",".
+        kinds (dict, optional): Mapping of column names to "int", "float",
+            "bool" or "str", overriding inference.
+
+    Returns:
+        ColumnarTable: The table.
+
+    Raises:
+        NASAAPIError: If a row has the wrong number of fields.
+    """
+    kinds = kinds or {}
+    reader = csv.reader(lines, delimiter=delimiter)
+    names = next(reader, [])
+    builders = [_ColumnBuilder(kinds.get(name)) for name in names]
+    appenders = [builder.append for builder in builders]
+    try:
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(appenders):
+                raise NASAAPIError(
+                    f"Malformed table row {reader.line_num}: expected {len(appenders)} fields, got {len(row)}"
+                )
+            for append, value in zip(appenders, row):
+                append(value)
+    except (csv.Error, ValueError) as e:
+        raise NASAAPIError(f"Invalid table data: {e}")
+    return _table(names, builders)
+
+
+def parse_votable(chunks, kinds=None):
+    """
+    Parse a VOTable with TABLEDATA serialization into a columnar table.
+
+    Column kinds are taken from the FIELD datatypes. Array-valued fields
+    are kept as strings. The XML is parsed incrementally and each row is
+    discarded once it has been stored.
+
+    Args:
+        chunks (iterable): Byte strings of the document.
+        kinds (dict, optional): Mapping of column names to column kinds,
+            overriding the declared datatypes.
+
+    Returns:
+        ColumnarTable: The first table in the document.
+
+    Raises:
+        NASAAPIError: If the document is malformed, reports an error, or
+            uses a binary serialization.
+    """
+    kinds = kinds or {}
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    names = []
+    builders = []
+    row = []
+    rows = None
+    in_table = False
+    done = False
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                tag = element.tag.rsplit("}", 1)[-1]
+                if event == "start":
+                    if tag == "TABLE":
+                        in_table = not done
+                    elif tag == "TABLEDATA":
+                        rows = element
+                    continue
+                if not in_table:
+                    if tag == "INFO" and element.get("name") == "QUERY_STATUS" and element.get("value") == "ERROR":
+                        raise NASAAPIError(f"Query failed: {(element.text or '').strip()}")
+                    continue
+                if tag == "FIELD":
+                    name = element.get("name")
+                    kind = kinds.get(name)
+                    if kind is None:
+                        arraysize = element.get("arraysize")
+                        kind = VOTABLE_KINDS.get(element.get("datatype"), "str")
+                        if kind != "str" and arraysize not in (None, "1"):
+                            kind = "str"
+                    names.append(name)
+                    builders.append(_ColumnBuilder(kind))
+                elif tag == "TD":
+                    row.append(element.text or "")
+                elif tag == "TR":
+                    if len(row) != len(builders):
+                        raise NASAAPIError(f"Malformed table row: expected {len(builders)} fields, got {len(row)}")
+                    for builder, value in zip(builders, row):
+                        builder.append(value)
+                    row = []
+                    # Drop the parsed row so the document never builds up in memory
+                    if rows is not None:
+                        rows.clear()
+                elif tag in ("BINARY", "BINARY2", "FITS"):
+                    raise NASAAPIError(f"Unsupported VOTable serialization: {tag}")
+                elif tag == "TABLE":
+                    in_table = False
+                    done = True
+        parser.close()
+    except ElementTree.ParseError as e:
+        raise NASAAPIError(f"Invalid VOTable: {e}")
+    except ValueError as e:
+        raise NASAAPIError(f"Invalid VOTable value: {e}")
+    return _table(names, builders)
+
+
+def decode_table(chunks, format, kinds=None):
+    """
+    Decode a tabular result in any supported text format.
+
+    Args:
+        chunks (iterable): Byte strings of the result.
+        format (str): "csv", "tsv" or "votable".
+        kinds (dict, optional): Mapping of column names to column kinds.
+
+    Returns:
+        ColumnarTable: The table.
+
+    Raises:
+        ValueError: If the format is not supported.
+        NASAAPIError: If the result is malformed.
+    """
+    if format == "csv":
+        return parse_delimited(iter_text_lines(chunks), ",", kinds)
+    if format == "tsv":
+        return parse_delimited(iter_text_lines(chunks), "\t", kinds)
+    if format == "votable":
+        return parse_votable(chunks, kinds)
+    raise ValueError(f"Unsupported table format: {format}")
+
+
+def _format_value(value):
+    """
+    Turn a parsed value back into text when its column is promoted to str.
+
+    Whole floats lose their ".0", since they usually come from an int
+    column that was promoted to float by a missing value.
+    """
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if value.is_integer() and abs(value) < 2 ** 53:
+            return str(int(value))
+        return repr(value)
+    return str(value)
+
+
+def _table(names, builders):
+    return ColumnarTable(
+        names,
+        {name: builder.values for name, builder in zip(names, builders)},
+        {name: builder.kind for name, builder in zip(names, builders)},
+    )
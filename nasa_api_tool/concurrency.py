@@ -0,0 +1,188 @@
+"""
+Concurrency helpers for NASA API requests.
+
+This module runs independent API calls on a bounded thread pool. It is
+used by NASAClient.batch() and by the bulk helpers of the API modules.
+"""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def default_max_workers(request_handler):
+    """
+    Get a sensible worker count for a request handler.
+
+    Args:
+        request_handler (RequestHandler): The request handler the calls will use.
+
+    Returns:
+        int: The handler's per-host connection pool size, so that workers
+            never wait on the pool.
+    """
+    return getattr(request_handler, "pool_maxsize", None) or 10
+
+
+def run_concurrently(calls, max_workers=10, return_exceptions=True):
+    """
+    Run zero-argument callables concurrently and collect their results in order.
+
+    Args:
+        calls (list): Callables taking no arguments, e.g. functools.partial objects.
+        max_workers (int, optional): Maximum number of calls in flight. Default is 10.
+        return_exceptions (bool, optional): If True, an exception raised by a
+            call is returned in its slot instead of being raised. If False,
+            the first exception (in call order) is raised. Default is True.
+
+    Returns:
+        list: One result (or exception) per call, in the order of calls.
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    if len(calls) == 1 or max_workers <= 1:
+        results = []
+        for call in calls:
+            try:
+                results.append(call())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = [executor.submit(call) for call in calls]
+    results = []
+    for future in futures:
+        error = future.exception()
+        if error is None:
+            results.append(future.result())
+        elif return_exceptions:
+            results.append(error)
+        else:
+            raise error
+    return results
+
+
+def map_concurrently(func, items, max_workers=10):
+    """
+    Apply a function to every item concurrently.
+
+    Args:
+        func (callable): Function taking one item.
+        items (iterable): Items to process.
+        max_workers (int, optional): Maximum number of calls in flight. Default is 10.
+
+    Returns:
+        list: One result per item, in the order of items.
+
+    Raises:
+        Exception: The first exception raised by func, in item order.
+    """
+    return run_concurrently([_bind(func, item) for item in items], max_workers, return_exceptions=False)
+
+
+def prefetch_ordered(func, keys, depth=2):
+    """
+    Call a function for each key in the background and yield results in key order.
+
+    At most depth calls are in flight or waiting to be consumed, so memory
+    stays bounded however long the key sequence is. Calls that have not
+    started yet are cancelled when the generator is closed early.
+
+    Args:
+        func (callable): Function taking one key, e.g. a page number.
+        keys (iterable): Keys in the order results should be yielded. May be
+            infinite, e.g. itertools.count().
+        depth (int, optional): Number of calls to run ahead of the consumer.
+            Default is 2.
+
+    Yields:
+        tuple: (key, result) pairs in key order.
+
+    Raises:
+        Exception: The exception raised by func for the next key, when it is reached.
+    """
+    keys = iter(keys)
+    depth = max(depth, 1)
+    executor = ThreadPoolExecutor(max_workers=depth)
+    pending = deque()
+    try:
+        for key in keys:
+            pending.append((key, executor.submit(func, key)))
+            if len(pending) >= depth:
+                break
+        while pending:
+            key, future = pending.popleft()
+            result = future.result()
+            for next_key in keys:
+                pending.append((next_key, executor.submit(func, next_key)))
+                break
+            yield key, result
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def background_iter(iterable, maxsize=2):
+    """
+    Drive an iterator on a background thread through a bounded queue.
+
+    The producer thread runs ahead of the consumer by at most maxsize items
+    and then blocks, so a slow consumer applies backpressure instead of
+    letting results pile up in memory. Closing the generator stops the
+    producer at its next item.
+
+    Args:
+        iterable (iterable): The iterable to drive, e.g. a page generator.
+        maxsize (int, optional): Maximum number of items buffered ahead of
+            the consumer. Default is 2.
+
+    Yields:
+        The items of iterable, in order.
+
+    Raises:
+        Exception: Any exception raised by the iterable, once the consumer reaches it.
+    """
+    buffer = queue.Queue(maxsize=max(maxsize, 1))
+    stop = threading.Event()
+    end = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except BaseException as e:
+            put((end, e))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _bind(func, item):
+    return lambda: func(item)
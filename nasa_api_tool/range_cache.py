@@ -0,0 +1,337 @@
+"""
+Date range cache for NASA API requests.
+
+Many endpoints answer a query for a date window with one record per event
+or day. This module caches those records by day and remembers which days
+are covered, so that a later query only fetches the days that are missing.
+"""
+
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime
+
+
+class IntervalSet:
+    """
+    A set of integers stored as sorted, disjoint closed intervals.
+
+    Overlapping and adjacent intervals are merged when they are added, so
+    the set always holds the fewest intervals possible. Lookups use binary
+    search over the interval starts.
+    """
+
+    def __init__(self):
+        """Initialize an empty set."""
+        self._starts = []
+        self._ends = []
+
+    def add(self, start, end):
+        """
+        Add the closed interval [start, end].
+
+        Args:
+            start (int): First value of the interval.
+            end (int): Last value of the interval.
+        """
+        if end < start:
+            return
+        # Intervals that overlap or touch [start, end] are merged into it
+        lo = bisect_left(self._ends, start - 1)
+        hi = bisect_right(self._starts, end + 1)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def remove(self, start, end):
+        """
+        Remove the closed interval [start, end].
+
+        Args:
+            start (int): First value of the interval.
+            end (int): Last value of the interval.
+        """
+        if end < start:
+            return
+        # Intervals that overlap [start, end] are trimmed or split around it
+        lo = bisect_left(self._ends, start)
+        hi = bisect_right(self._starts, end)
+        if lo >= hi:
+            return
+        starts = []
+        ends = []
+        if self._starts[lo] < start:
+            starts.append(self._starts[lo])
+            ends.append(start - 1)
+        if self._ends[hi - 1] > end:
+            starts.append(end + 1)
+            ends.append(self._ends[hi - 1])
+        self._starts[lo:hi] = starts
+        self._ends[lo:hi] = ends
+
+    def gaps(self, start, end):
+        """
+        Get the parts of [start, end] that are not in the set.
+
+        Args:
+            start (int): First value of the range.
+            end (int): Last value of the range.
+
+        Returns:
+            list: (start, end) tuples of the missing closed intervals, in order.
+        """
+        gaps = []
+        cursor = start
+        i = bisect_left(self._ends, start)
+        while cursor <= end and i < len(self._starts):
+            if self._starts[i] > end:
+                break
+            if self._starts[i] > cursor:
+                gaps.append((cursor, self._starts[i] - 1))
+            cursor = max(cursor, self._ends[i] + 1)
+            i += 1
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def covers(self, start, end):
+        """
+        Check whether every value of [start, end] is in the set.
+
+        Args:
+            start (int): First value of the range.
+            end (int): Last value of the range.
+
+        Returns:
+            bool: True if the range has no gaps.
+        """
+        return not self.gaps(start, end)
+
+    def __iter__(self):
+        return iter(list(zip(self._starts, self._ends)))
+
+    def __len__(self):
+        return len(self._starts)
+
+
+class _Series:
+    """Covered days and cached records of one endpoint and parameter set."""
+
+    __slots__ = ("covered", "days", "fetched_at", "meta")
+
+    def __init__(self):
+        self.covered = IntervalSet()
+        self.days = {}
+        self.fetched_at = {}
+        self.meta = None
+
+
+class RangeCache:
+    """
+    Thread-safe cache of date-ranged API responses, stored by day.
+
+    Each endpoint and parameter set (a series) keeps the records it has
+    fetched, bucketed by day, along with the set of days that are covered.
+    A query for a date range is answered from the covered days; only the
+    gaps are requested from the API, and the result is merged in day order.
+
+    Recent days are never recorded as covered, because their data may
+    still change; they are fetched again by every query that includes them.
+    Older days can still be revised (for example, DONKI adds linkedEvents
+    to events days or weeks later), so covered days expire after max_age
+    and are fetched again by the next query that includes them. Series are
+    evicted least recently used first.
+
+    Cached records are shared between callers and should be treated as
+    read-only.
+    """
+
+    def __init__(self, max_series=64, settle_days=1, max_age=3600):
+        """
+        Initialize the range cache.
+
+        Args:
+            max_series (int, optional): Maximum number of endpoint and parameter
+                combinations kept. Default is 64.
+            settle_days (int, optional): Number of days, up to and including
+                today (UTC), that are never cached. Later days are never
+                cached either. Default is 1.
+            max_age (float, optional): Seconds after which a cached day is
+                fetched again. None keeps days until their series is
+                evicted. Default is 3600.
+        """
+        self.max_series = max_series
+        self.settle_days = settle_days
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.fetched_days = 0
+        self.served_days = 0
+        self._series = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_range(self, key, start, end, fetch):
+        """
+        Get the records of a date range, fetching only the missing days.
+
+        Args:
+            key (tuple): Identifies the series, e.g. the URL and the
+                parameters other than the dates.
+            start (date): First day of the range.
+            end (date): Last day of the range, inclusive.
+            fetch (callable): Called as fetch(gap_start, gap_end) with dates
+                for each missing gap. Returns a list of (day, record) pairs,
+                with day as a YYYY-MM-DD string, and response metadata (or
+                None). Records without a parseable day are filed on the
+                gap's first day. Records dated outside the gap are returned
+                as well, but then the gap is not cached, since they may
+                belong to the range of another query.
+
+        Returns:
+            tuple: (records, meta). Records are in day order, and in response
+                order within a day. meta is the metadata of the most recent fetch.
+        """
+        first, last = start.toordinal(), end.toordinal()
+        settled = datetime.utcnow().date().toordinal() - self.settle_days
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _Series()
+                self._series[key] = series
+                while len(self._series) > self.max_series:
+                    self._series.popitem(last=False)
+            self._series.move_to_end(key)
+            now = time.monotonic()
+            if self.max_age is not None:
+                self._expire(series, first, last, now - self.max_age)
+            gaps = series.covered.gaps(first, last)
+            if gaps:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        fetched = {}
+        outside = {}
+        meta = None
+        for gap_start, gap_end in gaps:
+            pairs, meta = fetch(date.fromordinal(gap_start), date.fromordinal(gap_end))
+            days = dict((day, []) for day in range(gap_start, gap_end + 1))
+            for day, record in pairs:
+                ordinal = _ordinal(day)
+                if ordinal is None:
+                    days[gap_start].append(record)
+                elif ordinal in days:
+                    days[ordinal].append(record)
+                else:
+                    outside.setdefault(gap_start, []).append(record)
+            fetched.update(days)
+
+        with self._lock:
+            for gap_start, gap_end in gaps:
+                gap_end = min(gap_end, settled)
+                if gap_end < gap_start or gap_start in outside:
+                    continue
+                for day in range(gap_start, gap_end + 1):
+                    if fetched[day]:
+                        series.days[day] = fetched[day]
+                    else:
+                        series.days.pop(day, None)
+                    series.fetched_at[day] = now
+                series.covered.add(gap_start, gap_end)
+            if meta is not None:
+                series.meta = meta
+            meta = series.meta
+
+            records = []
+            for day in range(first, last + 1):
+                records.extend(outside.get(day, ()))
+                records.extend(fetched[day] if day in fetched else series.days.get(day, ()))
+            self.fetched_days += len(fetched)
+            self.served_days += last - first + 1 - len(fetched)
+        return records, meta
+
+    @staticmethod
+    def _expire(series, first, last, cutoff):
+        """Uncover the days of [first, last] that were fetched before cutoff."""
+        run_start = None
+        for day in range(first, last + 2):
+            fetched_at = series.fetched_at.get(day) if day <= last else None
+            if fetched_at is not None and fetched_at <= cutoff:
+                del series.fetched_at[day]
+                series.days.pop(day, None)
+                if run_start is None:
+                    run_start = day
+            elif run_start is not None:
+                series.covered.remove(run_start, day - 1)
+                run_start = None
+
+    def coverage(self, key):
+        """
+        Get the cached date ranges of a series.
+
+        Args:
+            key (tuple): Identifies the series.
+
+        Returns:
+            list: (start, end) tuples of YYYY-MM-DD strings, in order.
+        """
+        with self._lock:
+            series = self._series.get(key)
+            intervals = list(series.covered) if series is not None else []
+        return [(date.fromordinal(start).isoformat(), date.fromordinal(end).isoformat())
+                for start, end in intervals]
+
+    def clear(self):
+        """Remove all series from the cache."""
+        with self._lock:
+            self._series.clear()
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Queries answered entirely from the cache (hits) or needing
+                at least one fetch (misses), the number of days fetched and
+                served from the cache, and the number of series.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "fetched_days": self.fetched_days,
+                "served_days": self.served_days,
+                "series": len(self._series),
+            }
+
+    def __len__(self):
+        return len(self._series)
+
+
+def parse_day(value):
+    """
+    Parse a YYYY-MM-DD date parameter.
+
+    Args:
+        value (str): The parameter value.
+
+    Returns:
+        date: The date, or None if the value is not a plain YYYY-MM-DD date
+            (e.g. a relative date such as "+60").
+    """
+    if not isinstance(value, str) or len(value) != 10:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _ordinal(day):
+    if isinstance(day, date):
+        return day.toordinal()
+    parsed = parse_day(day[:10]) if isinstance(day, str) else None
+    return parsed.toordinal() if parsed is not None else None
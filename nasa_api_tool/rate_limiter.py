@@ -0,0 +1,272 @@
+"""
+Client-side rate limiting for NASA API requests.
+
+This module provides token buckets that throttle requests before they are
+sent, so that callers slow down smoothly instead of failing with HTTP 429.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .exceptions import NASAAPIError
+
+
+class RateLimit:
+    """
+    A request rate limit.
+
+    Attributes:
+        requests (int): Number of requests allowed per period.
+        period (float): Length of the period in seconds.
+        burst (int): Maximum number of requests that may be sent back to back.
+        per_key (bool): Whether the limit applies to each API key separately.
+    """
+
+    def __init__(self, requests, period, burst=None, per_key=False):
+        """
+        Initialize a rate limit.
+
+        Args:
+            requests (int): Number of requests allowed per period.
+            period (float): Length of the period in seconds.
+            burst (int, optional): Maximum number of requests that may be sent
+                back to back. Default is requests.
+            per_key (bool, optional): Whether the limit applies to each API key
+                separately. Default is False (one limit per host).
+        """
+        self.requests = requests
+        self.period = period
+        self.burst = burst if burst is not None else requests
+        self.per_key = per_key
+
+    def __repr__(self):
+        return f"RateLimit(requests={self.requests}, period={self.period}, burst={self.burst}, per_key={self.per_key})"
+
+
+# Default limits per host. api.nasa.gov enforces an hourly limit per API key
+# and reports it in X-RateLimit-* headers; the other services do not publish
+# their limits, so these are conservative defaults that can be overridden.
+DEFAULT_LIMITS = {
+    "api.nasa.gov": RateLimit(1000, 3600, per_key=True),
+    "ssd-api.jpl.nasa.gov": RateLimit(1, 1, burst=2),
+    "eonet.gsfc.nasa.gov": RateLimit(10, 1, burst=10),
+    "sscweb.gsfc.nasa.gov": RateLimit(5, 1, burst=5),
+    "images-api.nasa.gov": RateLimit(10, 1, burst=10),
+    "exoplanetarchive.ipac.caltech.edu": RateLimit(2, 1, burst=4),
+}
+
+# Hourly limit that api.nasa.gov applies to the shared demo key.
+DEMO_KEY_LIMIT = RateLimit(30, 3600, burst=30, per_key=True)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at a fixed rate up to the bucket capacity.
+    Callers reserve a token and are told how long to wait for it, which
+    spaces requests out evenly once the bucket is empty.
+    """
+
+    def __init__(self, capacity, rate):
+        """
+        Initialize a full token bucket.
+
+        Args:
+            capacity (float): Maximum number of tokens.
+            rate (float): Tokens added per second.
+        """
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait=None):
+        """
+        Reserve one token.
+
+        Args:
+            max_wait (float, optional): Maximum number of seconds the caller is
+                willing to wait. Default is no limit.
+
+        Returns:
+            float: Number of seconds to wait before sending the request.
+
+        Raises:
+            NASAAPIError: If the wait would exceed max_wait. No token is
+                reserved in that case.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                raise NASAAPIError(
+                    f"Rate limit: request would have to wait {wait:.1f}s (max_wait is {max_wait}s)"
+                )
+            self.tokens -= 1
+            return wait
+
+    def update(self, limit=None, remaining=None, period=None):
+        """
+        Correct the bucket from the server's view of the rate limit.
+
+        Args:
+            limit (int, optional): Requests allowed per period, as reported by the server.
+            remaining (int, optional): Requests remaining, as reported by the server.
+            period (float, optional): Length of the period in seconds. Required
+                for limit to change the refill rate.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if limit is not None:
+                self.capacity = float(limit)
+                if period:
+                    self.rate = float(limit) / period
+            # Never trust the local count over the server's: other clients
+            # may be sharing the same key.
+            self.tokens = min(self.tokens, self.capacity)
+            if remaining is not None:
+                self.tokens = min(self.tokens, float(remaining))
+
+
+class RateLimiter:
+    """
+    Throttles requests with one token bucket per host (and per API key).
+
+    Buckets are seeded from the configured limits and corrected from the
+    X-RateLimit-Limit and X-RateLimit-Remaining headers returned by
+    api.nasa.gov, so the client never sends a request the server would
+    reject. Hosts without a configured limit are not throttled.
+    """
+
+    def __init__(self, limits=None, max_wait=None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits (dict, optional): Mapping of host names to RateLimit objects.
+                Entries are merged over DEFAULT_LIMITS; map a host to None to
+                disable throttling for it. A limit given for api.nasa.gov
+                also applies to DEMO_KEY, which otherwise uses DEMO_KEY_LIMIT.
+            max_wait (float, optional): Maximum number of seconds a request may
+                be delayed before NASAAPIError is raised. Default is no limit.
+        """
+        self.limits = dict(DEFAULT_LIMITS)
+        self.limits.update(limits or {})
+        # Hosts whose limit the caller chose; DEMO_KEY_LIMIT never replaces these
+        self._configured = set(limits or ())
+        self.max_wait = max_wait
+        self.throttled = 0
+        self.total_wait = 0.0
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _limit_for(self, host, api_key):
+        limit = self.limits.get(host)
+        if (limit is not None and limit.per_key and api_key == "DEMO_KEY" and host == "api.nasa.gov"
+                and host not in self._configured):
+            return DEMO_KEY_LIMIT
+        return limit
+
+    def _bucket(self, url, api_key):
+        host = urlsplit(url).hostname
+        limit = self._limit_for(host, api_key)
+        if limit is None:
+            return None
+        key = (host, api_key) if limit.per_key else (host, None)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(limit.burst, limit.requests / limit.period)
+                self._buckets[key] = bucket
+            return bucket
+
+    def reserve(self, url, api_key):
+        """
+        Reserve a request slot for a URL.
+
+        Args:
+            url (str): The request URL.
+            api_key (str): The API key the request will use.
+
+        Returns:
+            float: Number of seconds to wait before sending the request.
+
+        Raises:
+            NASAAPIError: If the wait would exceed max_wait.
+        """
+        bucket = self._bucket(url, api_key)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve(self.max_wait)
+        if wait > 0:
+            with self._lock:
+                self.throttled += 1
+                self.total_wait += wait
+        return wait
+
+    def acquire(self, url, api_key):
+        """
+        Block until a request to the URL may be sent.
+
+        Args:
+            url (str): The request URL.
+            api_key (str): The API key the request will use.
+
+        Raises:
+            NASAAPIError: If the wait would exceed max_wait.
+        """
+        wait = self.reserve(url, api_key)
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, url, api_key, headers, status_code=None):
+        """
+        Correct the bucket for a URL from response headers.
+
+        Args:
+            url (str): The request URL.
+            api_key (str): The API key the request used.
+            headers (Mapping): The response headers.
+            status_code (int, optional): The response status code. A 429
+                empties the bucket even without rate limit headers.
+        """
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        if limit is None and remaining is None and status_code != 429:
+            return
+        bucket = self._bucket(url, api_key)
+        if bucket is None:
+            return
+        try:
+            limit = int(limit) if limit is not None else None
+            remaining = int(remaining) if remaining is not None else None
+        except ValueError:
+            return
+        if status_code == 429:
+            remaining = 0
+        host = urlsplit(url).hostname
+        configured = self._limit_for(host, api_key)
+        bucket.update(limit, remaining, configured.period if configured else None)
+
+    def stats(self):
+        """
+        Get rate limiter statistics.
+
+        Returns:
+            dict: Number of throttled requests, total wait time in seconds and
+                the tokens currently available in each bucket.
+        """
+        with self._lock:
+            buckets = {
+                host if key is None else f"{host} (...{key[-4:]})": round(bucket.tokens, 2)
+                for (host, key), bucket in self._buckets.items()
+            }
+            return {"throttled": self.throttled, "total_wait": self.total_wait, "buckets": buckets}
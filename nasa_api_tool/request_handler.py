@@ -3,11 +3,45 @@ Request handler for NASA API requests.
 
 This module handles HTTP requests to NASA APIs, including formatting,
 sending, and receiving responses.
+
+A single RequestHandler (and therefore a single NASAClient) is safe to
+share between threads: callers' parameters are never modified, the cache,
+store, rate limiter and retry policy are guarded by locks, and each NASA
+host gets its own blocking connection pool sized by pool_maxsize.
 """
 
+import json
+import os
+import re
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from .cache import ResponseCache
 from .exceptions import NASAAPIError
 
+# Hosts that get their own connection pool.
+NASA_HOSTS = (
+    "api.nasa.gov",
+    "ssd-api.jpl.nasa.gov",
+    "eonet.gsfc.nasa.gov",
+    "sscweb.gsfc.nasa.gov",
+    "images-api.nasa.gov",
+    "exoplanetarchive.ipac.caltech.edu",
+)
+
+# (connect, read) timeout in seconds.
+DEFAULT_TIMEOUT = (10, 120)
+
+# Connections kept open per host; requests beyond this wait for a free one.
+DEFAULT_POOL_MAXSIZE = 10
+
+# Size of the chunks written to disk by download().
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)")
+
 class RequestHandler:
     """
     Handles HTTP requests to NASA APIs.
@@ -16,15 +50,60 @@ class RequestHandler:
     handling authentication, and processing responses.
     """
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache=None, store=None, rate_limiter=None, retry_policy=None,
+                 timeout=DEFAULT_TIMEOUT, pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_sizes=None):
         """
         Initialize the RequestHandler with an API key.
         
         Args:
             api_key (str): NASA API key. If None, uses "DEMO_KEY".
+            cache (ResponseCache, optional): Cache for successful responses.
+                If None, every request is sent over the wire.
+            store (ResponseStore, optional): Persistent store for successful
+                responses. Stale responses are revalidated with a conditional
+                request. If None, responses are not persisted.
+            rate_limiter (RateLimiter, optional): Client-side rate limiter that
+                delays requests instead of letting them fail with HTTP 429.
+                If None, requests are sent immediately.
+            retry_policy (RetryPolicy, optional): Policy for retrying transient
+                failures. If None, failed requests are not retried.
+            timeout (float or tuple, optional): Connect and read timeout in
+                seconds, either one number or a (connect, read) tuple.
+                Default is (10, 120). None waits forever.
+            pool_maxsize (int, optional): Connections kept per host. Set this
+                to at least the number of threads sharing the handler.
+                Default is 10.
+            pool_sizes (dict, optional): Per-host overrides of pool_maxsize,
+                e.g. {"ssd-api.jpl.nasa.gov": 2}.
         """
         self.api_key = api_key or "DEMO_KEY"
-        self.session = requests.Session()
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.pool_sizes = dict(pool_sizes or {})
+        self.session = self._create_session()
+        self.cache = cache
+        self.store = store
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+    
+    def _create_session(self):
+        """
+        Create the HTTP session used for requests.
+        
+        Each NASA host is mounted on its own adapter so that one busy API
+        cannot starve the others of connections. Pools block when full, so
+        extra threads wait for a connection instead of opening and
+        discarding new ones.
+        
+        Returns:
+            requests.Session: A new session.
+        """
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_maxsize=self.pool_maxsize, pool_block=True))
+        for host in set(NASA_HOSTS) | set(self.pool_sizes):
+            size = self.pool_sizes.get(host, self.pool_maxsize)
+            session.mount(f"https://{host}/", HTTPAdapter(pool_connections=1, pool_maxsize=size, pool_block=True))
+        return session
     
     def get(self, url, params=None):
         """
@@ -40,25 +119,341 @@ class RequestHandler:
         Raises:
             NASAAPIError: If the request fails or returns an error.
         """
-        if params is None:
-            params = {}
+        # Copy so the caller's dict is never modified
+        params = dict(params or {})
+        
+        cache_key = None
+        if self.cache is not None or self.store is not None:
+            cache_key = ResponseCache.make_key(url, params)
+        
+        hit, value, stale, stored = self._lookup(cache_key)
+        if hit:
+            return value
         
         # Add API key to parameters
         params["api_key"] = self.api_key
         
+        response = self._send("GET", url, params=params, headers=self._conditional_headers(stale or stored))
+        
         try:
-            response = self.session.get(url, params=params)
+            if response.status_code == 304 and (stale is not None or stored is not None):
+                return self._revalidated(cache_key, stale, stored)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
         except requests.exceptions.HTTPError as e:
             # Handle HTTP errors
             self._handle_error(e, response)
-        except requests.exceptions.RequestException as e:
-            # Handle connection errors
-            raise NASAAPIError(f"Request failed: {str(e)}")
         except ValueError:
             # Handle JSON parsing errors
             raise NASAAPIError("Invalid response format")
+        
+        if cache_key is not None:
+            self._save(cache_key, response.content, response.headers, data)
+        return data
+    
+    def download(self, url, path, params=None, chunk_size=DEFAULT_CHUNK_SIZE, overwrite=False):
+        """
+        Download a file to disk, resuming a previous partial download.
+        
+        The body is streamed in chunks to "<path>.part" and renamed to path
+        once its size matches the size announced by the server. If a .part
+        file is left over from an interrupted download, only the missing
+        bytes are requested with an HTTP Range header.
+        
+        Args:
+            url (str): The URL to download.
+            path (str): Destination file path.
+            params (dict, optional): Query parameters to include in the request.
+            chunk_size (int, optional): Bytes written per chunk. Default is 256 KiB.
+            overwrite (bool, optional): Download again even if path exists.
+                Default is False.
+                
+        Returns:
+            dict: "path", "status" ("skipped", "downloaded" or "resumed") and
+                "bytes" (the size of the file on disk).
+                
+        Raises:
+            NASAAPIError: If the request fails, returns an error, or the
+                downloaded size does not match the announced size.
+        """
+        if os.path.exists(path) and not overwrite:
+            return {"path": path, "status": "skipped", "bytes": os.path.getsize(path)}
+        
+        part_path = path + ".part"
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        params = dict(params or {})
+        params["api_key"] = self.api_key
+        # Ask for the raw bytes so Content-Length and Range refer to the file itself
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        
+        response = self._send("GET", url, params=params, headers=headers, stream=True)
+        try:
+            content_range = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+            if response.status_code == 416 and offset:
+                # Nothing left to fetch if the partial file is already complete
+                if content_range and content_range.group(2) == str(offset):
+                    os.replace(part_path, path)
+                    return {"path": path, "status": "resumed", "bytes": offset}
+                # Release the connection before the restart takes another from the pool
+                response.close()
+                return self._restart_download(url, path, params, chunk_size)
+            if response.status_code >= 400:
+                self._handle_error(None, response)
+            
+            if response.status_code == 206:
+                if not content_range or content_range.group(1) != str(offset):
+                    response.close()
+                    return self._restart_download(url, path, params, chunk_size)
+                mode, status = "ab", "resumed"
+                total = content_range.group(2)
+                expected = int(total) if total != "*" else None
+            else:
+                # The server ignored the Range header and sent the whole file
+                mode, status, offset = "wb", "downloaded", 0
+                length = response.headers.get("Content-Length")
+                expected = int(length) if length is not None else None
+            
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+        except requests.exceptions.RequestException as e:
+            raise NASAAPIError(f"Download failed: {str(e)}")
+        finally:
+            response.close()
+        
+        size = os.path.getsize(part_path)
+        if expected is not None and size != expected:
+            raise NASAAPIError(f"Download incomplete: got {size} of {expected} bytes for {url}")
+        os.replace(part_path, path)
+        return {"path": path, "status": status, "bytes": size}
+    
+    def send(self, method, url, params=None, data=None, stream=False, allow_redirects=True):
+        """
+        Send a request and return the raw response.
+        
+        Used for endpoints that do not return JSON, or that need a method
+        other than GET. Rate limiting and the retry policy apply as they do
+        for get(), but responses are not cached and no API key is added.
+        
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            params (dict, optional): Query parameters to include in the request.
+            data (dict, optional): Form fields to send in the request body.
+            stream (bool, optional): Defer downloading the body until it is read.
+                The caller must close the response. Default is False.
+            allow_redirects (bool, optional): Follow redirects. Default is True.
+                
+        Returns:
+            requests.Response: The response.
+                
+        Raises:
+            NASAAPIError: If the request fails or returns an error.
+        """
+        response = self._send(method, url, params=params, data=data, stream=stream,
+                              allow_redirects=allow_redirects)
+        if response.status_code >= 400:
+            try:
+                self._handle_error(None, response)
+            finally:
+                response.close()
+        return response
+    
+    def _restart_download(self, url, path, params, chunk_size):
+        """
+        Discard a partial download that cannot be resumed and start over.
+        
+        Args:
+            url (str): The URL to download.
+            path (str): Destination file path.
+            params (dict): Query parameters to include in the request.
+            chunk_size (int): Bytes written per chunk.
+            
+        Returns:
+            dict: The result of download().
+        """
+        os.remove(path + ".part")
+        return self.download(url, path, params=params, chunk_size=chunk_size, overwrite=True)
+    
+    def _send(self, method, url, **kwargs):
+        """
+        Send a request, applying rate limiting and the retry policy.
+        
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            **kwargs: Keyword arguments passed to requests.Session.request().
+            
+        Returns:
+            Response: The final response. Error statuses are returned as-is
+                once the retry policy gives up.
+            
+        Raises:
+            NASAAPIError: If the connection fails and is not retried.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        # Count the request once, so retries do not refill the retry budget
+        if self.retry_policy is not None:
+            self.retry_policy.record_request(url)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url, self.api_key)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                delay = None
+                if self.retry_policy is not None:
+                    delay = self.retry_policy.next_delay(url, method, attempt, sent=self._may_have_been_sent(e))
+                if delay is None:
+                    # Handle connection errors
+                    raise NASAAPIError(f"Request failed: {str(e)}")
+            else:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(url, self.api_key, response.headers, response.status_code)
+                if response.status_code < 400 or self.retry_policy is None:
+                    return response
+                delay = self.retry_policy.next_delay(
+                    url, method, attempt, status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+    
+    @staticmethod
+    def _may_have_been_sent(error):
+        """
+        Check whether a failed request may have reached the server.
+        
+        Args:
+            error (RequestException): The connection error.
+            
+        Returns:
+            bool: False if the connection was never established, True otherwise.
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return False
+        if isinstance(error, requests.exceptions.ConnectionError):
+            reason = getattr(error.args[0], "reason", None) if error.args else None
+            return not isinstance(reason, NewConnectionError)
+        return True
+    
+    def _lookup(self, cache_key):
+        """
+        Look up a response in the cache and the persistent store.
+        
+        Args:
+            cache_key (tuple): The cache key, or None if caching is disabled.
+            
+        Returns:
+            tuple: (hit, value, stale, stored) where hit is True if value can be
+                returned as-is, and stale/stored are expired responses that can
+                be revalidated (or None).
+        """
+        if cache_key is None:
+            return False, None, None, None
+        stale = None
+        stored = None
+        if self.cache is not None:
+            hit, value = self.cache.get(cache_key)
+            if hit:
+                return True, value, None, None
+            stale = self.cache.get_stale(cache_key)
+        if stale is None and self.store is not None:
+            stored = self.store.load(cache_key)
+            if stored is not None and stored.is_fresh():
+                return True, self._load_stored(cache_key, stored), None, None
+        return False, None, stale, stored
+    
+    @staticmethod
+    def _conditional_headers(entry):
+        """
+        Build conditional request headers for revalidating a cached response.
+        
+        Args:
+            entry (CacheEntry or StoredResponse): The stale response, or None.
+            
+        Returns:
+            dict: If-None-Match/If-Modified-Since headers, or None.
+        """
+        if entry is None or not entry.has_validators():
+            return None
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+    
+    def _load_stored(self, cache_key, stored):
+        """
+        Decode a fresh response from the persistent store and promote it to the cache.
+        
+        Args:
+            cache_key (tuple): The cache key.
+            stored (StoredResponse): The stored response.
+            
+        Returns:
+            dict: The decoded response.
+        """
+        try:
+            data = json.loads(stored.body)
+        except ValueError:
+            raise NASAAPIError("Invalid response format")
+        if self.cache is not None:
+            ttl = max(stored.expires_at - time.time(), 0)
+            self.cache.set(cache_key, data, len(stored.body), ttl=ttl,
+                           etag=stored.etag, last_modified=stored.last_modified)
+        return data
+    
+    def _revalidated(self, cache_key, stale, stored):
+        """
+        Refresh a stale response after the server answered 304 Not Modified.
+        
+        The payload already held in memory is reused, so a revalidation
+        costs neither a body transfer nor a JSON parse.
+        
+        Args:
+            cache_key (tuple): The cache key.
+            stale (CacheEntry): The stale in-memory entry, or None.
+            stored (StoredResponse): The stale stored response, or None.
+            
+        Returns:
+            dict: The decoded response.
+        """
+        if stale is not None:
+            data, size = stale.value, stale.size
+            etag, last_modified = stale.etag, stale.last_modified
+        else:
+            data, size = json.loads(stored.body), len(stored.body)
+            etag, last_modified = stored.etag, stored.last_modified
+        if self.cache is not None:
+            self.cache.set(cache_key, data, size, etag=etag, last_modified=last_modified)
+        if self.store is not None:
+            self.store.touch(cache_key)
+        return data
+    
+    def _save(self, cache_key, body, headers, data):
+        """
+        Store a successful response in the cache and persistent store.
+        
+        Args:
+            cache_key (tuple): The cache key.
+            body (bytes): The raw response body.
+            headers (Mapping): The response headers.
+            data (dict): The decoded response.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if self.cache is not None:
+            self.cache.set(cache_key, data, len(body), etag=etag, last_modified=last_modified)
+        if self.store is not None:
+            self.store.save(cache_key, body, etag=etag, last_modified=last_modified)
     
     def _handle_error(self, error, response):
         """
@@ -71,19 +466,31 @@ class RequestHandler:
         Raises:
             NASAAPIError: With a descriptive message based on the status code.
         """
-        status_code = response.status_code
+        raise NASAAPIError(self._error_message(response.status_code, response.text))
+    
+    @staticmethod
+    def _error_message(status_code, text):
+        """
+        Build a descriptive error message for an HTTP status code.
         
+        Args:
+            status_code (int): The HTTP status code.
+            text (str): The response body.
+            
+        Returns:
+            str: The error message.
+        """
         if status_code == 400:
-            raise NASAAPIError("Bad request: Check your parameters")
+            return "Bad request: Check your parameters"
         elif status_code == 401:
-            raise NASAAPIError("Unauthorized: Check your API key")
+            return "Unauthorized: Check your API key"
         elif status_code == 403:
-            raise NASAAPIError("Forbidden: You don't have access to this resource")
+            return "Forbidden: You don't have access to this resource"
         elif status_code == 404:
-            raise NASAAPIError("Not found: The requested resource doesn't exist")
+            return "Not found: The requested resource doesn't exist"
         elif status_code == 429:
-            raise NASAAPIError("Too many requests: You've exceeded your rate limit")
+            return "Too many requests: You've exceeded your rate limit"
         elif status_code >= 500:
-            raise NASAAPIError("Server error: NASA API is experiencing issues")
+            return "Server error: NASA API is experiencing issues"
         else:
-            raise NASAAPIError(f"HTTP error {status_code}: {response.text}")
+            return f"HTTP error {status_code}: {text}"
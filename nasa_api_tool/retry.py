@@ -0,0 +1,203 @@
+"""
+Retry policy for NASA API requests.
+
+This module decides whether a failed request should be retried and how
+long to wait first, using exponential backoff with full jitter, the
+Retry-After header and a retry budget that stops retry storms.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+# HTTP methods that can safely be sent twice.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+
+class RetryPolicy:
+    """
+    Configurable retry policy shared by all requests of a RequestHandler.
+
+    A request is retried when the server answers with one of retry_statuses
+    or when the connection fails. Requests that may already have reached the
+    server (read timeouts, connection resets) are only retried for
+    idempotent methods; other 4xx responses are never retried.
+
+    Retries are limited per request by max_retries and across requests by a
+    budget: every request deposits budget_ratio tokens and every retry
+    withdraws one, so that during an outage at most about budget_ratio
+    extra load is sent to the API.
+    """
+
+    def __init__(self, max_retries=3, backoff_base=0.5, backoff_max=30.0,
+                 retry_statuses=(408, 429, 500, 502, 503, 504), max_retry_after=120.0,
+                 budget_ratio=0.2, budget_min=10):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries (int, optional): Maximum number of retries per request.
+                Default is 3.
+            backoff_base (float, optional): Base delay in seconds for exponential
+                backoff. Default is 0.5.
+            backoff_max (float, optional): Maximum backoff delay in seconds.
+                Default is 30.
+            retry_statuses (tuple, optional): HTTP status codes that are retried.
+                Default is (408, 429, 500, 502, 503, 504).
+            max_retry_after (float, optional): Longest Retry-After delay in seconds
+                that is honoured. Requests asked to wait longer fail immediately.
+                Default is 120.
+            budget_ratio (float, optional): Retry tokens earned per request.
+                Default is 0.2.
+            budget_min (float, optional): Retry tokens available up front, and the
+                size of the budget's reserve. Default is 10.
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self._budget = float(budget_min)
+        self._budget_max = float(budget_min) * 10
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_retry_after(value):
+        """
+        Parse a Retry-After header value.
+
+        Args:
+            value (str): Either a number of seconds or an HTTP date.
+
+        Returns:
+            float: The delay in seconds, or None if the value cannot be parsed.
+        """
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when is None:
+            return None
+        return max(when.timestamp() - time.time(), 0.0)
+
+    def backoff(self, attempt):
+        """
+        Get a backoff delay with full jitter.
+
+        Args:
+            attempt (int): Zero-based retry number.
+
+        Returns:
+            float: A random delay between 0 and the capped exponential backoff.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def is_retryable(self, method, status_code=None, sent=True):
+        """
+        Classify a failed request.
+
+        Args:
+            method (str): The HTTP method.
+            status_code (int, optional): The response status, or None if the
+                request failed without a response.
+            sent (bool, optional): For failures without a response, whether the
+                request may have reached the server. Default is True.
+
+        Returns:
+            bool: True if the failure is transient and the request is safe to repeat.
+        """
+        if status_code is None:
+            return not sent or method.upper() in IDEMPOTENT_METHODS
+        if status_code not in self.retry_statuses:
+            return False
+        # 429 and 503 mean the request was not processed.
+        return status_code in (429, 503) or method.upper() in IDEMPOTENT_METHODS
+
+    def next_delay(self, url, method, attempt, status_code=None, sent=True, retry_after=None):
+        """
+        Decide whether to retry a failed request and how long to wait.
+
+        Args:
+            url (str): The request URL.
+            method (str): The HTTP method.
+            attempt (int): Number of retries already made for this request.
+            status_code (int, optional): The response status, or None if the
+                request failed without a response.
+            sent (bool, optional): For failures without a response, whether the
+                request may have reached the server.
+            retry_after (str, optional): The response's Retry-After header.
+
+        Returns:
+            float: Seconds to wait before retrying, or None to give up.
+        """
+        endpoint = self._endpoint(url)
+        if attempt >= self.max_retries or not self.is_retryable(method, status_code, sent):
+            self._record(endpoint, "giveups" if attempt else None)
+            return None
+        delay = self.backoff(attempt)
+        parsed = self.parse_retry_after(retry_after)
+        if parsed is not None:
+            if parsed > self.max_retry_after:
+                self._record(endpoint, "giveups")
+                return None
+            delay = max(delay, parsed)
+        with self._lock:
+            if self._budget < 1:
+                self._record_locked(endpoint, "budget_exhausted")
+                return None
+            self._budget -= 1
+            self._record_locked(endpoint, "retries")
+        return delay
+
+    def record_request(self, url):
+        """
+        Count a request and add its share to the retry budget.
+
+        Args:
+            url (str): The request URL.
+        """
+        with self._lock:
+            self._budget = min(self._budget_max, self._budget + self.budget_ratio)
+            self._record_locked(self._endpoint(url), "requests")
+
+    def stats(self):
+        """
+        Get retry statistics per endpoint.
+
+        Returns:
+            dict: Mapping of endpoint URLs to counters for requests, retries,
+                giveups (requests that failed after retrying) and
+                budget_exhausted (retries refused by the budget).
+        """
+        with self._lock:
+            return {endpoint: dict(counts) for endpoint, counts in self._stats.items()}
+
+    @staticmethod
+    def _endpoint(url):
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+    def _record(self, endpoint, counter):
+        if counter is None:
+            return
+        with self._lock:
+            self._record_locked(endpoint, counter)
+
+    def _record_locked(self, endpoint, counter):
+        counts = self._stats.get(endpoint)
+        if counts is None:
+            counts = {"requests": 0, "retries": 0, "giveups": 0, "budget_exhausted": 0}
+            self._stats[endpoint] = counts
+        counts[counter] += 1
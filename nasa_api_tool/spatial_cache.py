@@ -0,0 +1,256 @@
+"""
+Spatial cache for location-based NASA API requests.
+
+This module snaps coordinates to geohash cells so that requests for nearby
+locations share one upstream response, and tracks which cells are covered.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+_GEOHASH_INDEX = {char: i for i, char in enumerate(_GEOHASH_ALPHABET)}
+
+
+def encode_geohash(lat, lon, precision=7):
+    """
+    Encode a location as a geohash.
+
+    Args:
+        lat (float): Latitude of the location.
+        lon (float): Longitude of the location.
+        precision (int, optional): Number of characters. Each character
+            narrows the cell by 5 bits; 7 characters are about 150 m across.
+            Default is 7.
+
+    Returns:
+        str: The geohash of the cell containing the location.
+
+    Raises:
+        ValueError: If the location is out of range.
+    """
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError(f"Invalid location: ({lat}, {lon})")
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        interval, coordinate = (lon_range, lon) if even else (lat_range, lat)
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def geohash_bounds(geohash):
+    """
+    Get the bounding box of a geohash cell.
+
+    Args:
+        geohash (str): The geohash.
+
+    Returns:
+        tuple: (min_lat, min_lon, max_lat, max_lon).
+
+    Raises:
+        ValueError: If the geohash contains invalid characters.
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        try:
+            value = _GEOHASH_INDEX[char]
+        except KeyError:
+            raise ValueError(f"Invalid geohash: {geohash!r}")
+        for shift in range(4, -1, -1):
+            interval = lon_range if even else lat_range
+            middle = (interval[0] + interval[1]) / 2
+            if value >> shift & 1:
+                interval[0] = middle
+            else:
+                interval[1] = middle
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def geohash_center(geohash):
+    """
+    Get the center of a geohash cell.
+
+    Args:
+        geohash (str): The geohash.
+
+    Returns:
+        tuple: (lat, lon) of the cell center.
+    """
+    min_lat, min_lon, max_lat, max_lon = geohash_bounds(geohash)
+    return (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+
+
+class SpatialCache:
+    """
+    Thread-safe LRU cache for responses keyed by geohash cell.
+
+    A request for a location is answered by the response for the center of
+    the geohash cell that contains it, so locations that differ only in
+    their last decimal places share one upstream request. Entries are keyed
+    by the cell together with the other request parameters (such as dim and
+    date), expire after a TTL, and are evicted least recently used first.
+
+    Cached payloads are shared between callers and should be treated as
+    read-only.
+    """
+
+    def __init__(self, precision=7, max_entries=4096, ttl=3600):
+        """
+        Initialize the spatial cache.
+
+        Args:
+            precision (int, optional): Geohash length used for cells. Lower
+                values give larger cells and more sharing. Default is 7
+                (about 150 m).
+            max_entries (int, optional): Maximum number of cached responses.
+                Default is 4096.
+            ttl (float, optional): Time to live in seconds. Default is 3600.
+        """
+        self.precision = precision
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cell(self, lat, lon):
+        """
+        Get the cell containing a location.
+
+        Args:
+            lat (float): Latitude of the location.
+            lon (float): Longitude of the location.
+
+        Returns:
+            str: The cell's geohash.
+        """
+        return encode_geohash(lat, lon, self.precision)
+
+    def get(self, cell, *params):
+        """
+        Look up a fresh cached value for a cell.
+
+        Args:
+            cell (str): The cell's geohash.
+            *params: The other request parameters the value depends on.
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss.
+        """
+        key = (cell,) + params
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry[1]:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def set(self, cell, value, *params):
+        """
+        Store a value for a cell.
+
+        Args:
+            cell (str): The cell's geohash.
+            value: The decoded response payload.
+            *params: The other request parameters the value depends on.
+        """
+        if self.ttl <= 0:
+            return
+        key = (cell,) + params
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def covers(self, lat, lon, *params):
+        """
+        Check whether a location would be answered from the cache.
+
+        Args:
+            lat (float): Latitude of the location.
+            lon (float): Longitude of the location.
+            *params: The other request parameters.
+
+        Returns:
+            bool: True if the location's cell has a fresh entry.
+        """
+        key = (self.cell(lat, lon),) + params
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() < entry[1]
+
+    def coverage(self, *params):
+        """
+        Get the cells that have fresh entries.
+
+        Args:
+            *params: If given, only cells cached with these request
+                parameters are returned.
+
+        Returns:
+            dict: Mapping of geohashes to cell bounds
+                (min_lat, min_lon, max_lat, max_lon).
+        """
+        now = time.monotonic()
+        with self._lock:
+            cells = set(
+                key[0] for key, (_, expires_at) in self._entries.items()
+                if now < expires_at and (not params or key[1:] == params)
+            )
+        return {cell: geohash_bounds(cell) for cell in sorted(cells)}
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Hit, miss and eviction counters, the number of entries and
+                the number of distinct cells covered.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "cells": len(set(key[0] for key in self._entries)),
+            }
+
+    def __len__(self):
+        return len(self._entries)
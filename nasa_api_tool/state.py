@@ -0,0 +1,54 @@
+"""
+Persistent state files for long-running NASA API jobs.
+
+Crawlers and sync jobs record their progress in small JSON files so that
+they can resume after a crash or pick up only new data on the next run.
+"""
+
+import json
+import os
+import tempfile
+
+
+def load_state(path, default=None):
+    """
+    Load a JSON state file.
+
+    Args:
+        path (str): Path to the state file.
+        default (optional): Value returned if the file does not exist.
+            Default is an empty dict.
+
+    Returns:
+        The decoded state, or default if there is no state file yet.
+    """
+    if default is None:
+        default = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def save_state(path, state):
+    """
+    Atomically write a JSON state file.
+
+    The state is written to a temporary file in the same directory and
+    then renamed over the old file, so a crash never leaves a truncated
+    state file behind.
+
+    Args:
+        path (str): Path to the state file.
+        state: JSON-serialisable state.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,679 @@
+"""
+Offline tests for the NASA Universal API Tool's API modules.
+
+These tests replace the HTTP session with a stub that answers requests
+from a function, so they run without network access.
+"""
+
+import json
+import re
+import time
+from datetime import datetime, timedelta
+from urllib.parse import quote_plus, urlencode
+
+import pytest
+import requests
+
+from nasa_api_tool import NASAAPIError, NASAClient, RangeCache
+
+
+class FakeResponse:
+    """A minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, data=None, content=None, headers=None):
+        self.status_code = status_code
+        self.content = content if content is not None else json.dumps(data).encode()
+        self.text = self.content.decode("utf-8", "replace")
+        self.headers = headers or {}
+        self.url = ""
+        self.closed = False
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(str(self.status_code), response=self)
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Answers requests with respond(method, url, params, kwargs) and records them."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.calls = []
+
+    def request(self, method, url, params=None, **kwargs):
+        params = dict(params or {})
+        self.calls.append((method, url, params))
+        return self.respond(method, url, params, kwargs)
+
+    def close(self):
+        pass
+
+
+def make_client(respond, **options):
+    """Create a NASAClient whose requests are answered by respond."""
+    client = NASAClient(**options)
+    session = FakeSession(respond)
+    client.request_handler.session = session
+    return client, session
+
+
+def test_feed_range_accepts_unpadded_dates():
+    def respond(method, url, params, kwargs):
+        assert (params["start_date"], params["end_date"]) == ("2023-01-05", "2023-01-06")
+        return FakeResponse(data={"near_earth_objects": {
+            "2023-01-05": [{"id": "1"}],
+            "2023-01-06": [{"id": "2"}],
+        }})
+
+    client, _ = make_client(respond)
+    feed = client.asteroids.get_feed_range("2023-1-5", "2023-1-6")
+    assert feed["element_count"] == 2
+    assert list(feed["near_earth_objects"]) == ["2023-01-05", "2023-01-06"]
+
+
+def test_download_restart_releases_first_response(tmp_path):
+    path = str(tmp_path / "image.png")
+    with open(path + ".part", "wb") as f:
+        f.write(b"stale")
+    responses = []
+
+    def respond(method, url, params, kwargs):
+        # A restart must not hold two connections from the pool at once
+        assert all(response.closed for response in responses)
+        if "Range" in kwargs["headers"]:
+            response = FakeResponse(206, content=b"0123456789", headers={"Content-Range": "bytes 0-9/10"})
+        else:
+            response = FakeResponse(200, content=b"0123456789", headers={"Content-Length": "10"})
+        responses.append(response)
+        return response
+
+    client, session = make_client(respond)
+    result = client.request_handler.download("https://example.com/image.png", path)
+    assert result["status"] == "downloaded"
+    assert len(session.calls) == 2
+    with open(path, "rb") as f:
+        assert f.read() == b"0123456789"
+
+
+def test_nearest_images_considers_adjacent_days():
+    images = {
+        "2022-12-30": ["2022-12-30 12:00:00"],
+        "2023-01-01": ["2023-01-01 00:30:00"],
+        "2023-01-02": ["2023-01-02 00:10:00"],
+    }
+
+    def respond(method, url, params, kwargs):
+        if url.endswith("/natural/available"):
+            return FakeResponse(data=sorted(images))
+        day = url.rsplit("/", 1)[-1]
+        return FakeResponse(data=[{"image": stamp, "date": stamp} for stamp in images[day]])
+
+    client, _ = make_client(respond)
+    nearest = client.epic.get_nearest_images("2023-01-01 23:50:00")
+    assert [image["date"] for image in nearest] == [
+        "2023-01-02 00:10:00", "2023-01-01 00:30:00", "2022-12-30 12:00:00",
+    ]
+
+
+def test_tile_grid_fetches_image_bytes_and_keeps_errors_per_kind(tmp_path):
+    failing = {"imagery": True}
+
+    def respond(method, url, params, kwargs):
+        if url.endswith("earth/assets"):
+            return FakeResponse(data={"date": "2020-01-01", "lat": params["lat"]})
+        if failing["imagery"] and params["lon"] < 0.05:
+            return FakeResponse(500, content=b"Internal Server Error")
+        return FakeResponse(content=b"\x89PNG" + str(params["lon"]).encode(), headers={"Content-Type": "image/png"})
+
+    client, session = make_client(respond)
+    grid = client.earth.get_tile_grid(0.0, 0.0, 0.1, 0.1, tile_size=0.05)
+    assert (grid.rows, grid.cols) == (2, 2)
+    assert grid[0, 1]["imagery"] == b"\x89PNG0.075"
+    assert all(tile["assets"] is not None and tile["assets_error"] is None for tile in grid)
+    assert [(tile["row"], tile["col"]) for tile in grid.failed()] == [(0, 0), (1, 0)]
+    assert grid[0, 0]["imagery"] is None and grid[0, 0]["imagery_error"]
+
+    # Only the failed images are fetched again
+    failing["imagery"] = False
+    count = len(session.calls)
+    retried = client.earth.get_tile_grid(0.0, 0.0, 0.1, 0.1, tile_size=0.05, previous=grid)
+    assert [call[1].rsplit("/", 1)[-1] for call in session.calls[count:]] == ["imagery", "imagery"]
+    assert not retried.failed()
+
+    # With a directory, images are streamed to files
+    on_disk = client.earth.get_tile_grid(0.0, 0.0, 0.05, 0.05, tile_size=0.05, assets=False,
+                                         directory=str(tmp_path))
+    with open(on_disk[0, 0]["imagery"], "rb") as f:
+        assert f.read() == b"\x89PNG0.025"
+
+
+def test_donki_sync_sees_revisions_with_range_cache(tmp_path):
+    day = (datetime.utcnow().date() - timedelta(days=5)).isoformat()
+    cme = {"activityID": f"{day}-CME-001", "startTime": f"{day}T01:00Z", "linkedEvents": None}
+
+    def respond(method, url, params, kwargs):
+        assert url.endswith("/CME")
+        return FakeResponse(data=[cme] if params["startDate"] <= day <= params["endDate"] else [])
+
+    client, _ = make_client(respond, range_cache=RangeCache())
+    state_path = str(tmp_path / "donki.json")
+    # Warm the range cache with the window the next syncs will request again
+    client.donki.get_coronal_mass_ejection(day, datetime.utcnow().date().isoformat())
+    assert [change for _, _, change in client.donki.sync(state_path, ["CME"])] == ["new"]
+
+    cme["linkedEvents"] = [{"activityID": f"{day}-GST-001"}]
+    changes = list(client.donki.sync(state_path, ["CME"]))
+    assert [(event["activityID"], change) for _, event, change in changes] == [(cme["activityID"], "changed")]
+
+
+def test_donki_getter_sees_revisions_after_range_cache_max_age(monkeypatch):
+    from nasa_api_tool import range_cache
+
+    clock = [0.0]
+    monkeypatch.setattr(range_cache.time, "monotonic", lambda: clock[0])
+    cme = {"activityID": "2023-01-02-CME-001", "startTime": "2023-01-02T01:00Z", "linkedEvents": None}
+
+    def respond(method, url, params, kwargs):
+        return FakeResponse(data=[dict(cme)])
+
+    client, session = make_client(respond, range_cache=RangeCache(max_age=3600))
+    assert client.donki.get_coronal_mass_ejection("2023-01-01", "2023-01-05")[0]["linkedEvents"] is None
+
+    cme["linkedEvents"] = [{"activityID": "2023-01-04-GST-001"}]
+    clock[0] += 60
+    assert client.donki.get_coronal_mass_ejection("2023-01-01", "2023-01-05")[0]["linkedEvents"] is None
+    assert len(session.calls) == 1
+
+    clock[0] += 3600
+    events = client.donki.get_coronal_mass_ejection("2023-01-01", "2023-01-05")
+    assert events[0]["linkedEvents"] == cme["linkedEvents"]
+    assert len(session.calls) == 2
+
+
+def test_donki_results_do_not_change_with_a_range_cache():
+    events = [
+        {"activityID": "2023-01-02-CME-001", "startTime": "2023-01-02T01:00Z"},
+        {"activityID": "2023-01-03-CME-001", "startTime": None},
+        {"activityID": "2022-12-31-CME-001", "startTime": "2022-12-31T23:00Z"},
+    ]
+
+    def respond(method, url, params, kwargs):
+        return FakeResponse(data=events)
+
+    plain, _ = make_client(respond)
+    cached, _ = make_client(respond, range_cache=RangeCache())
+    expected = plain.donki.get_coronal_mass_ejection("2023-01-01", "2023-01-05")
+    for _ in range(2):
+        result = cached.donki.get_coronal_mass_ejection("2023-01-01", "2023-01-05")
+        assert sorted(event["activityID"] for event in result) == \
+            sorted(event["activityID"] for event in expected)
+
+
+def test_donki_snapshot_indexes_links_in_both_directions():
+    events = {
+        "CME": [{"activityID": "CME-1", "startTime": "2023-01-01T00:00Z",
+                 "linkedEvents": [{"activityID": "GST-1"}, {"activityID": "IPS-1"}]}],
+        "GST": [{"gstID": "GST-1", "startTime": "2023-01-03T00:00Z", "linkedEvents": None}],
+        "IPS": [{"activityID": "IPS-1", "eventTime": "2023-01-02T00:00Z",
+                 "linkedEvents": [{"activityID": "SEP-outside"}]}],
+        "FLR": [{"flrID": "FLR-1", "beginTime": "2022-12-31T23:00Z", "linkedEvents": [{"activityID": "CME-1"}]}],
+    }
+
+    def respond(method, url, params, kwargs):
+        return FakeResponse(data=events.get(url.rsplit("/", 1)[-1], []))
+
+    client, session = make_client(respond)
+    snapshot = client.donki.get_all("2023-01-01", "2023-01-05")
+    assert len(session.calls) == 10
+    assert snapshot["GST"] == events["GST"]
+
+    # gstID and flrID identify GST and FLR events
+    assert snapshot.get("GST-1") == events["GST"][0]
+    assert snapshot.event_type("FLR-1") == "FLR"
+    assert "SEP-outside" not in snapshot and snapshot.get("SEP-outside") is None
+
+    assert snapshot.linked("GST-1") == ["CME-1"]
+    assert snapshot.linked("CME-1") == ["GST-1", "IPS-1", "FLR-1"]
+    assert snapshot.linked("SEP-outside") == ["IPS-1"]
+    assert snapshot.chain("GST-1") == ["GST-1", "CME-1", "IPS-1", "FLR-1", "SEP-outside"]
+    assert snapshot.chain("SEP-outside") == ["SEP-outside", "IPS-1", "CME-1", "GST-1", "FLR-1"]
+    assert snapshot.chain("unknown") == ["unknown"]
+
+
+def donki_server(events):
+    """Answer DONKI requests with the events of each type whose time is in the requested window."""
+    time_fields = {"CME": "startTime", "FLR": "beginTime"}
+
+    def respond(method, url, params, kwargs):
+        event_type = url.rsplit("/", 1)[-1]
+        return FakeResponse(data=[
+            event for event in events.get(event_type, [])
+            if params["startDate"] <= event[time_fields[event_type]][:10] <= params["endDate"]
+        ])
+    return respond
+
+
+def days_ago(days):
+    return (datetime.utcnow().date() - timedelta(days=days)).isoformat()
+
+
+def test_donki_sync_yields_nothing_the_second_time(tmp_path):
+    events = {
+        "CME": [{"activityID": "CME-1", "startTime": days_ago(4) + "T01:00Z"}],
+        "FLR": [{"flrID": "FLR-1", "beginTime": days_ago(2) + "T05:00Z"}],
+    }
+    client, _ = make_client(donki_server(events))
+    state_path = str(tmp_path / "donki.json")
+    first = list(client.donki.sync(state_path, ["CME", "FLR"]))
+    assert [(event_type, change) for event_type, _, change in first] == [("CME", "new"), ("FLR", "new")]
+    assert list(client.donki.sync(state_path, ["CME", "FLR"])) == []
+
+
+def test_donki_sync_yields_an_interrupted_type_again(tmp_path):
+    events = {
+        "CME": [
+            {"activityID": "CME-1", "startTime": days_ago(4) + "T01:00Z"},
+            {"activityID": "CME-2", "startTime": days_ago(3) + "T01:00Z"},
+        ],
+        "FLR": [{"flrID": "FLR-1", "beginTime": days_ago(2) + "T05:00Z"}],
+    }
+    client, _ = make_client(donki_server(events))
+    state_path = str(tmp_path / "donki.json")
+
+    # Stop in the middle of the CME events: nothing is saved
+    changes = client.donki.sync(state_path, ["CME", "FLR"])
+    next(changes)
+    changes.close()
+    changes = client.donki.sync(state_path, ["CME", "FLR"])
+    assert [event.get("activityID") or event.get("flrID") for _, event, _ in changes] == ["CME-1", "CME-2", "FLR-1"]
+
+    # Stop after moving on to FLR: the CME events are saved, FLR is not
+    changes = client.donki.sync(str(tmp_path / "other.json"), ["CME", "FLR"])
+    assert [next(changes)[0] for _ in range(3)] == ["CME", "CME", "FLR"]
+    changes.close()
+    assert [event["flrID"] for _, event, _ in client.donki.sync(str(tmp_path / "other.json"), ["CME", "FLR"])] == \
+        ["FLR-1"]
+
+
+def test_donki_sync_drops_hashes_older_than_the_window(tmp_path):
+    events = {"CME": [
+        {"activityID": "CME-old", "startTime": days_ago(20) + "T01:00Z"},
+        {"activityID": "CME-new", "startTime": days_ago(5) + "T01:00Z"},
+    ]}
+    client, session = make_client(donki_server(events))
+    state_path = str(tmp_path / "donki.json")
+    assert len(list(client.donki.sync(state_path, ["CME"], overlap_days=3))) == 2
+    with open(state_path) as f:
+        assert sorted(json.load(f)["types"]["CME"]["hashes"]) == ["CME-new", "CME-old"]
+
+    # The next window starts overlap_days before the newest event
+    assert list(client.donki.sync(state_path, ["CME"], overlap_days=3)) == []
+    assert session.calls[-1][2]["startDate"] == days_ago(8)
+    with open(state_path) as f:
+        state = json.load(f)["types"]["CME"]
+    assert list(state["hashes"]) == ["CME-new"]
+    assert state["mark"] == days_ago(5) + "T01:00Z"
+
+
+def test_apod_mirror_does_not_skip_unpublished_days(tmp_path):
+    published = ["2024-01-06", "2024-01-07", "2024-01-08", "2024-01-09"]
+
+    def respond(method, url, params, kwargs):
+        dates = [day for day in published if params["start_date"] <= day <= params["end_date"]]
+        return FakeResponse(data=[{"date": day, "title": day} for day in dates])
+
+    path = str(tmp_path / "apod.json")
+    with open(path, "w") as f:
+        json.dump({"synced_through": "2024-01-05", "entries": {}}, f)
+    client, _ = make_client(respond)
+    mirror = client.apod.mirror(path)
+    assert mirror.sync(chunk_days=2, end_date="2024-01-10") == 4
+    assert mirror.synced_through == "2024-01-09"
+
+    published.append("2024-01-10")
+    assert mirror.sync(end_date="2024-01-10") == 1
+    assert "2024-01-10" in mirror and mirror.synced_through == "2024-01-10"
+
+
+def test_get_planet_by_name_quotes_the_name():
+    def respond(method, url, params, kwargs):
+        return FakeResponse(data=[])
+
+    client, session = make_client(respond)
+    client.exoplanet.get_planet_by_name("Kapteyn's b")
+    assert session.calls[0][2]["query"] == "select * from ps where pl_name='Kapteyn''s b' and default_flag=1"
+
+
+def archive_rows(method, url, params, kwargs):
+    """Answer a "pl_name in (...)" query with a row for every listed name except unknown ones."""
+    names = [name.replace("''", "'") for name in re.findall(r"'((?:[^']|'')*)'", params["query"])]
+    return FakeResponse(data=[{"pl_name": name, "disc_year": 2000} for name in names if "unknown" not in name])
+
+
+def test_get_planets_by_name_packs_names_under_the_url_limit():
+    names = [f"Kepler-{i} b" for i in range(200)] + ["Kapteyn's b", "unknown b", "Kepler-1 b"]
+    client, session = make_client(archive_rows)
+    planets = client.exoplanet.get_planets_by_name(names, select="disc_year", max_url_length=600)
+
+    assert list(planets) == names[:-1]
+    assert planets["Kapteyn's b"] == {"pl_name": "Kapteyn's b", "disc_year": 2000}
+    assert planets["unknown b"] is None
+
+    base_url = client.exoplanet.base_url
+    lengths = [len(base_url) + len(urlencode(params)) for _, _, params in session.calls]
+    assert max(lengths) <= 600
+    # Chunks are full: the first name of the next chunk would not have fit
+    assert min(lengths[:-1]) > 600 - len(quote_plus(",'Kepler-100 b'"))
+    assert all(params["query"].startswith("select pl_name,disc_year from ps where pl_name in (")
+               for _, _, params in session.calls)
+    queried = re.findall(r"'((?:[^']|'')*)'", "".join(params["query"] for _, _, params in session.calls))
+    assert sorted(queried) == sorted(name.replace("'", "''") for name in names[:-1])
+
+
+def test_get_planets_by_name_rejects_a_name_that_cannot_fit():
+    client, session = make_client(archive_rows)
+    with pytest.raises(ValueError):
+        client.exoplanet.get_planets_by_name(["Kepler-1 b", "x" * 600], max_url_length=600)
+    assert session.calls == []
+
+
+def test_async_client_rejects_blocking_only_exoplanet_formats():
+    pytest.importorskip("aiohttp")
+    from nasa_api_tool import AsyncNASAClient
+
+    client = AsyncNASAClient()
+    with pytest.raises(TypeError):
+        client.exoplanet.query(format="csv")
+    with pytest.raises(TypeError):
+        client.request_handler.send("GET", "https://example.com")
+
+
+class FakeArchive:
+    """Serves a small pscomppars table over the Exoplanet Archive's sync and async TAP endpoints."""
+
+    JOB_URL = "https://exoplanetarchive.ipac.caltech.edu/TAP/async/job1"
+    COLUMNS = ["pl_name", "hostname", "disc_year", "rowupdate"]
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def csv(self, rows, columns):
+        lines = [",".join(columns)]
+        lines.extend(",".join(str(row[column]) for column in columns) for row in rows)
+        return ("\n".join(lines) + "\n").encode()
+
+    def __call__(self, method, url, params, kwargs):
+        if method == "POST":
+            self.queries.append(kwargs["data"]["QUERY"])
+            return FakeResponse(303, content=b"", headers={"Location": self.JOB_URL})
+        if method == "DELETE":
+            return FakeResponse(204, content=b"")
+        if url.endswith("/phase"):
+            return FakeResponse(content=b"COMPLETED")
+        if url.endswith("/results/result"):
+            return FakeResponse(content=self.csv(self.rows, self.COLUMNS))
+        query = params["query"]
+        self.queries.append(query)
+        select = query.split()[1]
+        columns = self.COLUMNS if select == "*" else select.split(",")
+        mark = re.search(r"rowupdate >= '([^']*)'", query)
+        rows = [row for row in self.rows if mark is None or row["rowupdate"] >= mark.group(1)]
+        if params["format"] == "json":
+            return FakeResponse(data=[{column: row[column] for column in columns} for row in rows])
+        return FakeResponse(content=self.csv(rows, columns))
+
+
+def planet(name, disc_year, rowupdate):
+    return {"pl_name": name, "hostname": name[:-2], "disc_year": disc_year, "rowupdate": rowupdate}
+
+
+def test_exoplanet_mirror_syncs_fully_then_incrementally(tmp_path):
+    archive = FakeArchive([
+        planet("A b", 2001, "2024-01-01"),
+        planet("B b", 2005, "2024-01-02"),
+        planet("C b", 2010, "2024-01-02"),
+    ])
+    client, session = make_client(archive)
+    mirror = client.exoplanet.mirror(str(tmp_path / "exoplanets.db"))
+    assert mirror.synced_at is None
+    assert mirror.sync() == {"mode": "full", "rows": 3, "deleted": 0}
+    assert archive.queries == ["select * from pscomppars"]
+    assert ("DELETE", FakeArchive.JOB_URL, {}) in session.calls
+    assert len(mirror) == 3 and mirror.rowupdate == "2024-01-02"
+
+    # B b is revised, D b is added and A b is withdrawn
+    archive.rows = [
+        planet("B b", 2006, "2024-01-05"),
+        planet("C b", 2010, "2024-01-02"),
+        planet("D b", 2020, "2024-01-05"),
+    ]
+    assert mirror.sync() == {"mode": "incremental", "rows": 3, "deleted": 1}
+    assert archive.queries[1:] == [
+        "select * from pscomppars where rowupdate >= '2024-01-02'",
+        "select pl_name from pscomppars",
+    ]
+    assert mirror.rowupdate == "2024-01-05"
+    assert mirror.query(select="pl_name,disc_year", order="pl_name") == [
+        {"pl_name": "B b", "disc_year": 2006},
+        {"pl_name": "C b", "disc_year": 2010},
+        {"pl_name": "D b", "disc_year": 2020},
+    ]
+
+    # Without pruning, rows that left the archive are kept
+    archive.rows = archive.rows[1:]
+    assert mirror.sync(prune=False)["deleted"] == 0
+    assert len(mirror) == 3
+    mirror.close()
+
+
+def test_exoplanet_query_answers_from_synced_local_mirror(tmp_path):
+    archive = FakeArchive([
+        planet("A b", 2001, "2024-01-01"),
+        planet("B b", 2005, "2024-01-02"),
+        planet("C b", 2010, "2024-01-02"),
+    ])
+    client, session = make_client(archive)
+    mirror = client.exoplanet.mirror(str(tmp_path / "exoplanets.db"))
+    client.exoplanet.local_mirror = mirror
+
+    # An unsynced mirror is not used
+    assert len(client.exoplanet.query(table="pscomppars", select="pl_name")) == 3
+    assert len(session.calls) == 1
+
+    mirror.sync()
+    count = len(session.calls)
+    top = client.exoplanet.query(table="pscomppars", select="top 2 pl_name", order="disc_year desc")
+    assert top == [{"pl_name": "C b"}, {"pl_name": "B b"}]
+    assert client.exoplanet.query(table="pscomppars", select="pl_name,disc_year", where="disc_year < 2005",
+                                  format="csv") == "pl_name,disc_year\nA b,2001\n"
+    assert len(session.calls) == count
+
+    # Other tables and formats still go to the archive
+    client.exoplanet.query(table="ps", select="pl_name")
+    assert len(session.calls) == count + 1
+    with pytest.raises(NASAAPIError):
+        mirror.query(where="no_such_column = 1")
+    mirror.close()
+
+
+class FakeImageLibrary:
+    """Serves Image Library searches over items filed by year, 100 per page."""
+
+    def __init__(self, items_by_year):
+        self.items_by_year = items_by_year
+
+    def __call__(self, method, url, params, kwargs):
+        years = range(params["year_start"], params["year_end"] + 1)
+        hits = [item for year in years for item in self.items_by_year.get(year, [])]
+        page = params.get("page", 1)
+        return FakeResponse(data={"collection": {
+            "items": hits[(page - 1) * 100:page * 100],
+            "metadata": {"total_hits": len(hits)},
+        }})
+
+
+def image_items(year, count):
+    return [{"data": [{"nasa_id": f"{year}-{i}"}]} for i in range(count)]
+
+
+def test_search_partitioned_splits_dense_year_ranges():
+    shared = {"data": [{"nasa_id": "shared"}]}
+    library = FakeImageLibrary({
+        2000: image_items(2000, 150),
+        2001: image_items(2001, 30) + [shared],
+        2002: [shared] + image_items(2002, 190),
+    })
+    client, session = make_client(library)
+    items = client.image_library.search_partitioned(q="apollo", year_start=2000, year_end=2003, max_hits=200)
+
+    # 2000-2003 has 372 hits and is split in two ranges of at most 200
+    requested = [(params["year_start"], params["year_end"], params["page"]) for _, _, params in session.calls]
+    assert requested[0] == (2000, 2003, 1)
+    assert sorted(requested[1:]) == [(2000, 2001, 1), (2000, 2001, 2), (2002, 2003, 1), (2002, 2003, 2)]
+
+    nasa_ids = [item["data"][0]["nasa_id"] for item in items]
+    assert len(nasa_ids) == len(set(nasa_ids)) == 150 + 30 + 190 + 1
+    assert nasa_ids[:2] == ["2000-0", "2000-1"] and nasa_ids[-1] == "2002-189"
+
+
+def test_search_partitioned_caps_a_single_dense_year():
+    client, session = make_client(FakeImageLibrary({2002: image_items(2002, 190)}))
+    items = client.image_library.search_partitioned(year_start=2002, year_end=2002, max_hits=100)
+    assert len(items) == 100
+    assert len(session.calls) == 1
+
+
+def rover_server(totals):
+    """Answer manifest and photo requests for a rover with totals[sol] photos per sol."""
+
+    def respond(method, url, params, kwargs):
+        if "/manifests/" in url:
+            return FakeResponse(data={"photo_manifest": {"photos": [
+                {"sol": sol, "total_photos": total} for sol, total in sorted(totals.items())
+            ]}})
+        sol, page = params["sol"], params["page"]
+        count = min(25, totals[sol] - (page - 1) * 25)
+        return FakeResponse(data={"photos": [{"id": f"{sol}-{page}-{i}"} for i in range(count)]})
+    return respond
+
+
+def test_crawl_mission_records_a_sol_once_the_consumer_moves_on(tmp_path):
+    totals = {1: 30, 2: 0, 3: 5}
+    client, session = make_client(rover_server(totals))
+    checkpoint_path = str(tmp_path / "curiosity.json")
+
+    crawl = client.mars_rover.crawl_mission("curiosity", checkpoint_path)
+    sol, photos = next(crawl)
+    assert (sol, len(photos)) == (1, 30)
+    crawl.close()
+
+    # Sol 1 was not finished by the consumer, so it is crawled again
+    crawl = client.mars_rover.crawl_mission("curiosity", checkpoint_path)
+    assert next(crawl)[0] == 1
+    assert next(crawl)[0] == 3
+    crawl.close()
+    with open(checkpoint_path) as f:
+        assert json.load(f)["sols"] == {"1": 30}
+
+    assert [sol for sol, _ in client.mars_rover.crawl_mission("curiosity", checkpoint_path)] == [3]
+    assert all(params.get("sol") != 2 for _, _, params in session.calls)
+
+
+def test_crawl_mission_recrawls_sols_whose_photo_count_grew(tmp_path):
+    totals = {1: 30, 3: 5}
+    client, session = make_client(rover_server(totals))
+    checkpoint_path = str(tmp_path / "curiosity.json")
+    assert [sol for sol, _ in client.mars_rover.crawl_mission("curiosity", checkpoint_path)] == [1, 3]
+    assert list(client.mars_rover.crawl_mission("curiosity", checkpoint_path)) == []
+
+    totals[3] = 27
+    count = len(session.calls)
+    crawled = list(client.mars_rover.crawl_mission("curiosity", checkpoint_path))
+    assert [(sol, len(photos)) for sol, photos in crawled] == [(3, 27)]
+    assert sorted(params["page"] for _, _, params in session.calls[count:] if "page" in params) == [1, 2]
+
+
+def test_iter_browse_resumes_from_the_page_cursor():
+    def respond(method, url, params, kwargs):
+        page = params["page"]
+        return FakeResponse(data={
+            "page": {"number": page, "total_pages": 4},
+            "near_earth_objects": [{"id": f"{page}-{i}"} for i in range(3)],
+        })
+
+    client, _ = make_client(respond)
+    it = client.asteroids.iter_browse(size=3)
+    seen = []
+    for neo in it:
+        seen.append(neo["id"])
+        if neo["id"] == "1-1":
+            break
+    assert it.total_pages == 4
+    # Page 1 was only partly consumed, so the cursor still points at it
+    assert it.page == 1
+    it.close()
+
+    resumed = client.asteroids.iter_browse(start_page=it.page, size=3)
+    rest = [neo["id"] for neo in resumed]
+    assert rest[:3] == ["1-0", "1-1", "1-2"]
+    assert seen[:3] + rest == [f"{page}-{i}" for page in range(4) for i in range(3)]
+    assert resumed.page == 4
+
+
+def image_search_server(pages, fail_page=None):
+    """Answer an Image Library search with pages linked by "next" links, up to pages (None: endless)."""
+
+    def respond(method, url, params, kwargs):
+        page = int(url.rsplit("page=", 1)[1]) if "page=" in url else params.get("page", 1)
+        if page == fail_page:
+            return FakeResponse(500, content=b"Internal Server Error")
+        links = []
+        if pages is None or page < pages:
+            links.append({"rel": "next", "href": f"https://images-api.nasa.gov/search?q=moon&page={page + 1}"})
+        return FakeResponse(data={"collection": {
+            "items": [{"data": [{"nasa_id": f"{page}-{i}"}]} for i in range(2)],
+            "links": links,
+        }})
+    return respond
+
+
+def test_iter_search_follows_next_links():
+    client, session = make_client(image_search_server(3))
+    items = list(client.image_library.iter_search(q="moon"))
+    assert [item["data"][0]["nasa_id"] for item in items] == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert [url for _, url, _ in session.calls[1:]] == [
+        "https://images-api.nasa.gov/search?q=moon&page=2",
+        "https://images-api.nasa.gov/search?q=moon&page=3",
+    ]
+
+
+def test_iter_search_raises_page_errors_in_the_consumer():
+    client, _ = make_client(image_search_server(3, fail_page=2))
+    items = client.image_library.iter_search(q="moon")
+    assert [next(items)["data"][0]["nasa_id"] for _ in range(2)] == ["1-0", "1-1"]
+    with pytest.raises(NASAAPIError):
+        next(items)
+
+
+def test_iter_search_stops_fetching_when_closed():
+    client, session = make_client(image_search_server(None))
+    items = client.image_library.iter_search(q="moon", prefetch=2)
+    next(items)
+    items.close()
+    time.sleep(0.3)
+    count = len(session.calls)
+    # The page being consumed, two buffered pages and one waiting to be put
+    assert count <= 4
+    time.sleep(0.3)
+    assert len(session.calls) == count
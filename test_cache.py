@@ -0,0 +1,163 @@
+"""
+Tests for the response cache and persistent store of the NASA Universal API Tool.
+"""
+
+from nasa_api_tool import ResponseCache, ResponseStore, cache as cache_module
+from test_api_modules import FakeResponse, make_client
+
+
+APOD_URL = "https://api.nasa.gov/planetary/apod"
+
+
+def fake_clock(monkeypatch, start=1000.0):
+    clock = [start]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_make_key_ignores_api_key_and_parameter_order():
+    key = ResponseCache.make_key(APOD_URL, {"date": "2023-01-01", "thumbs": True, "api_key": "A"})
+    assert key == ResponseCache.make_key(APOD_URL, {"thumbs": "True", "api_key": "B", "date": "2023-01-01"})
+    assert key == (APOD_URL, (("date", "2023-01-01"), ("thumbs", "True")))
+    assert key != ResponseCache.make_key(APOD_URL, {"date": "2023-01-02"})
+
+
+def test_evicts_least_recently_used_entry_first():
+    cache = ResponseCache(max_entries=2)
+    cache.set(("a", ()), "A", 1)
+    cache.set(("b", ()), "B", 1)
+    assert cache.get(("a", ())) == (True, "A")
+    cache.set(("c", ()), "C", 1)
+    assert cache.get(("b", ())) == (False, None)
+    assert cache.get(("a", ())) == (True, "A")
+    assert cache.get(("c", ())) == (True, "C")
+    assert cache.stats() == {"hits": 3, "misses": 1, "evictions": 1, "entries": 2, "bytes": 2}
+
+
+def test_bounds_total_body_size():
+    cache = ResponseCache(max_bytes=10)
+    cache.set(("a", ()), "A", 4)
+    cache.set(("b", ()), "B", 4)
+    cache.set(("c", ()), "C", 4)
+    assert len(cache) == 2
+    assert cache.get(("a", ()))[0] is False
+    assert cache.stats()["bytes"] == 8
+
+    # A body larger than the whole cache is never stored
+    cache.set(("d", ()), "D", 11)
+    assert cache.get(("d", ()))[0] is False
+    assert len(cache) == 2
+
+    # Replacing an entry releases its old size
+    cache.set(("b", ()), "B2", 2)
+    assert cache.stats()["bytes"] == 6
+
+
+def test_longest_ttl_prefix_wins(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    cache = ResponseCache(default_ttl=100, ttls={
+        "https://api.nasa.gov/": 10,
+        "https://api.nasa.gov/EPIC/": 1000,
+        "https://api.nasa.gov/DONKI/": 0,
+    })
+    assert cache.ttl_for(APOD_URL) == 10
+    assert cache.ttl_for("https://api.nasa.gov/EPIC/api/natural") == 1000
+    assert cache.ttl_for("https://images-api.nasa.gov/search") == 100
+
+    cache.set((APOD_URL, ()), "apod", 1)
+    cache.set(("https://api.nasa.gov/EPIC/api/natural", ()), "epic", 1)
+    cache.set(("https://api.nasa.gov/DONKI/CME", ()), "cme", 1)
+    assert len(cache) == 2
+
+    clock[0] += 11
+    assert cache.get((APOD_URL, ())) == (False, None)
+    assert cache.get(("https://api.nasa.gov/EPIC/api/natural", ())) == (True, "epic")
+
+    cache.set_ttl("https://api.nasa.gov/EPIC/", 5)
+    assert cache.ttl_for("https://api.nasa.gov/EPIC/api/natural") == 5
+
+
+def test_stale_entries_are_kept_only_with_validators(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    cache = ResponseCache(default_ttl=10)
+    cache.set(("plain", ()), "P", 1)
+    cache.set(("tagged", ()), "T", 1, etag='"v1"')
+    clock[0] += 11
+
+    assert cache.get(("plain", ())) == (False, None)
+    assert cache.get_stale(("plain", ())) is None
+    assert len(cache) == 1
+
+    assert cache.get(("tagged", ())) == (False, None)
+    stale = cache.get_stale(("tagged", ()))
+    assert stale.value == "T" and stale.etag == '"v1"'
+
+
+def test_client_shares_entries_across_api_keys():
+    def respond(method, url, params, kwargs):
+        return FakeResponse(data={"date": params["date"], "key": params["api_key"]})
+
+    cache = ResponseCache()
+    first, first_session = make_client(respond, api_key="KEY-A", cache=cache)
+    second, second_session = make_client(respond, api_key="KEY-B", cache=cache)
+
+    assert first.apod.get_astronomy_picture(date="2023-01-01")["key"] == "KEY-A"
+    assert second.apod.get_astronomy_picture(date="2023-01-01")["key"] == "KEY-A"
+    assert second.apod.get_astronomy_picture(date="2023-01-02")["key"] == "KEY-B"
+    assert len(first_session.calls) == 1
+    assert len(second_session.calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_store_survives_a_new_client(tmp_path):
+    path = str(tmp_path / "responses.db")
+
+    def respond(method, url, params, kwargs):
+        return FakeResponse(data={"date": params["date"]})
+
+    first, first_session = make_client(respond, store=ResponseStore(path))
+    assert first.apod.get_astronomy_picture(date="2023-01-01") == {"date": "2023-01-01"}
+    first.request_handler.store.close()
+
+    # The stored response is decoded once and promoted to the memory cache
+    cache = ResponseCache()
+    second, second_session = make_client(respond, store=ResponseStore(path), cache=cache)
+    assert second.apod.get_astronomy_picture(date="2023-01-01") == {"date": "2023-01-01"}
+    assert second.apod.get_astronomy_picture(date="2023-01-01") == {"date": "2023-01-01"}
+    assert len(first_session.calls) == 1
+    assert second_session.calls == []
+    assert len(second.request_handler.store) == 1
+    assert cache.stats()["hits"] == 1 and len(cache) == 1
+
+
+def test_stale_stored_response_is_revalidated(tmp_path, monkeypatch):
+    clock = [1000000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: clock[0])
+    store = ResponseStore(str(tmp_path / "responses.db"), default_ttl=60)
+    sent_headers = []
+    touched = []
+    touch = store.touch
+    monkeypatch.setattr(store, "touch", lambda key, ttl=None: (touched.append(key), touch(key, ttl)))
+
+    def respond(method, url, params, kwargs):
+        sent_headers.append(kwargs.get("headers"))
+        if kwargs.get("headers"):
+            return FakeResponse(304, content=b"")
+        return FakeResponse(data={"title": "Original"}, headers={
+            "ETag": '"v1"', "Last-Modified": "Sun, 01 Jan 2023 00:00:00 GMT",
+        })
+
+    client, session = make_client(respond, store=store)
+    assert client.apod.get_astronomy_picture(date="2023-01-01") == {"title": "Original"}
+    assert sent_headers == [None]
+
+    clock[0] += 61
+    assert client.apod.get_astronomy_picture(date="2023-01-01") == {"title": "Original"}
+    assert sent_headers[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Sun, 01 Jan 2023 00:00:00 GMT"}
+    assert len(touched) == 1
+    key = touched[0]
+    assert store.load(key).expires_at == clock[0] + 60
+
+    # The refreshed entry is fresh again and needs no request
+    assert client.apod.get_astronomy_picture(date="2023-01-01") == {"title": "Original"}
+    assert len(session.calls) == 2
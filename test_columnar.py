@@ -0,0 +1,172 @@
+"""
+Tests for the columnar table decoder of the NASA Universal API Tool.
+"""
+
+import math
+
+import pytest
+
+from nasa_api_tool import NASAAPIError
+from nasa_api_tool.columnar import decode_table, iter_text_lines
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+CSV = (
+    "pl_name,disc_year,pl_rade,pl_orbper,default_flag,note\n"
+    "Kepler-1 b,2006,14.1,2.47,1,\n"
+    "Kepler-2 b,2009,,4,0,hot\n"
+    "Kepler-3 b,,1.5,5.5e1,1,\"a, b\"\n"
+).encode("utf-8")
+
+
+def test_iter_text_lines_splits_multibyte_characters_across_chunks():
+    data = "Kepler-1 b\nCoRoT-7 bé\nlast".encode("utf-8")
+    for size in range(1, 8):
+        assert list(iter_text_lines(chunked(data, size))) == ["Kepler-1 b\n", "CoRoT-7 bé\n", "last"]
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_decode_csv_infers_and_promotes_kinds(size):
+    table = decode_table(chunked(CSV, size), "csv")
+    assert table.names == ["pl_name", "disc_year", "pl_rade", "pl_orbper", "default_flag", "note"]
+    assert table.kinds == {
+        "pl_name": "str",
+        # A missing value turns an int column into a float column
+        "disc_year": "float",
+        "pl_rade": "float",
+        # Ints followed by a float are promoted to float
+        "pl_orbper": "float",
+        "default_flag": "int",
+        "note": "str",
+    }
+    assert len(table) == 3
+    assert list(table["disc_year"][:2]) == [2006.0, 2009.0]
+    assert math.isnan(table["disc_year"][2])
+    assert math.isnan(table["pl_rade"][1])
+    assert list(table["pl_orbper"]) == [2.47, 4.0, 55.0]
+    assert table["pl_orbper"].typecode == "d"
+    assert table["default_flag"].typecode == "q"
+    assert list(table["note"]) == ["", "hot", "a, b"]
+
+
+def test_decode_csv_promotes_numbers_to_strings():
+    table = decode_table([b"id,year\n1,2006\n2.5,\nabc,unknown\n3,2010\n"], "csv")
+    assert table.kinds == {"id": "str", "year": "str"}
+    assert list(table["id"]) == ["1", "2.5", "abc", "3"]
+    assert list(table["year"]) == ["2006", "", "unknown", "2010"]
+
+
+def test_decode_csv_with_explicit_kinds():
+    table = decode_table([b"name,flag,year\nx,true,2001\ny,F,2002\n"], "csv", kinds={"flag": "bool", "year": "str"})
+    assert table.kinds == {"name": "str", "flag": "bool", "year": "str"}
+    assert list(table["flag"]) == [True, False]
+    assert list(table["year"]) == ["2001", "2002"]
+
+
+def test_decode_csv_rejects_values_that_do_not_fit_an_explicit_kind():
+    with pytest.raises(NASAAPIError):
+        decode_table([b"year\n2001\nlate\n"], "csv", kinds={"year": "int"})
+
+
+def test_decode_csv_rejects_malformed_rows():
+    with pytest.raises(NASAAPIError):
+        decode_table([b"a,b\n1,2\n3\n"], "csv")
+
+
+def test_decode_tsv():
+    table = decode_table([b"pl_name\tpl_rade\nA b\t1.5\nB, c\t\n"], "tsv")
+    assert table.kinds == {"pl_name": "str", "pl_rade": "float"}
+    assert list(table["pl_name"]) == ["A b", "B, c"]
+    assert table["pl_rade"][0] == 1.5 and math.isnan(table["pl_rade"][1])
+
+
+def test_decode_empty_result():
+    table = decode_table([b"pl_name,pl_rade\n"], "csv")
+    assert len(table) == 0
+    assert table.to_dicts() == []
+
+
+VOTABLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<VOTABLE version="1.3" xmlns="http://www.ivoa.net/xml/VOTable/v1.3">
+<RESOURCE type="results">
+<INFO name="QUERY_STATUS" value="OK"/>
+<TABLE>
+<FIELD name="pl_name" datatype="char" arraysize="*"/>
+<FIELD name="disc_year" datatype="int"/>
+<FIELD name="pl_rade" datatype="double"/>
+<FIELD name="confirmed" datatype="boolean"/>
+<FIELD name="ra_dec" datatype="double" arraysize="2"/>
+<DATA>
+<TABLEDATA>
+<TR><TD>Kepler-1 b</TD><TD>2006</TD><TD>14.1</TD><TD>T</TD><TD>1 2</TD></TR>
+<TR><TD>Kepler-2 b</TD><TD>2009</TD><TD></TD><TD>false</TD><TD>3 4</TD></TR>
+<TR><TD>Kepler-3 b</TD><TD/><TD>1.5</TD><TD>1</TD><TD/></TR>
+</TABLEDATA>
+</DATA>
+</TABLE>
+</RESOURCE>
+</VOTABLE>
+"""
+
+
+@pytest.mark.parametrize("size", [1, 50, 65536])
+def test_decode_votable_uses_declared_kinds(size):
+    table = decode_table(chunked(VOTABLE, size), "votable")
+    assert table.names == ["pl_name", "disc_year", "pl_rade", "confirmed", "ra_dec"]
+    assert table.kinds == {
+        "pl_name": "str",
+        # The missing year turns the declared int column into floats
+        "disc_year": "float",
+        "pl_rade": "float",
+        "confirmed": "bool",
+        # Array-valued fields are kept as strings
+        "ra_dec": "str",
+    }
+    assert list(table["pl_name"]) == ["Kepler-1 b", "Kepler-2 b", "Kepler-3 b"]
+    assert list(table["disc_year"][:2]) == [2006.0, 2009.0] and math.isnan(table["disc_year"][2])
+    assert math.isnan(table["pl_rade"][1])
+    assert list(table["confirmed"]) == [True, False, True]
+    assert list(table["ra_dec"]) == ["1 2", "3 4", ""]
+
+
+def test_decode_votable_reports_query_errors():
+    error = (b'<VOTABLE><RESOURCE type="results"><INFO name="QUERY_STATUS" value="ERROR">'
+             b'column foo does not exist</INFO></RESOURCE></VOTABLE>')
+    with pytest.raises(NASAAPIError, match="column foo does not exist"):
+        decode_table([error], "votable")
+
+
+def test_decode_votable_rejects_binary_serialization():
+    binary = (b'<VOTABLE><RESOURCE><TABLE><FIELD name="a" datatype="int"/>'
+              b'<DATA><BINARY><STREAM encoding="base64">AAAA</STREAM></BINARY></DATA></TABLE></RESOURCE></VOTABLE>')
+    with pytest.raises(NASAAPIError, match="BINARY"):
+        decode_table([binary], "votable")
+
+
+def test_decode_votable_rejects_malformed_xml():
+    with pytest.raises(NASAAPIError):
+        decode_table([b"<VOTABLE><TABLE>"], "votable")
+
+
+def test_decode_table_rejects_unknown_formats():
+    with pytest.raises(ValueError):
+        decode_table([b""], "json")
+
+
+def test_to_dicts_and_iteration():
+    table = decode_table([b"a,b\n1,x\n2,y\n"], "csv")
+    assert list(table) == [(1, "x"), (2, "y")]
+    assert table.to_dicts() == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    table = decode_table(chunked(VOTABLE, 64), "votable")
+    array = table.to_numpy()
+    assert array.dtype.names == tuple(table.names)
+    assert array["pl_name"].tolist() == ["Kepler-1 b", "Kepler-2 b", "Kepler-3 b"]
+    assert array["confirmed"].tolist() == [True, False, True]
+    assert numpy.isnan(array["pl_rade"][1])
@@ -0,0 +1,64 @@
+"""
+Tests for the concurrency helpers of the NASA Universal API Tool.
+"""
+
+import threading
+import time
+
+import pytest
+
+from nasa_api_tool.concurrency import background_iter, prefetch_ordered
+
+
+def producer_threads(before):
+    return [thread for thread in threading.enumerate() if thread not in before]
+
+
+def test_background_iter_yields_items_in_order():
+    assert list(background_iter(iter(range(10)), maxsize=3)) == list(range(10))
+    assert list(background_iter([])) == []
+
+
+def test_background_iter_reraises_producer_errors_in_the_consumer():
+    def pages():
+        yield 1
+        yield 2
+        raise ValueError("page 3 failed")
+
+    items = background_iter(pages())
+    assert next(items) == 1
+    assert next(items) == 2
+    with pytest.raises(ValueError, match="page 3 failed"):
+        next(items)
+
+
+def test_background_iter_stays_bounded_and_stops_when_closed():
+    produced = []
+
+    def pages():
+        while True:
+            produced.append(len(produced))
+            yield produced[-1]
+
+    before = set(threading.enumerate())
+    items = background_iter(pages(), maxsize=2)
+    assert next(items) == 0
+    time.sleep(0.2)
+    # One item consumed, two buffered and one waiting to be put
+    assert len(produced) <= 4
+
+    items.close()
+    for thread in producer_threads(before):
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+    count = len(produced)
+    time.sleep(0.2)
+    assert len(produced) == count
+
+
+def test_prefetch_ordered_yields_in_key_order():
+    def slow_square(key):
+        time.sleep(0.01 * (5 - key))
+        return key * key
+
+    assert list(prefetch_ordered(slow_square, range(5), depth=3)) == [(key, key * key) for key in range(5)]
@@ -0,0 +1,230 @@
+"""
+Tests for the date range cache of the NASA Universal API Tool.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+from nasa_api_tool import range_cache
+from nasa_api_tool.range_cache import IntervalSet, RangeCache, parse_day
+
+
+def make_set(*intervals):
+    intervals_set = IntervalSet()
+    for start, end in intervals:
+        intervals_set.add(start, end)
+    return intervals_set
+
+
+def test_interval_set_merges_overlapping_and_adjacent_intervals():
+    intervals = make_set((10, 12), (20, 25), (13, 14), (24, 30), (1, 3))
+    assert list(intervals) == [(1, 3), (10, 14), (20, 30)]
+
+    intervals.add(4, 19)
+    assert list(intervals) == [(1, 30)]
+    assert len(intervals) == 1
+
+
+def test_interval_set_ignores_empty_intervals():
+    intervals = make_set((5, 4))
+    assert list(intervals) == []
+
+
+def test_interval_set_remove_trims_and_splits():
+    intervals = make_set((1, 10), (20, 30))
+    intervals.remove(5, 6)
+    assert list(intervals) == [(1, 4), (7, 10), (20, 30)]
+    intervals.remove(9, 25)
+    assert list(intervals) == [(1, 4), (7, 8), (26, 30)]
+    intervals.remove(11, 19)
+    assert list(intervals) == [(1, 4), (7, 8), (26, 30)]
+    intervals.remove(0, 40)
+    assert list(intervals) == []
+
+
+def test_interval_set_gaps():
+    intervals = make_set((10, 14), (20, 30))
+    assert intervals.gaps(0, 40) == [(0, 9), (15, 19), (31, 40)]
+    assert intervals.gaps(12, 22) == [(15, 19)]
+    assert intervals.gaps(15, 19) == [(15, 19)]
+    assert intervals.gaps(20, 30) == []
+    assert intervals.gaps(31, 35) == [(31, 35)]
+    assert IntervalSet().gaps(1, 2) == [(1, 2)]
+
+
+def test_interval_set_covers():
+    intervals = make_set((10, 14), (15, 20))
+    assert intervals.covers(10, 20)
+    assert intervals.covers(12, 12)
+    assert not intervals.covers(9, 12)
+    assert not intervals.covers(18, 21)
+
+
+def test_interval_set_matches_a_plain_set():
+    rng = random.Random(1234)
+    for _ in range(200):
+        intervals = IntervalSet()
+        members = set()
+        for _ in range(rng.randint(0, 8)):
+            start = rng.randint(0, 60)
+            end = start + rng.randint(-1, 10)
+            if rng.random() < 0.3:
+                intervals.remove(start, end)
+                members.difference_update(range(start, end + 1))
+            else:
+                intervals.add(start, end)
+                members.update(range(start, end + 1))
+        ranges = list(intervals)
+        # Stored intervals are sorted, disjoint and never adjacent
+        assert all(a_end + 1 < b_start for (_, a_end), (b_start, _) in zip(ranges, ranges[1:]))
+        assert set(i for start, end in ranges for i in range(start, end + 1)) == members
+
+        start = rng.randint(-5, 70)
+        end = start + rng.randint(0, 20)
+        gaps = intervals.gaps(start, end)
+        assert set(i for gap_start, gap_end in gaps for i in range(gap_start, gap_end + 1)) == \
+            set(range(start, end + 1)) - members
+        assert intervals.covers(start, end) == (set(range(start, end + 1)) <= members)
+
+
+class Fetcher:
+    """Serves one record per day and records the gaps it was asked for."""
+
+    def __init__(self, skip=()):
+        self.skip = set(skip)
+        self.calls = []
+
+    def __call__(self, start, end):
+        self.calls.append((start.isoformat(), end.isoformat()))
+        pairs = []
+        day = start
+        while day <= end:
+            if day.isoformat() not in self.skip:
+                pairs.append((day.isoformat() + "T12:00", {"day": day.isoformat()}))
+            day += timedelta(days=1)
+        return pairs, {"calls": len(self.calls)}
+
+
+def days(records):
+    return [record["day"] for record in records]
+
+
+def test_range_cache_fetches_only_missing_days():
+    cache = RangeCache()
+    fetch = Fetcher()
+    records, meta = cache.get_range("key", date(2020, 1, 5), date(2020, 1, 7), fetch)
+    assert days(records) == ["2020-01-05", "2020-01-06", "2020-01-07"]
+    assert meta == {"calls": 1}
+
+    records, meta = cache.get_range("key", date(2020, 1, 1), date(2020, 1, 10), fetch)
+    assert fetch.calls[1:] == [("2020-01-01", "2020-01-04"), ("2020-01-08", "2020-01-10")]
+    assert days(records) == ["2020-01-%02d" % day for day in range(1, 11)]
+    assert meta == {"calls": 3}
+
+    records, _ = cache.get_range("key", date(2020, 1, 2), date(2020, 1, 9), fetch)
+    assert len(fetch.calls) == 3
+    assert days(records) == ["2020-01-%02d" % day for day in range(2, 10)]
+    assert cache.coverage("key") == [("2020-01-01", "2020-01-10")]
+    assert cache.stats() == {"hits": 1, "misses": 2, "fetched_days": 10, "served_days": 11, "series": 1}
+
+
+def test_range_cache_covers_days_without_records():
+    cache = RangeCache()
+    fetch = Fetcher(skip=["2020-01-02"])
+    cache.get_range("key", date(2020, 1, 1), date(2020, 1, 3), fetch)
+    records, _ = cache.get_range("key", date(2020, 1, 1), date(2020, 1, 3), fetch)
+    assert len(fetch.calls) == 1
+    assert days(records) == ["2020-01-01", "2020-01-03"]
+
+
+def test_range_cache_files_undated_records_on_the_first_day():
+    cache = RangeCache()
+    calls = []
+
+    def fetch(start, end):
+        calls.append(start)
+        return [("2020-01-02", {"day": "2020-01-02"}), ("", {"day": None})], None
+
+    for _ in range(2):
+        records, meta = cache.get_range("key", date(2020, 1, 1), date(2020, 1, 2), fetch)
+        assert days(records) == [None, "2020-01-02"]
+        assert meta is None
+    assert len(calls) == 1
+
+
+def test_range_cache_returns_but_does_not_cache_records_outside_the_gap():
+    cache = RangeCache()
+    calls = []
+
+    def fetch(start, end):
+        calls.append(start)
+        return [("2019-12-31", {"day": "2019-12-31"}), ("2020-01-01", {"day": "2020-01-01"})], None
+
+    for _ in range(2):
+        records, _ = cache.get_range("key", date(2020, 1, 1), date(2020, 1, 1), fetch)
+        assert days(records) == ["2019-12-31", "2020-01-01"]
+    assert len(calls) == 2
+    assert cache.coverage("key") == []
+
+
+def test_range_cache_refetches_unsettled_days():
+    cache = RangeCache(settle_days=2)
+    fetch = Fetcher()
+    today = datetime.utcnow().date()
+    start = today - timedelta(days=3)
+    cache.get_range("key", start, today, fetch)
+    records, _ = cache.get_range("key", start, today, fetch)
+    assert fetch.calls[1] == ((today - timedelta(days=1)).isoformat(), today.isoformat())
+    assert len(records) == 4
+    assert cache.coverage("key") == [(start.isoformat(), (today - timedelta(days=2)).isoformat())]
+
+
+def test_range_cache_keeps_series_apart_and_evicts_least_recently_used():
+    cache = RangeCache(max_series=2)
+    fetch = Fetcher()
+    day = date(2020, 1, 1)
+    for key in ("a", "b", "a", "c"):
+        cache.get_range(key, day, day, fetch)
+    assert len(fetch.calls) == 3
+    assert cache.coverage("b") == []
+    assert cache.coverage("a") == [("2020-01-01", "2020-01-01")]
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_range_cache_refetches_days_older_than_max_age(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(range_cache.time, "monotonic", lambda: clock[0])
+    cache = RangeCache(max_age=60)
+    fetch = Fetcher()
+    cache.get_range("key", date(2020, 1, 1), date(2020, 1, 3), fetch)
+    clock[0] += 30
+    cache.get_range("key", date(2020, 1, 3), date(2020, 1, 5), fetch)
+    assert fetch.calls == [("2020-01-01", "2020-01-03"), ("2020-01-04", "2020-01-05")]
+
+    # Days 1-3 are now past max_age; days 4-5 are not
+    clock[0] += 40
+    records, _ = cache.get_range("key", date(2020, 1, 1), date(2020, 1, 5), fetch)
+    assert fetch.calls[2:] == [("2020-01-01", "2020-01-03")]
+    assert days(records) == ["2020-01-%02d" % day for day in range(1, 6)]
+    assert cache.coverage("key") == [("2020-01-01", "2020-01-05")]
+
+
+def test_range_cache_without_max_age_keeps_days(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(range_cache.time, "monotonic", lambda: clock[0])
+    cache = RangeCache(max_age=None)
+    fetch = Fetcher()
+    cache.get_range("key", date(2020, 1, 1), date(2020, 1, 1), fetch)
+    clock[0] += 10 ** 9
+    cache.get_range("key", date(2020, 1, 1), date(2020, 1, 1), fetch)
+    assert len(fetch.calls) == 1
+
+
+def test_parse_day():
+    assert parse_day("2020-02-29") == date(2020, 2, 29)
+    assert parse_day("2020-02-30") is None
+    assert parse_day("+60") is None
+    assert parse_day(None) is None
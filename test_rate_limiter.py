@@ -0,0 +1,100 @@
+"""
+Tests for the client-side rate limiter of the NASA Universal API Tool.
+"""
+
+import pytest
+
+from nasa_api_tool import NASAAPIError, RateLimit, RateLimiter, rate_limiter
+from test_api_modules import FakeResponse, make_client
+
+
+APOD_URL = "https://api.nasa.gov/planetary/apod"
+IMAGES_URL = "https://images-api.nasa.gov/search"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_demo_key_uses_the_demo_limit(clock):
+    limiter = RateLimiter()
+    limiter.reserve(APOD_URL, "DEMO_KEY")
+    limiter.reserve(APOD_URL, "MY-KEY-1234")
+    assert limiter.stats()["buckets"] == {
+        "api.nasa.gov (..._KEY)": 29.0,
+        "api.nasa.gov (...1234)": 999.0,
+    }
+
+
+def test_configured_limit_applies_to_demo_key(clock):
+    limiter = RateLimiter(limits={"api.nasa.gov": RateLimit(5000, 3600, per_key=True)})
+    limiter.reserve(APOD_URL, "DEMO_KEY")
+    assert limiter.stats()["buckets"] == {"api.nasa.gov (..._KEY)": 4999.0}
+
+
+def test_remaining_header_lowers_the_tokens(clock):
+    limiter = RateLimiter()
+    limiter.update(APOD_URL, "MY-KEY-1234", {"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "2"})
+    assert limiter.stats()["buckets"] == {"api.nasa.gov (...1234)": 2.0}
+    assert limiter.reserve(APOD_URL, "MY-KEY-1234") == 0
+    assert limiter.reserve(APOD_URL, "MY-KEY-1234") == 0
+    # The bucket refills at 1000 requests per hour
+    assert limiter.reserve(APOD_URL, "MY-KEY-1234") == pytest.approx(3.6)
+    assert limiter.throttled == 1
+
+    # A higher remaining count never adds tokens
+    limiter.update(APOD_URL, "MY-KEY-1234", {"X-RateLimit-Remaining": "500"})
+    assert limiter.stats()["buckets"] == {"api.nasa.gov (...1234)": -1.0}
+
+
+def test_too_many_requests_empties_the_bucket(clock):
+    limiter = RateLimiter()
+    limiter.update(IMAGES_URL, "MY-KEY-1234", {}, status_code=429)
+    assert limiter.stats()["buckets"] == {"images-api.nasa.gov": 0.0}
+    assert limiter.reserve(IMAGES_URL, "MY-KEY-1234") == pytest.approx(0.1)
+
+    clock[0] += 1
+    assert limiter.reserve(IMAGES_URL, "MY-KEY-1234") == 0
+
+
+def test_buckets_are_kept_per_host_and_per_key(clock):
+    limiter = RateLimiter(limits={"api.nasa.gov": RateLimit(1, 60, per_key=True), "example.com": None})
+    assert limiter.reserve(APOD_URL, "KEY-A") == 0
+    assert limiter.reserve(APOD_URL, "KEY-B") == 0
+    assert limiter.reserve(APOD_URL, "KEY-A") == pytest.approx(60)
+
+    # images-api.nasa.gov is limited per host, whatever the key
+    assert limiter.reserve(IMAGES_URL, "KEY-A") == 0
+    limiter.reserve(IMAGES_URL, "KEY-B")
+    assert limiter.reserve("https://example.com/data", "KEY-A") == 0
+    assert limiter.stats()["buckets"] == {
+        "api.nasa.gov (...EY-A)": -1.0,
+        "api.nasa.gov (...EY-B)": 0.0,
+        "images-api.nasa.gov": 8.0,
+    }
+
+
+def test_max_wait_refuses_without_reserving(clock):
+    limiter = RateLimiter(limits={"api.nasa.gov": RateLimit(1, 60, per_key=True)}, max_wait=10)
+    limiter.reserve(APOD_URL, "KEY-A")
+    with pytest.raises(NASAAPIError):
+        limiter.reserve(APOD_URL, "KEY-A")
+    assert limiter.stats()["buckets"] == {"api.nasa.gov (...EY-A)": 0.0}
+
+
+def test_client_throttles_from_response_headers(clock, monkeypatch):
+    waits = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", waits.append)
+
+    def respond(method, url, params, kwargs):
+        return FakeResponse(data={"date": params["date"]}, headers={
+            "X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "0",
+        })
+
+    client, _ = make_client(respond, api_key="MY-KEY-1234", rate_limiter=RateLimiter())
+    client.apod.get_astronomy_picture(date="2023-01-01")
+    client.apod.get_astronomy_picture(date="2023-01-02")
+    assert waits == [pytest.approx(3.6)]
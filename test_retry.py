@@ -0,0 +1,109 @@
+"""
+Tests for the retry policy of the NASA Universal API Tool.
+"""
+
+import pytest
+import requests
+
+from nasa_api_tool import NASAAPIError, RetryPolicy
+from test_api_modules import FakeResponse, make_client
+
+
+APOD_URL = "https://api.nasa.gov/planetary/apod"
+ENDPOINT_STATS = {"requests": 0, "retries": 0, "giveups": 0, "budget_exhausted": 0}
+
+
+def counts(**changes):
+    expected = dict(ENDPOINT_STATS)
+    expected.update(changes)
+    return expected
+
+
+def test_retry_after_is_honoured_up_to_the_cap():
+    policy = RetryPolicy(backoff_base=0, max_retry_after=120)
+    assert policy.next_delay(APOD_URL, "GET", 0, status_code=503, retry_after="5") == 5
+    assert policy.next_delay(APOD_URL, "GET", 0, status_code=503, retry_after="300") is None
+    assert policy.stats()[APOD_URL] == counts(retries=1, giveups=1)
+
+
+def test_parse_retry_after():
+    assert RetryPolicy.parse_retry_after("7") == 7.0
+    assert RetryPolicy.parse_retry_after("-3") == 0.0
+    assert RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert RetryPolicy.parse_retry_after("soon") is None
+    assert RetryPolicy.parse_retry_after(None) is None
+
+
+def test_classifies_failures():
+    policy = RetryPolicy()
+    assert policy.is_retryable("GET", 503)
+    assert not policy.is_retryable("GET", 404)
+    assert not policy.is_retryable("GET", 400)
+    # A POST is only repeated when the server cannot have processed it
+    assert policy.is_retryable("POST", 429)
+    assert policy.is_retryable("POST", 503)
+    assert not policy.is_retryable("POST", 500)
+    assert not policy.is_retryable("POST", None, sent=True)
+    assert policy.is_retryable("POST", None, sent=False)
+    assert policy.is_retryable("GET", None, sent=True)
+
+
+def test_client_error_is_not_retried():
+    def respond(method, url, params, kwargs):
+        return FakeResponse(404, content=b"Not Found")
+
+    policy = RetryPolicy(backoff_base=0)
+    client, session = make_client(respond, retry_policy=policy)
+    with pytest.raises(NASAAPIError):
+        client.apod.get_astronomy_picture(date="2023-01-01")
+    assert len(session.calls) == 1
+    assert policy.stats()[APOD_URL] == counts(requests=1)
+
+
+def test_post_is_not_retried_after_it_may_have_been_sent():
+    def respond(method, url, params, kwargs):
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    policy = RetryPolicy(backoff_base=0)
+    client, session = make_client(respond, retry_policy=policy)
+    with pytest.raises(NASAAPIError):
+        client.request_handler.send("POST", APOD_URL, data={"q": "1"})
+    assert len(session.calls) == 1
+
+    with pytest.raises(NASAAPIError):
+        client.request_handler.send("GET", APOD_URL)
+    assert len(session.calls) == 1 + 1 + policy.max_retries
+
+
+def test_transient_errors_are_retried_and_counted_once_per_request():
+    responses = [FakeResponse(503, content=b""), FakeResponse(502, content=b""), FakeResponse(data={"ok": True})]
+
+    def respond(method, url, params, kwargs):
+        return responses.pop(0)
+
+    policy = RetryPolicy(backoff_base=0)
+    client, session = make_client(respond, retry_policy=policy)
+    assert client.apod.get_astronomy_picture(date="2023-01-01") == {"ok": True}
+    assert len(session.calls) == 3
+    assert policy.stats()[APOD_URL] == counts(requests=1, retries=2)
+
+
+def test_budget_is_exhausted_and_not_refilled_by_retries():
+    def respond(method, url, params, kwargs):
+        return FakeResponse(503, content=b"")
+
+    policy = RetryPolicy(max_retries=5, backoff_base=0, budget_ratio=0.5, budget_min=1)
+    client, session = make_client(respond, retry_policy=policy)
+    with pytest.raises(NASAAPIError):
+        client.apod.get_astronomy_picture(date="2023-01-01")
+    # The request deposits 0.5 on top of the initial 1 token: one retry fits
+    assert len(session.calls) == 2
+    assert policy.stats()[APOD_URL] == counts(requests=1, retries=1, budget_exhausted=1)
+
+
+def test_budget_refused_retries_are_reported():
+    policy = RetryPolicy(backoff_base=0, budget_ratio=0, budget_min=2)
+    assert policy.next_delay(APOD_URL, "GET", 0, status_code=503) == 0
+    assert policy.next_delay(APOD_URL, "GET", 0, status_code=503) == 0
+    assert policy.next_delay(APOD_URL, "GET", 0, status_code=503) is None
+    assert policy.stats()[APOD_URL] == counts(retries=2, budget_exhausted=1)
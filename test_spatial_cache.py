@@ -0,0 +1,118 @@
+"""
+Tests for the spatial cache of the NASA Universal API Tool.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from nasa_api_tool import SpatialCache, spatial_cache
+from nasa_api_tool.spatial_cache import encode_geohash, geohash_bounds, geohash_center
+from test_api_modules import FakeResponse, make_client
+
+
+def test_encode_geohash_known_value():
+    assert encode_geohash(57.64911, 10.40744, precision=11) == "u4pruydqqvj"
+    assert encode_geohash(-90, -180, precision=3) == "000"
+    assert encode_geohash(90, 180, precision=3) == "zzz"
+
+
+def test_geohash_round_trips():
+    rng = random.Random(42)
+    for _ in range(500):
+        lat = rng.uniform(-90, 90)
+        lon = rng.uniform(-180, 180)
+        precision = rng.randint(1, 9)
+        geohash = encode_geohash(lat, lon, precision)
+        min_lat, min_lon, max_lat, max_lon = geohash_bounds(geohash)
+        assert min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+        # The center of a cell encodes to the same cell
+        assert encode_geohash(*geohash_center(geohash), precision=precision) == geohash
+
+
+def test_geohash_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        encode_geohash(91, 0)
+    with pytest.raises(ValueError):
+        encode_geohash(0, -181)
+    with pytest.raises(ValueError):
+        geohash_bounds("u4pa")
+
+
+def assets_server(method, url, params, kwargs):
+    return FakeResponse(data={"lat": params["lat"], "lon": params["lon"], "date": params.get("date")})
+
+
+def test_nearby_locations_share_one_request():
+    client, session = make_client(assets_server)
+    cache = client.earth.spatial_cache = SpatialCache(precision=7)
+    cell = cache.cell(29.78, -95.33)
+    min_lat, min_lon, max_lat, max_lon = geohash_bounds(cell)
+    center_lat, center_lon = geohash_center(cell)
+
+    first = client.earth.get_assets(min_lat + 1e-6, min_lon + 1e-6, date="2020-01-01")
+    second = client.earth.get_assets(max_lat - 1e-6, max_lon - 1e-6, date="2020-01-01")
+    assert first == second == {"lat": center_lat, "lon": center_lon, "date": "2020-01-01"}
+    assert len(session.calls) == 1
+
+    # A different date or a neighbouring cell is a separate request
+    client.earth.get_assets(center_lat, center_lon, date="2020-02-01")
+    client.earth.get_assets(max_lat + 1e-4, center_lon, date="2020-01-01")
+    assert len(session.calls) == 3
+    assert cache.covers(center_lat, center_lon, "2020-02-01", 0.025)
+    assert len(cache.coverage("2020-01-01", 0.025)) == 2
+    assert cache.stats() == {"hits": 1, "misses": 3, "evictions": 0, "entries": 3, "cells": 2}
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(spatial_cache.time, "monotonic", lambda: clock[0])
+    client, session = make_client(assets_server)
+    client.earth.spatial_cache = SpatialCache(ttl=60)
+
+    client.earth.get_assets(29.78, -95.33)
+    clock[0] += 59
+    client.earth.get_assets(29.78, -95.33)
+    assert len(session.calls) == 1
+    assert client.earth.spatial_cache.covers(29.78, -95.33, None, 0.025)
+
+    clock[0] += 1
+    assert not client.earth.spatial_cache.covers(29.78, -95.33, None, 0.025)
+    client.earth.get_assets(29.78, -95.33)
+    assert len(session.calls) == 2
+
+
+def test_evicts_least_recently_used_cell():
+    cache = SpatialCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert len(cache) == 2 and cache.evictions == 1
+
+
+def test_async_get_assets_uses_the_cache():
+    pytest.importorskip("aiohttp")
+    from nasa_api_tool import AsyncNASAClient
+
+    client = AsyncNASAClient()
+    calls = []
+
+    async def get(url, params=None):
+        calls.append(params)
+        return {"lat": params["lat"], "lon": params["lon"]}
+
+    client.request_handler.get = get
+    client.earth.spatial_cache = SpatialCache()
+
+    async def lookups():
+        first = await client.earth.get_assets(29.78, -95.33)
+        second = await client.earth.get_assets(29.78, -95.33)
+        return first, second
+
+    first, second = asyncio.run(lookups())
+    assert first == second
+    assert (first["lat"], first["lon"]) == geohash_center(client.earth.spatial_cache.cell(29.78, -95.33))
+    assert len(calls) == 1